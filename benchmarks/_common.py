@@ -0,0 +1,86 @@
+"""Shared helpers for the chessplot benchmarks"""
+
+import os
+import sys
+import timeit
+import argparse
+from typing import Callable, List
+
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+END_STATES = ["1-0", "0-1", "1/2-1/2", "*"]
+
+_DATA_DIRECTORY = os.path.join(REPOSITORY, "tests", "data")
+
+
+def argument_parser(description: str) -> argparse.ArgumentParser:
+    """
+    Create a parser for the arguments shared by every benchmark.
+
+    Args:
+        description (str): A description of the benchmark.
+
+    Returns:
+        (ArgumentParser): A parser with the --chessplot and --repeat arguments.
+    """
+
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--chessplot",
+        default=REPOSITORY,
+        help="a checkout whose chessplot package is measured, e.g. of the commit before a change (default this one)"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="the number of runs to take the best time of")
+    return parser
+
+
+def use_checkout(path: str) -> None:
+    """
+    Import chessplot from a given checkout.
+
+    Args:
+        path (str): A path to the root of a checkout of the repository.
+    """
+
+    sys.path.insert(0, os.path.abspath(path))
+    import chessplot
+    print(f"chessplot: {os.path.dirname(chessplot.__file__)}")
+    return
+
+
+def best_time(function: Callable[[], object], repeat: int) -> float:
+    """
+    Time a function several times.
+
+    Args:
+        function (Callable): The function to be timed.
+        repeat (int): The number of times to run the function.
+
+    Returns:
+        (float): The shortest time taken in seconds.
+    """
+
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def write_database(path: str, file_names: List[str], copies: int) -> str:
+    """
+    Write a database of the test games repeated a number of times.
+
+    Args:
+        path (str): A path to the .pgn file to be written.
+        file_names (list): The names of files in tests/data whose games are written in turn.
+        copies (int): The number of times every game is written.
+
+    Returns:
+        (str): The path of the database.
+    """
+
+    games = []
+    for file_name in file_names:
+        with open(os.path.join(_DATA_DIRECTORY, file_name), encoding="utf-8") as file:
+            games.append(file.read().strip() + "\n\n")
+    with open(path, "w", encoding="utf-8") as file:
+        for _ in range(copies):
+            file.writelines(games)
+    return path
@@ -0,0 +1,72 @@
+"""Benchmark the time the array engine takes to execute each type of move"""
+
+import os
+import tempfile
+from collections import defaultdict
+from time import perf_counter
+from _common import END_STATES, argument_parser, use_checkout, write_database
+
+
+_PIECE_NAMES = {"P": "pawn", "N": "knight", "B": "bishop", "R": "rook", "Q": "queen", "K": "king", "O-O": "castling"}
+_GAMES = ["fischer_spassky.pgn", "annotated.pgn", "disambiguation.pgn", "pinned.pgn", "special_moves.pgn"]
+
+
+def _time_moves(path: str) -> dict:
+    """
+    Replay every game of a database, timing each call to _Interpreter.execute_ply.
+
+    Games which the engine can't replay are counted up to the move which fails.
+
+    Args:
+        path (str): A path to the database.
+
+    Returns:
+        (dict): The total time in seconds and the number of moves executed, by piece type.
+    """
+
+    from chessplot.parser import _Parser
+    from chessplot.interpreter import _Interpreter, InterpreterError
+
+    timings = defaultdict(lambda: [0.0, 0])
+    for metadata, moves in _Parser.iter_games(file_path=path, end_states=END_STATES):
+        piece_positions, white_to_move, _ = _Parser.parse_fen(fen=metadata.fen)
+        interpreter = _Interpreter(piece_positions=piece_positions)
+        try:
+            for ply_string in (ply_string for pair in moves for ply_string in pair if ply_string not in END_STATES):
+                ply = _Parser.parse_ply_string(ply_string=ply_string)
+                piece = "O-O" if ply.castle_king_side or ply.castle_queen_side else ply.piece_rank
+                start = perf_counter()
+                interpreter.execute_ply(ply=ply, white_to_move=white_to_move)
+                timing = timings[piece]
+                timing[0] += perf_counter() - start
+                timing[1] += 1
+                white_to_move = not white_to_move
+        except InterpreterError:
+            continue
+    return timings
+
+
+def main() -> None:
+    parser = argument_parser(description=__doc__)
+    parser.add_argument("--pgn", help="a database to replay instead of the generated one")
+    parser.add_argument("--copies", type=int, default=200, help="the number of copies of each generated game")
+    args = parser.parse_args()
+    use_checkout(path=args.chessplot)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = args.pgn or write_database(
+            path=os.path.join(directory, "moves.pgn"), file_names=_GAMES, copies=args.copies
+        )
+        runs = [_time_moves(path=path) for _ in range(args.repeat)]
+
+    print("  mean execute_ply time, best of runs")
+    for piece, name in _PIECE_NAMES.items():
+        counts = {run[piece][1] for run in runs}
+        if counts != {0}:
+            mean = min(run[piece][0] / run[piece][1] for run in runs)
+            print(f"    {name:<9} {mean * 1e6:6.1f} us over {counts.pop()} moves")
+    return
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark the throughput of splitting a .pgn database into games and their ply"""
+
+import os
+import tempfile
+from _common import END_STATES, argument_parser, use_checkout, best_time, write_database
+
+
+_INPUTS = {
+    "plain": ["fischer_spassky.pgn", "disambiguation.pgn", "pinned.pgn"],
+    "annotated": ["annotated.pgn"],
+}
+_SHUFFLE = (("Nf3", "Nf6"), ("Ng1", "Ng8"))  # knight moves which return to the starting position
+
+
+def _write_long_game(path: str, moves: int) -> str:
+    """
+    Write a single long game with a comment, NAG and variation on every move.
+
+    Args:
+        path (str): A path to the .pgn file to be written.
+        moves (int): The number of moves of the game.
+
+    Returns:
+        (str): The path of the game.
+    """
+
+    with open(path, "w", encoding="utf-8") as file:
+        file.write('[Event "Long"]\n[Result "*"]\n\n')
+        for move_number in range(1, moves + 1):
+            white, black = _SHUFFLE[(move_number - 1) % 2]
+            file.write(f"{move_number}. {white} {{move {move_number}}} {black} $1 ({move_number}... e5) \n")
+        file.write("*\n")
+    return path
+
+
+def _measure(path: str, repeat: int) -> None:
+    """
+    Print the throughput of parsing every game of a database, and of tokenizing it if the checkout has a tokenizer.
+
+    Args:
+        path (str): A path to the database.
+        repeat (int): The number of runs to take the best time of.
+    """
+
+    from chessplot.parser import _Parser
+    try:
+        from chessplot.tokenizer import _Tokenizer
+    except ImportError:  # checkouts from before the tokenizer
+        _Tokenizer = None
+
+    with open(path, encoding="utf-8") as file:
+        lines = file.readlines()
+    megabytes = os.path.getsize(path) / 1e6
+
+    def parse() -> list:
+        return [moves for _metadata, moves in _Parser.iter_games(file_path=path, end_states=END_STATES)]
+
+    measurements = {"iter_games": parse}
+    if _Tokenizer is not None:
+        tokenizer = _Tokenizer(end_states=END_STATES, skip_annotations=True)
+        measurements["tokenize"] = lambda: sum(1 for _ in tokenizer.tokenize(lines=lines))
+
+    games = parse()
+    ply = sum(len(pair) for moves in games for pair in moves)
+    print(f"  {os.path.basename(path)}: {megabytes:.1f} MB, {len(games)} games, {ply} ply")
+    for name, function in measurements.items():
+        print(f"    {name:<10} {megabytes / best_time(function=function, repeat=repeat):6.1f} MB/s")
+    return
+
+
+def main() -> None:
+    parser = argument_parser(description=__doc__)
+    parser.add_argument("--pgn", help="a database to parse instead of the generated ones")
+    parser.add_argument("--copies", type=int, default=3000, help="the number of copies of each generated game")
+    parser.add_argument("--moves", type=int, default=20000, help="the number of moves of the generated long game")
+    args = parser.parse_args()
+    use_checkout(path=args.chessplot)
+
+    if args.pgn is not None:
+        _measure(path=args.pgn, repeat=args.repeat)
+        return
+    with tempfile.TemporaryDirectory() as directory:
+        paths = [
+            write_database(path=os.path.join(directory, f"{name}.pgn"), file_names=file_names, copies=args.copies)
+            for name, file_names in _INPUTS.items()
+        ]
+        paths.append(_write_long_game(path=os.path.join(directory, "long_annotated.pgn"), moves=args.moves))
+        for path in paths:
+            try:
+                _measure(path=path, repeat=args.repeat)
+            except Exception as error:  # older parsers can't read every game
+                print(f"    failed: {type(error).__name__}: {error}")
+    return
+
+
+if __name__ == "__main__":
+    main()
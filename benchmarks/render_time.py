@@ -0,0 +1,71 @@
+"""Benchmark the time taken to draw the frames of a game and save it as a .gif"""
+
+import os
+import tempfile
+from _common import REPOSITORY, argument_parser, use_checkout, best_time
+
+
+def _draw_frames(pgn: str, plot_size: int) -> int:
+    """
+    Draw every frame of a game on a new plot.
+
+    Args:
+        pgn (str): A path to the game.
+        plot_size (int): The width of the plot.
+
+    Returns:
+        (int): The number of frames drawn.
+    """
+
+    from chessplot import ChessPlot
+
+    plot = ChessPlot(pgn=pgn)
+    plot._update_plot_settings(plot_size=plot_size)
+    frames = plot._draw_frames()
+    return len(frames if frames is not None else plot._frames)  # older checkouts keep the frames on the plot
+
+
+def _save_gif(pgn: str, save_path: str, plot_size: int) -> None:
+    """
+    Save a game as a .gif from a new plot.
+
+    Args:
+        pgn (str): A path to the game.
+        save_path (str): A path to save the .gif to.
+        plot_size (int): The width of the plot.
+    """
+
+    from chessplot import ChessPlot
+
+    ChessPlot(pgn=pgn).to_gif(save_path=save_path, plot_size=plot_size)
+    return
+
+
+def main() -> None:
+    parser = argument_parser(description=__doc__)
+    parser.add_argument(
+        "--pgn",
+        default=os.path.join(REPOSITORY, "tests", "data", "fischer_spassky.pgn"),
+        help="the game to draw (default the Fischer-Spassky game of the tests)"
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[400, 800], help="the plot sizes to draw")
+    args = parser.parse_args()
+    use_checkout(path=args.chessplot)
+
+    with tempfile.TemporaryDirectory() as directory:
+        save_path = os.path.join(directory, "plot.gif")
+        for plot_size in args.sizes:
+            frames = _draw_frames(pgn=args.pgn, plot_size=plot_size)
+            draw = best_time(function=lambda: _draw_frames(pgn=args.pgn, plot_size=plot_size), repeat=args.repeat)
+            gif = best_time(
+                function=lambda: _save_gif(pgn=args.pgn, save_path=save_path, plot_size=plot_size),
+                repeat=args.repeat
+            )
+            print(f"  {plot_size}px, {frames} frames")
+            print(f"    draw per frame  {draw / frames * 1e3:6.1f} ms")
+            print(f"    to_gif          {gif:6.2f} s")
+    return
+
+
+if __name__ == "__main__":
+    main()
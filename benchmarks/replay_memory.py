@@ -0,0 +1,79 @@
+"""Benchmark the memory used while streaming and replaying every game of a database"""
+
+import os
+import tempfile
+import tracemalloc
+from time import perf_counter
+from _common import argument_parser, use_checkout, write_database
+
+
+_GAMES = ["fischer_spassky.pgn", "annotated.pgn", "disambiguation.pgn", "special_moves.pgn"]  # every engine replays
+
+
+def _stream(path: str, engine: str) -> int:
+    """
+    Replay every game of a database in turn with ChessPlot.from_database, keeping only the current game.
+
+    Args:
+        path (str): A path to the database.
+        engine (str): The engine used to replay each game.
+
+    Returns:
+        (int): The number of games replayed.
+    """
+
+    from chessplot import ChessPlot
+    from chessplot.interpreter import InterpreterError
+
+    games = 0
+    for plot in ChessPlot.from_database(pgn=path, engine=engine):
+        if hasattr(plot, "_replay_to"):  # checkouts which replay lazily
+            try:
+                plot._replay_to(ply=10 ** 6)
+            except InterpreterError:
+                pass
+        games += 1
+    return games
+
+
+def main() -> None:
+    parser = argument_parser(description=__doc__)
+    parser.add_argument("--pgn", help="a database to stream instead of the generated one")
+    parser.add_argument("--copies", type=int, default=200, help="the number of copies of each generated game")
+    parser.add_argument("--engine", default="array", help="the engine used to replay each game (default array)")
+    parser.add_argument("--top", type=int, default=5, help="the number of modules to list memory still held by")
+    args = parser.parse_args()
+    use_checkout(path=args.chessplot)
+    import chessplot
+    from chessplot.parser import _Parser
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = args.pgn or write_database(
+            path=os.path.join(directory, "stream.pgn"), file_names=_GAMES, copies=args.copies
+        )
+        _Parser.clear_ply_cache()  # start from a cold cache of parsed ply
+        tracemalloc.start()
+        start_snapshot = tracemalloc.take_snapshot()
+        start = perf_counter()
+        games = _stream(path=path, engine=args.engine)
+        seconds = perf_counter() - start
+        current, peak = tracemalloc.get_traced_memory()
+        end_snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+    print(f"  {games} games streamed in {seconds:.1f} s with tracemalloc on")
+    print(f"    peak traced memory  {peak / 1024:8.0f} KiB")
+    print(f"    still held after    {current / 1024:8.0f} KiB, including the cache of parsed ply")
+    package_files = [tracemalloc.Filter(inclusive=True, filename_pattern=os.path.join(chessplot.__path__[0], "*"))]
+    statistics = end_snapshot.filter_traces(filters=package_files).compare_to(
+        old_snapshot=start_snapshot.filter_traces(filters=package_files),
+        key_type="filename"
+    )
+    for statistic in statistics[:args.top]:
+        file_name = os.path.basename(statistic.traceback[0].filename)
+        print(f"      {file_name:<16} {statistic.size_diff / 1024:8.0f} KiB in {statistic.count_diff} blocks")
+    return
+
+
+if __name__ == "__main__":
+    main()
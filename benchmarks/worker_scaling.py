@@ -0,0 +1,59 @@
+"""Benchmark saving a .gif with its frames drawn by different numbers of worker processes"""
+
+import os
+import hashlib
+import tempfile
+from _common import REPOSITORY, argument_parser, use_checkout, best_time
+
+
+def _save_gif(pgn: str, save_path: str, plot_size: int, workers: int) -> None:
+    """
+    Save a game as a .gif from a new plot.
+
+    Args:
+        pgn (str): A path to the game.
+        save_path (str): A path to save the .gif to.
+        plot_size (int): The width of the plot.
+        workers (int): The number of processes to draw frames in.
+    """
+
+    from chessplot import ChessPlot
+
+    ChessPlot(pgn=pgn).to_gif(save_path=save_path, plot_size=plot_size, workers=workers)
+    return
+
+
+def main() -> None:
+    parser = argument_parser(description=__doc__)
+    parser.add_argument(
+        "--pgn",
+        default=os.path.join(REPOSITORY, "tests", "data", "fischer_spassky.pgn"),
+        help="the game to draw (default the Fischer-Spassky game of the tests)"
+    )
+    parser.add_argument("--plot-size", type=int, default=800, help="the width of the plot (default 800)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16], help="the numbers of workers")
+    args = parser.parse_args()
+    use_checkout(path=args.chessplot)
+
+    print(f"  {os.cpu_count()} cores, {args.plot_size}px")
+    serial_time, serial_digest = None, None
+    with tempfile.TemporaryDirectory() as directory:
+        save_path = os.path.join(directory, "plot.gif")
+        for workers in args.workers:
+            seconds = best_time(
+                function=lambda: _save_gif(
+                    pgn=args.pgn, save_path=save_path, plot_size=args.plot_size, workers=workers
+                ),
+                repeat=args.repeat
+            )
+            with open(save_path, "rb") as file:
+                digest = hashlib.md5(file.read()).hexdigest()
+            if serial_time is None:
+                serial_time, serial_digest = seconds, digest
+            identical = "identical" if digest == serial_digest else "DIFFERENT"
+            print(f"    {workers:>2} workers  {seconds:6.2f} s  {serial_time / seconds:5.2f}x  {identical}")
+    return
+
+
+if __name__ == "__main__":
+    main()
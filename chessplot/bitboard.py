@@ -0,0 +1,371 @@
+"""
+Module containing a bitboard implementation of the chess move interpreter.
+"""
+
+from typing import List
+from .piece import _EMPTY_SQUARE
+from .ply import _Ply
+from .interpreter import InterpreterError
+
+
+def _generate_step_attacks(directions: List[tuple]) -> List[int]:
+    """
+    Generate a lookup table of the squares a piece can reach with a single step in each of the given directions.
+
+    Args:
+        directions (list): A list of (row, col) steps.
+
+    Returns:
+        (list): A bitboard of reachable squares for each of the 64 squares.
+    """
+
+    attacks = []
+    for square in range(64):
+        row, col = divmod(square, 8)
+        bitboard = 0
+        for row_step, col_step in directions:
+            if 0 <= row + row_step < 8 and 0 <= col + col_step < 8:
+                bitboard |= 1 << ((row + row_step) * 8 + col + col_step)
+        attacks.append(bitboard)
+    return attacks
+
+
+def _generate_rays(row_step: int, col_step: int) -> List[int]:
+    """
+    Generate a lookup table of the squares along a ray in a given direction, excluding the starting square.
+
+    Args:
+        row_step (int): The row component of the direction.
+        col_step (int): The column component of the direction.
+
+    Returns:
+        (list): A bitboard of the ray for each of the 64 squares.
+    """
+
+    rays = []
+    for square in range(64):
+        row, col = divmod(square, 8)
+        bitboard = 0
+        row, col = row + row_step, col + col_step
+        while 0 <= row < 8 and 0 <= col < 8:
+            bitboard |= 1 << (row * 8 + col)
+            row, col = row + row_step, col + col_step
+        rays.append(bitboard)
+    return rays
+
+
+_KNIGHT_ATTACKS = _generate_step_attacks([(2, 1), (1, 2), (-1, 2), (-2, 1), (-2, -1), (-1, -2), (1, -2), (2, -1)])
+_KING_ATTACKS = _generate_step_attacks([(1, 1), (-1, 1), (-1, -1), (1, -1), (1, 0), (0, 1), (0, -1), (-1, 0)])
+_WHITE_PAWN_ATTACKS = _generate_step_attacks([(1, -1), (1, 1)])
+_BLACK_PAWN_ATTACKS = _generate_step_attacks([(-1, -1), (-1, 1)])
+
+# Rays are split by whether square numbers increase along them, which determines whether the nearest blocker
+# is the lowest or highest set bit of the blocked part of the ray.
+_ROOK_RAYS = ([_generate_rays(1, 0), _generate_rays(0, 1)], [_generate_rays(-1, 0), _generate_rays(0, -1)])
+_BISHOP_RAYS = ([_generate_rays(1, 1), _generate_rays(1, -1)], [_generate_rays(-1, -1), _generate_rays(-1, 1)])
+
+_ROW_MASKS = [0xFF << (8 * row) for row in range(8)]
+_COL_MASKS = [0x0101010101010101 << col for col in range(8)]
+
+
+def _sliding_attacks(square: int, occupied: int, rays: tuple) -> int:
+    """
+    Get the squares attacked by a sliding piece, stopping each ray at the first occupied square.
+
+    Args:
+        square (int): The square of the sliding piece.
+        occupied (int): A bitboard of all occupied squares.
+        rays (tuple): The increasing and decreasing ray lookup tables of the piece.
+
+    Returns:
+        (int): A bitboard of the attacked squares.
+    """
+
+    increasing_rays, decreasing_rays = rays
+    attacks = 0
+    for ray_table in increasing_rays:
+        ray = ray_table[square]
+        blockers = ray & occupied
+        if blockers:
+            ray ^= ray_table[(blockers & -blockers).bit_length() - 1]
+        attacks |= ray
+    for ray_table in decreasing_rays:
+        ray = ray_table[square]
+        blockers = ray & occupied
+        if blockers:
+            ray ^= ray_table[blockers.bit_length() - 1]
+        attacks |= ray
+    return attacks
+
+
+class _BitboardInterpreter:
+    """
+    A class for interpreting chess moves using bitboards.
+
+    Each piece name (e.g. 'N' for a white knight) has a 64-bit integer with one bit set for each square it occupies,
+    where square = row * 8 + col. A mailbox of piece codes is kept alongside the bitboards to find captured pieces.
+    Moves are resolved backwards from the destination square using precomputed attack tables, so only pieces
+    which could actually have made a move are ever considered.
+
+    Attributes:
+        _piece_positions (str): A string denoting the starting position of the game.
+        _bitboards (dict): A bitboard for each piece name.
+        _occupied (int): A bitboard of all occupied squares.
+        _squares (bytearray): The piece code on each square.
+        _ply_count (int): A count of the number of moves played in the game.
+    """
+
+    def __init__(self, piece_positions: str) -> None:
+        """
+        Constructor method for the _BitboardInterpreter class.
+
+        Args:
+            piece_positions (str): A string describing the initial state of the board.
+        """
+        self._piece_positions = piece_positions
+        self._bitboards = {name: 0 for name in "PNBRQKpnbrqk"}
+        self._occupied = 0
+        self._squares = bytearray([_EMPTY_SQUARE] * 64)
+        self._generate_board()
+        self._ply_count = 0
+
+    def __str__(self) -> str:
+        rows = [" ".join(chr(code) for code in reversed(self._squares[row * 8:row * 8 + 8])) for row in range(8)]
+        return "\n".join(reversed(rows)) + "\n"
+
+    def _generate_board(self) -> None:
+        """Populate the bitboards from a given FEN code."""
+
+        row = 7
+        col = 7
+        for char in self._piece_positions:
+            if char == "/":
+                row -= 1
+                col = 7
+            elif str.isdigit(char):
+                col -= int(char)
+            else:
+                self._add_piece(name=char, square=row * 8 + col)
+                col -= 1
+        return
+
+    def _add_piece(self, name: str, square: int) -> None:
+        """
+        Add a piece to the board.
+
+        Args:
+            name (str): The name of the piece.
+            square (int): The square to add the piece to.
+        """
+        self._bitboards[name] |= 1 << square
+        self._occupied |= 1 << square
+        self._squares[square] = ord(name)
+        return
+
+    def _remove_piece(self, square: int) -> None:
+        """
+        Remove a piece from the board, if there is one.
+
+        Args:
+            square (int): The square to remove the piece from.
+        """
+        code = self._squares[square]
+        if code != _EMPTY_SQUARE:
+            self._bitboards[chr(code)] &= ~(1 << square)
+            self._occupied &= ~(1 << square)
+            self._squares[square] = _EMPTY_SQUARE
+        return
+
+    def _attackers(self, square: int, piece_rank: str, white: bool, occupied: int) -> int:
+        """
+        Get the pieces of a given rank and colour which attack a given square.
+
+        Args:
+            square (int): The attacked square.
+            piece_rank (str): The rank of the attacking pieces e.g. 'N'.
+            white (bool): Indicator of whether the attacking pieces are white.
+            occupied (int): A bitboard of all occupied squares.
+
+        Returns:
+            (int): A bitboard of the attacking pieces.
+        """
+        pieces = self._bitboards[piece_rank if white else piece_rank.lower()]
+        if not pieces:
+            return 0
+        if piece_rank == "N":
+            return _KNIGHT_ATTACKS[square] & pieces
+        if piece_rank == "K":
+            return _KING_ATTACKS[square] & pieces
+        if piece_rank == "P":  # a pawn attacks a square from where an opposing pawn on that square would attack
+            return (_BLACK_PAWN_ATTACKS if white else _WHITE_PAWN_ATTACKS)[square] & pieces
+        attacks = 0
+        if piece_rank != "B":
+            attacks |= _sliding_attacks(square=square, occupied=occupied, rays=_ROOK_RAYS)
+        if piece_rank != "R":
+            attacks |= _sliding_attacks(square=square, occupied=occupied, rays=_BISHOP_RAYS)
+        return attacks & pieces
+
+    def _is_attacked(self, square: int, by_white: bool, occupied: int, captured: int = 0) -> bool:
+        """
+        Check whether a square is attacked by any piece of a given colour.
+
+        Args:
+            square (int): The square to be checked.
+            by_white (bool): Indicator of whether to check for white attackers.
+            occupied (int): A bitboard of all occupied squares.
+            captured (int): A bitboard of pieces to be ignored as they have been captured (default 0).
+
+        Returns:
+            (bool): Indicator of whether the square is attacked.
+        """
+        for piece_rank in "PNBRQK":
+            if self._attackers(square=square, piece_rank=piece_rank, white=by_white, occupied=occupied) & ~captured:
+                return True
+        return False
+
+    def _pawn_origins(self, ply: _Ply, square: int, white_to_move: bool) -> int:
+        """
+        Get the pawns which could move to a given square.
+
+        Args:
+            ply (_Ply): The ply being executed.
+            square (int): The destination square.
+            white_to_move (bool): Indicator of whether it's white's move or not.
+
+        Returns:
+            (int): A bitboard of the candidate pawns.
+        """
+        pawns = self._bitboards["P" if white_to_move else "p"]
+        if ply.is_capture:
+            return self._attackers(square=square, piece_rank="P", white=white_to_move, occupied=0)
+
+        step = -8 if white_to_move else 8
+        origin = square + step
+        if not 0 <= origin < 64:
+            return 0
+        if pawns >> origin & 1:
+            return 1 << origin
+        double_step_row = 3 if white_to_move else 4
+        if square // 8 == double_step_row and self._squares[origin] == _EMPTY_SQUARE and pawns >> (origin + step) & 1:
+            return 1 << (origin + step)
+        return 0
+
+    def _leaves_king_in_check(self, origin: int, square: int, white_to_move: bool, occupied: int) -> bool:
+        """
+        Check whether moving a piece would leave its own king in check e.g. because the piece is pinned.
+
+        Args:
+            origin (int): The square of the piece being moved.
+            square (int): The destination square.
+            white_to_move (bool): Indicator of whether it's white's move or not.
+            occupied (int): A bitboard of all occupied squares.
+
+        Returns:
+            (bool): Indicator of whether the king would be left in check.
+        """
+        king = self._bitboards["K" if white_to_move else "k"]
+        if not king:
+            return False
+        occupied = (occupied & ~(1 << origin)) | (1 << square)
+        return self._is_attacked(
+            square=king.bit_length() - 1,
+            by_white=not white_to_move,
+            occupied=occupied,
+            captured=1 << square
+        )
+
+    def _castle(self, white_to_move: bool, castle_king_side: bool) -> None:
+        """
+        Execute castling of pieces on given side and for given colour.
+
+        Args:
+            white_to_move (bool): Indicator of whether it's white's move or not.
+            castle_king_side (bool): Indicator of whether to castle king-side or not.
+        """
+        back_row = 0 if white_to_move else 56
+        if castle_king_side:
+            moves = ((back_row + 3, back_row + 1), (back_row, back_row + 2))
+        else:
+            moves = ((back_row + 3, back_row + 5), (back_row + 7, back_row + 4))
+        for origin, square in moves:
+            name = chr(self._squares[origin])
+            self._remove_piece(square=origin)
+            self._add_piece(name=name, square=square)
+        self._ply_count += 1
+        return
+
+    def execute_ply(self, ply: _Ply, white_to_move: bool) -> None:
+        """
+        Execute a given ply.
+
+        Args:
+            ply (_Ply): The ply to be executed.
+            white_to_move (bool): Indicator of whether it's white's move or not.
+
+        Raises:
+            InterpreterError: If the given ply could not be executed.
+        """
+
+        if ply.castle_king_side or ply.castle_queen_side:
+            self._castle(white_to_move=white_to_move, castle_king_side=ply.castle_king_side)
+            return
+
+        new_position = ply.new_position
+        square = new_position.row * 8 + new_position.col
+        target = self._squares[square]
+        if target != _EMPTY_SQUARE and chr(target).isupper() == white_to_move:  # can't move onto own piece
+            raise InterpreterError(ply_string=ply.ply_string)
+
+        occupied = self._occupied
+        if ply.piece_rank == "P":
+            candidates = self._pawn_origins(ply=ply, square=square, white_to_move=white_to_move)
+        else:
+            candidates = self._attackers(
+                square=square,
+                piece_rank=ply.piece_rank,
+                white=white_to_move,
+                occupied=occupied
+            )
+        if ply.piece_row_number is not None:
+            candidates &= _ROW_MASKS[ply.piece_row_number]
+        if ply.piece_col_number is not None:
+            candidates &= _COL_MASKS[ply.piece_col_number]
+
+        if candidates & (candidates - 1):  # more than one candidate, so discard any which are pinned
+            remaining = candidates
+            while remaining:
+                candidate = remaining & -remaining
+                remaining ^= candidate
+                origin = candidate.bit_length() - 1
+                if self._leaves_king_in_check(
+                        origin=origin,
+                        square=square,
+                        white_to_move=white_to_move,
+                        occupied=occupied
+                ):
+                    candidates ^= candidate
+
+        if not candidates or candidates & (candidates - 1):
+            raise InterpreterError(ply_string=ply.ply_string)
+
+        origin = candidates.bit_length() - 1
+        name = chr(self._squares[origin])
+        if ply.is_capture and self._squares[square] == _EMPTY_SQUARE and ply.piece_rank == "P":  # en passant
+            self._remove_piece(square=origin // 8 * 8 + square % 8)
+        self._remove_piece(square=square)
+        self._remove_piece(square=origin)
+        if ply.promoted_piece_rank is not None:
+            name = ply.promoted_piece_rank if white_to_move else ply.promoted_piece_rank.lower()
+        self._add_piece(name=name, square=square)
+        self._ply_count += 1
+        return
+
+    def get_board(self) -> bytes:
+        """
+        Get a snapshot of the current game board.
+
+        Returns:
+            (bytes): The piece code on each square, indexed by row * 8 + col.
+        """
+
+        return bytes(self._squares)
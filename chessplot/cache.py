@@ -0,0 +1,83 @@
+"""Module for caching rendered frames"""
+
+from collections import OrderedDict
+from typing import Hashable, Optional
+from PIL import Image
+
+
+class _FrameCache:
+    """A class for a size-bounded cache of rendered frames.
+
+    Frames are kept in order of use and the least recently used frames are evicted once the total size of the
+    cached images exceeds max_bytes. A frame larger than max_bytes is never cached.
+
+    Attributes:
+        _max_bytes (int): The greatest total size in bytes of the cached images.
+        _frames (OrderedDict): The cached frames, from least to most recently used.
+        _size (int): The total size in bytes of the cached images.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """
+        Constructor method for the _FrameCache class.
+
+        Args:
+            max_bytes (int): The greatest total size in bytes of the cached images.
+        """
+
+        self._max_bytes = max_bytes
+        self._frames = OrderedDict()
+        self._size = 0
+
+    def get(self, key: Hashable) -> Optional[Image.Image]:
+        """
+        Get a cached frame, marking it as the most recently used.
+
+        Args:
+            key (Hashable): The key the frame was cached under.
+
+        Returns:
+            (Image.Image): The cached frame, or None if it isn't cached.
+        """
+
+        frame = self._frames.get(key)
+        if frame is not None:
+            self._frames.move_to_end(key)
+        return frame
+
+    def put(self, key: Hashable, frame: Image.Image) -> None:
+        """
+        Cache a frame, evicting the least recently used frames if the cache is full.
+
+        Args:
+            key (Hashable): The key to cache the frame under.
+            frame (Image.Image): The frame to be cached. It must not be modified once cached.
+        """
+
+        frame_size = self._frame_size(frame=frame)
+        if frame_size > self._max_bytes:
+            return
+        if key in self._frames:
+            self._size -= self._frame_size(frame=self._frames.pop(key))
+        self._frames[key] = frame
+        self._size += frame_size
+        while self._size > self._max_bytes:
+            _, evicted = self._frames.popitem(last=False)
+            self._size -= self._frame_size(frame=evicted)
+        return
+
+    @staticmethod
+    def _frame_size(frame: Image.Image) -> int:
+        """
+        Estimate the memory used by the pixels of an image.
+
+        Pillow stores each pixel of an image with more than one band in 4 bytes.
+
+        Args:
+            frame (Image.Image): The image.
+
+        Returns:
+            (int): The size in bytes of the pixels of the image.
+        """
+
+        return frame.size[0] * frame.size[1] * (4 if len(frame.getbands()) > 1 else 1)
@@ -1,11 +1,27 @@
 """Module for the ChessPlot class"""
 
+import io
+import os
+import difflib
+import functools
+from collections import deque
 import numpy as np
-from typing import Tuple, List, TypeVar, Generic
-from PIL import Image, ImageFont, ImageDraw
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, Future
+from typing import List, Dict, TypeVar, Generic, Iterator, Tuple, Union, Iterable, IO, BinaryIO, Callable
+from PIL import Image, ImageDraw, ImageFont
 from .interpreter import _Interpreter
+from .bitboard import _BitboardInterpreter
 from .parser import _Parser, _Metadata
+from .index import _GameIndex
 from .settings import _Settings
+from .history import _History
+from .renderer import _scale_font, _Renderer, _start_worker, _draw_frame_range
+from .gif import _GifWriter, _theme_palette
+from .cache import _FrameCache
+from .pdf import _PdfWriter
+from .vector import _PdfRenderer
+from .svg import _SvgRenderer
+from .pipeline import _run_pipeline
 
 
 T = TypeVar("T")
@@ -15,54 +31,299 @@ class ChessPlot:
     """A class for plots of chess games.
 
     Attributes:
-        pgn (str): A path to a .pgn file to be plotted.
+        pgn (str): A path to the .pgn file being plotted, or None if the game was given as text or a stream.
         metadata (_Metadata): A collection of metadata about the game.
+        timings (_StageTimings): The time spent drawing and encoding frames by the last .gif saved by to_gif or
+            export, or None if no .gif has been saved.
+        _game_number (int): The position of the game within a .pgn database, if created from one.
+        _engine (str): The name of the engine used to replay the game.
         _settings (_Settings): A collection of settings for the plots to be generated.
         _header_image (Image.Image): A header image for each frame of a plot.
-        _move_text_font (ImageFont.truetype): A font for drawing move notations on plots.
-        _unicode_font (ImageFont.truetype): A font for drawing pieces on the board.
-        _square_name_font (ImageFont.truetype): A font for drawing the square coordinates on plots.
-        _boards (list): A list of boards, one for each of the moves played during the game.
-        _frames (list): A list of images, one for each of the moves played during the game.
+        _history (_History): A history of board snapshots, one for each of the moves played during the game.
+            Boards are added lazily, only as far as the latest frame requested so far.
+        _replay (Iterator): A generator which replays the rest of the game, or None for metadata-only plots.
+        _replay_error (Exception): The error which stopped the game being replayed, if any.
+        _ply_count (int): The number of boards in the game including the starting position.
+        _frame_cache (_FrameCache): Frames drawn so far, keyed by their ply and the settings they were drawn with.
     """
 
-    __end_states = ["1-0", "0-1", "1/2-1/2"]
+    __end_states = ["1-0", "0-1", "1/2-1/2", "*"]
 
-    def __init__(self, pgn: str) -> None:
+    __engines = {
+        "array": _Interpreter,
+        "bitboard": _BitboardInterpreter,
+    }
+
+    __frames_per_chunk = 16  # frames in each range given to a worker when drawing in parallel
+
+    __frame_cache_bytes = 128 * 1024 * 1024  # memory the drawn frames of each plot may use by default
+
+    __frames_queued = 4  # frames drawn ahead of the encoder when saving a .gif
+
+    __pdf_resolution = 1800  # pixels of a frame per inch of a .pdf page
+
+    def __init__(
+            self,
+            pgn: Union[str, IO],
+            engine: str = "array",
+            metadata_only: bool = False,
+            frame_cache_bytes: int = None
+    ) -> None:
         """
         Constructor for the ChessPlot class.
 
+        Moves are only replayed when a plot is first drawn, and only as far as the last frame requested.
+
+        A string is always treated as a path, use from_text to plot a game given as PGN text. Plots of games given
+        as a stream have no default save path, so a save path must be given when plotting.
+
         Args:
-            pgn (str): A path to a .pgn file to be plotted.
+            pgn (str | IO): A path to a .pgn file, or a readable file-like object in text or binary mode containing
+                the game to be plotted.
+            engine (str): The engine used to replay the game, either "array" or "bitboard" (default "array").
+            metadata_only (bool): Indicator of whether only the game metadata is needed, in which case moves are
+                never replayed and the game cannot be plotted (default False).
+            frame_cache_bytes (int): The memory in bytes which drawn frames may use while cached, where 0 disables
+                the cache (default None i.e. 128 MB).
+
+        Raises:
+            ValueError: If the given engine is not recognised, a given path is not a .pgn file or the frame cache
+                size is negative.
+            FileNotFoundError: If a given path doesn't exist.
+        """
+
+        if hasattr(pgn, "read"):
+            metadata, moves = _Parser.parse_stream(stream=pgn, end_states=ChessPlot.__end_states)
+            pgn = None
+        else:
+            metadata, moves = _Parser.parse_file(file_path=pgn, end_states=ChessPlot.__end_states)
+        self._setup(
+            pgn=pgn,
+            metadata=metadata,
+            moves=moves,
+            engine=engine,
+            metadata_only=metadata_only,
+            frame_cache_bytes=frame_cache_bytes
+        )
+
+    def _setup(
+            self,
+            pgn: str,
+            metadata: _Metadata,
+            moves: List[List[str]],
+            engine: str,
+            game_number: int = None,
+            metadata_only: bool = False,
+            frame_cache_bytes: int = None
+    ) -> None:
         """
+        Set up a ChessPlot for a parsed game.
 
+        Args:
+            pgn (str): A path to the .pgn file containing the game, or None if there isn't one.
+            metadata (_Metadata): A collection of metadata about the game.
+            moves (list): A list of pairs of ply played during the game.
+            engine (str): The engine used to replay the game.
+            game_number (int): The position of the game within a database, if any (default None).
+            metadata_only (bool): Indicator of whether the moves should never be replayed (default False).
+            frame_cache_bytes (int): The memory in bytes which drawn frames may use while cached, where 0 disables
+                the cache (default None i.e. 128 MB).
+
+        Raises:
+            ValueError: If the given engine is not recognised or the frame cache size is negative.
+        """
+
+        if engine not in ChessPlot.__engines:
+            raise ValueError(f"{engine} is not a recognised engine. Please choose from {list(ChessPlot.__engines)}.")
+        if frame_cache_bytes is None:
+            frame_cache_bytes = ChessPlot.__frame_cache_bytes
+        elif frame_cache_bytes < 0:
+            raise ValueError("Please choose a frame cache size of at least 0 bytes.")
         self.pgn = pgn
-        self.metadata = _Metadata()
+        self.metadata = metadata
+        self._game_number = game_number
+        self._engine = engine
         self._settings = _Settings()
         self._header_image = None
-        self._move_text_font = None
-        self._unicode_font = None
-        self._square_name_font = None
-        self._boards = self._create_boards()
-        self._frames = []
+        self._history = _History()
+        if metadata_only:
+            self._replay = None
+            self._ply_count = None
+        else:
+            self._replay = self._create_boards(moves=moves)
+            self._ply_count = self._count_boards(moves=moves)
+        self._replay_error = None
+        self._frame_cache = _FrameCache(max_bytes=frame_cache_bytes)
+        self.timings = None
+
+    @classmethod
+    def from_text(
+            cls,
+            pgn_text: str,
+            engine: str = "array",
+            metadata_only: bool = False,
+            frame_cache_bytes: int = None
+    ) -> "ChessPlot":
+        """
+        Create a ChessPlot for a game given as PGN text e.g. the body of an HTTP request.
+
+        Plots of games given as text have no default save path, so a save path must be given when plotting.
 
-    def _create_boards(self) -> List[Tuple[str, np.ndarray]]:
+        Args:
+            pgn_text (str): The PGN text of the game to be plotted.
+            engine (str): The engine used to replay the game, either "array" or "bitboard" (default "array").
+            metadata_only (bool): Indicator of whether only the game metadata is needed (default False).
+            frame_cache_bytes (int): The memory in bytes which the drawn frames may use while cached, where 0
+                disables the cache (default None i.e. 128 MB).
+
+        Returns:
+            (ChessPlot): A plot of the game.
+
+        Raises:
+            ValueError: If the given engine is not recognised or the frame cache size is negative.
         """
-        Parse and execute a set of moves.
 
-        Each ply_string is parsed by an interpreter object which executes the move
-        and returns a game board to be plotted later.
+        metadata, moves = _Parser.parse_text(pgn_text=pgn_text, end_states=ChessPlot.__end_states)
+        plot = cls.__new__(cls)
+        plot._setup(
+            pgn=None,
+            metadata=metadata,
+            moves=moves,
+            engine=engine,
+            metadata_only=metadata_only,
+            frame_cache_bytes=frame_cache_bytes
+        )
+        return plot
+
+    @classmethod
+    def from_database(
+            cls,
+            pgn: Union[str, IO],
+            engine: str = "array",
+            metadata_only: bool = False,
+            frame_cache_bytes: int = None
+    ) -> Iterator["ChessPlot"]:
+        """
+        Lazily create a ChessPlot for every game in a .pgn database.
+
+        Games are parsed one at a time as the iterator is advanced, so only a single game is held in memory.
+
+        Args:
+            pgn (str | IO): A path to a .pgn file, or a readable file-like object containing any number of games
+                e.g. io.StringIO of PGN text.
+            engine (str): The engine used to replay each game, either "array" or "bitboard" (default "array").
+            metadata_only (bool): Indicator of whether only the game metadata is needed (default False).
+            frame_cache_bytes (int): The memory in bytes which the drawn frames of each plot may use while cached,
+                where 0 disables the cache (default None i.e. 128 MB).
+
+        Yields:
+            (ChessPlot): A plot of the next game in the database.
+        """
+
+        if hasattr(pgn, "read"):
+            games, pgn = _Parser.iter_stream(stream=pgn, end_states=ChessPlot.__end_states), None
+        else:
+            games = _Parser.iter_games(file_path=pgn, end_states=ChessPlot.__end_states)
+        for game_number, (metadata, moves) in enumerate(games):
+            plot = cls.__new__(cls)
+            plot._setup(
+                pgn=pgn,
+                metadata=metadata,
+                moves=moves,
+                engine=engine,
+                game_number=game_number,
+                metadata_only=metadata_only,
+                frame_cache_bytes=frame_cache_bytes
+            )
+            yield plot
+
+    @classmethod
+    def from_index(
+            cls,
+            pgn: str,
+            game_number: int,
+            engine: str = "array",
+            metadata_only: bool = False,
+            frame_cache_bytes: int = None
+    ) -> "ChessPlot":
+        """
+        Create a ChessPlot for a single game in a .pgn database.
+
+        The game is read directly from its position in the file using a sidecar index (e.g. mydatabase.pgn.idx).
+        The index is created on first use and only the newly appended part of the file is scanned if the
+        database grows. Games are numbered in the same way as by from_database.
+
+        Args:
+            pgn (str): A path to a .pgn file containing any number of games.
+            game_number (int): The position of the game in the database, starting from 0.
+            engine (str): The engine used to replay the game, either "array" or "bitboard" (default "array").
+            metadata_only (bool): Indicator of whether only the game metadata is needed (default False).
+            frame_cache_bytes (int): The memory in bytes which the drawn frames of each plot may use while cached,
+                where 0 disables the cache (default None i.e. 128 MB).
 
         Returns:
-            boards (list): A list of game boards
+            (ChessPlot): A plot of the game.
+
+        Raises:
+            ValueError: If there is no game with the given number or the frame cache size is negative.
+        """
+
+        index = _GameIndex.for_file(pgn_path=pgn, end_states=ChessPlot.__end_states)
+        metadata, moves = index.read_game(game_number=game_number)
+        plot = cls.__new__(cls)
+        plot._setup(
+            pgn=pgn,
+            metadata=metadata,
+            moves=moves,
+            engine=engine,
+            game_number=game_number,
+            metadata_only=metadata_only,
+            frame_cache_bytes=frame_cache_bytes
+        )
+        return plot
+
+    def _default_save_path(self, extension: str) -> str:
+        """
+        Generate a save path from the path of the input .pgn file.
+
+        Games from a database are suffixed with their position in the database so they don't overwrite each other.
+
+        Args:
+            extension (str): The file extension of the output e.g. '.gif'.
+
+        Returns:
+            save_path (str): A path beside the input .pgn file.
+
+        Raises:
+            ValueError: If the game wasn't read from a .pgn file.
+        """
+
+        if self.pgn is None:
+            raise ValueError("Please give a save path, as this game wasn't read from a .pgn file.")
+        if self._game_number is not None:
+            extension = f"_{self._game_number}{extension}"
+        return self.pgn.replace(".pgn", extension)
+
+    def _create_boards(self, moves: List[List[str]]) -> Iterator[Tuple[str, bytes]]:
+        """
+        Lazily parse and execute a set of moves.
+
+        Each ply_string is parsed by an interpreter object which executes the move
+        and yields a game board to be plotted later. Nothing is executed until the generator is advanced.
+
+        Args:
+            moves (list): A list of pairs of ply played during the game.
+
+        Yields:
+            display_string (str): A string describing the ply e.g. 1. e4.
+            board (bytes): A snapshot of the game board following the ply.
         """
 
         parser = _Parser()
-        self.metadata, moves = parser.parse_file(file_path=self.pgn, end_states=ChessPlot.__end_states)
         piece_positions, white_to_move, move_count = parser.parse_fen(fen=self.metadata.fen)
 
-        interpreter = _Interpreter(piece_positions=piece_positions)
-        boards = [("", interpreter.get_board())]  # add starting position image
+        interpreter = ChessPlot.__engines[self._engine](piece_positions=piece_positions)
+        yield "", interpreter.get_board()  # starting position
 
         for pair in moves:
             for ply_string in pair:
@@ -75,152 +336,82 @@ class ChessPlot:
 
                 ply = parser.parse_ply_string(ply_string=ply_string)
                 interpreter.execute_ply(ply=ply, white_to_move=white_to_move)
-                boards.append((display_string, interpreter.get_board()))
+                yield display_string, interpreter.get_board()
                 white_to_move = not white_to_move
             move_count += 1
 
-        return boards
-
     @staticmethod
-    def _scale_font(text: str, font_name: str, max_width: int, max_height: int) -> ImageFont.truetype:
+    def _count_boards(moves: List[List[str]]) -> int:
         """
-        Scale a font to fit a given piece of text within a bounding box.
+        Count the boards a set of moves will produce without replaying them.
 
         Args:
-            text (str): The text to be fitted.
-            font_name (str): The name of the font.
-            max_width (int): The maximum width of the scaled text.
-            max_height (int): The maximum height of the scaled text.
+            moves (list): A list of pairs of ply played during the game.
 
         Returns:
-            font (ImageFont.truetype): A font object scaled to the correct size.
+            board_count (int): The number of boards including the starting position.
         """
 
-        # TODO: Find a more optimal way of scaling fonts
-        font_size = 12
-        font = ImageFont.truetype(font=font_name, size=font_size)
-        text_width, text_height = font.getsize(text=text)
-
-        while text_width < max_width and text_height < max_height:
-            font_size += 2
-            font = ImageFont.truetype(font=font_name, size=font_size)
-            text_width, text_height = font.getsize(text=text)
-
-        return font
+        board_count = 1
+        for pair in moves:
+            for ply_string in pair:
+                if ply_string in ChessPlot.__end_states:
+                    break
+                board_count += 1
+        return board_count
 
-    def _draw_board(self, board: np.ndarray, ply_string: str = "") -> Image.Image:
+    def _replay_to(self, ply: int) -> None:
         """
-        Draw an image of a given game board.
+        Replay the game until the board following a given ply is in the history.
 
-        The image will be a 10x10 grid. If black_perspective is True, the board is flipped in the image.
+        Replaying stops early if the game ends before the given ply. If a move can't be replayed, the error is
+        kept and raised again whenever a later ply is requested, as the game can't be replayed any further.
 
         Args:
-            board (np.ndarray): The game board to be drawn.
-            ply_string (str): A string describing the ply being drawn e.g. 1. e4.
+            ply (int): The number of the ply, where 0 is the starting position.
 
-        Returns:
-            image (Image.Image): An image of the board.
+        Raises:
+            InterpreterError: If a move up to the given ply can't be replayed.
         """
 
-        image = Image.new(
-            mode="RGB",
-            size=(self._settings.square_width * 10, self._settings.square_width * 10),
-            color="white"
-        )
-        draw = ImageDraw.ImageDraw(im=image)
+        if self._replay_error is not None and len(self._history) <= ply:
+            raise self._replay_error
+        if self._replay is None:
+            return
+        while len(self._history) <= ply:
+            try:
+                ply_string, board = next(self._replay)
+            except StopIteration:
+                self._replay = None  # release the interpreter and moves
+                return
+            except Exception as error:
+                self._replay = None
+                self._replay_error = error
+                raise
+            self._history.append(ply_string=ply_string, board=board)
+        return
 
-        x_origin, y_origin = self._settings.square_width, self._settings.square_width
+    def _replay_frame_window(self) -> Tuple[int, int]:
+        """
+        Replay the game as far as the end frame of the current settings, checking every frame is in the game.
 
-        # move text
-        if self._settings.display_notation:
-            draw.text(
-                xy=(x_origin, y_origin * 0.5),
-                text=ply_string,
-                align="left",
-                font=self._move_text_font,
-                fill="black"
-            )
+        Returns:
+            (tuple): The start and end frames of the current settings.
 
-        if not self._settings.flip_perspective:
-            board = np.flip(board)
-
-        for row in range(0, 8):
-            for col in range(0, 8):
-                piece = board[row, col]
-                x = x_origin + self._settings.square_width * col
-                y = y_origin + self._settings.square_width * row
-                square_colour = self._settings.theme.white_square_colour if (row + col) % 2 == 0 \
-                    else self._settings.theme.black_square_colour
-                draw.rectangle(
-                    xy=(
-                        (x, y),
-                        (x + self._settings.square_width, y + self._settings.square_width)
-                    ),
-                    fill=square_colour
-                )
-                if piece is not None:
-                    draw.text(  # add outline to piece
-                        xy=(
-                            x_origin + self._settings.square_width * col + self._settings.square_width * 0.5,
-                            y_origin + self._settings.square_width * row + self._settings.square_width * 0.5
-                        ),
-                        text=piece.unicode,
-                        anchor="mm",
-                        align="center",
-                        font=self._unicode_font,
-                        fill="white",
-                        stroke_width=3,
-                    )
-                    draw.text(
-                        xy=(
-                            x_origin + self._settings.square_width * col + self._settings.square_width * 0.5,
-                            y_origin + self._settings.square_width * row + self._settings.square_width * 0.5
-                        ),
-                        text=piece.unicode,
-                        anchor="mm",
-                        align="center",
-                        font=self._unicode_font,
-                        fill="black",
-                    )
-                if col == 0:
-                    if self._settings.flip_perspective:
-                        row_text = "12345678"[row]
-                    else:
-                        row_text = "12345678"[7 - row]
-                    draw.text(
-                        xy=(
-                            x_origin - self._settings.square_width * 0.5,
-                            y_origin + self._settings.square_width * row + self._settings.square_width * 0.5
-                        ),
-                        text=row_text,
-                        anchor="mm",
-                        align="right",
-                        font=self._square_name_font,
-                        fill="black",
-                        stroke_width=0
-                    )
-                if row == 7:
-                    if self._settings.flip_perspective:
-                        col_text = "abcdefgh"[7 - col]
-                    else:
-                        col_text = "abcdefgh"[col]
-                    draw.text(
-                        xy=(
-                            x_origin + self._settings.square_width * col + self._settings.square_width * 0.5,
-                            y_origin + self._settings.square_width * 8 + self._settings.square_width * 0.5
-                        ),
-                        text=col_text,
-                        anchor="mm",
-                        align="center",
-                        font=self._square_name_font,
-                        fill="black",
-                        stroke_width=0
-                    )
-        return image
+        Raises:
+            ValueError: If the frame window is empty or isn't within the game.
+            InterpreterError: If a move up to the end frame can't be replayed.
+        """
 
-    def _draw_header(self, header_width: int, header_height: int) -> Image.Image:
+        start_frame, end_frame = self._settings.start_frame, self._settings.end_frame
+        self._replay_to(ply=end_frame)
+        if not 0 <= start_frame <= end_frame < len(self._history):
+            raise ValueError(f"Please choose frames between 0 and {self._ply_count - 1}.")
+        return start_frame, end_frame
+
+    def _header_texts(self, header_width: int, header_height: int) -> List[Tuple[str, ImageFont.FreeTypeFont, tuple]]:
         """
-        Draw a header for all frames including game metadata.
+        Lay out the lines of the header, each of which is centred on its position at its baseline.
 
         Metadata includes:
             - Player names
@@ -230,16 +421,13 @@ class ChessPlot:
             - Game result
 
         Args:
-            header_width (int): The width of the header to be drawn.
-            header_height (int): The height of the header to be drawn.
+            header_width (int): The width of the header.
+            header_height (int): The height of the header.
 
         Returns:
-            image (Image.Image): An image of the header.
+            texts (list): The text, font and position of the middle of the baseline of each line.
         """
 
-        image = Image.new(mode="RGB", size=(header_width, header_height), color="white")
-        draw = ImageDraw.ImageDraw(im=image)
-
         header_centre = header_width / 2
 
         # title text
@@ -249,135 +437,223 @@ class ChessPlot:
         else:
             title_text = f"{self.metadata.white} - {self.metadata.black}"
 
-        title_font = self._scale_font(
+        title_font = _scale_font(
             text=title_text,
             font_name="arial.ttf",
             max_width=int(header_width * 0.8),
             max_height=int(header_height * 0.5)
         )
-        draw.text(
-            xy=(header_centre, header_height * 0.4),
-            text=title_text,
-            anchor="ms",
-            align="center",
-            font=title_font,
-            fill="black"
-        )
 
         # sub-title text
         sub_title_text = f"{self.metadata.site}, {self.metadata.date}" \
             if self.metadata.date is not None else self.metadata.site
-        sub_title_font = self._scale_font(
+        sub_title_font = _scale_font(
             text=sub_title_text,
             font_name="ariali.ttf",
             max_width=int(header_width * 0.8),
             max_height=int(header_height * 0.25)
         )
-        draw.text(
-            xy=(header_centre, header_height * 0.7),
-            text=sub_title_text,
-            anchor="ms",
-            align="center",
-            font=sub_title_font,
-            fill="black"
-        )
 
         # result text
         result_text = self.metadata.result
-        result_font = self._scale_font(
+        result_font = _scale_font(
             text=result_text,
             font_name="arialbd.ttf",
             max_width=int(header_width * 0.8),
             max_height=int(header_height * 0.25)
         )
-        draw.text(
-            xy=(header_centre, header_height * 0.95),
-            text=result_text,
-            anchor="ms",
-            align="center",
-            font=result_font,
-            fill="black"
-        )
 
-        return image
+        return [
+            (title_text, title_font, (header_centre, header_height * 0.4)),
+            (sub_title_text, sub_title_font, (header_centre, header_height * 0.7)),
+            (result_text, result_font, (header_centre, header_height * 0.95)),
+        ]
 
-    def _draw(self, board: np.ndarray, ply_string: str = "") -> Image.Image:
+    def _draw_header(self, header_width: int, header_height: int) -> Image.Image:
         """
-        Draw an image of the board in its current state.
+        Draw a header for all frames including game metadata.
 
         Args:
-            board (np.ndarray): The game board state following the ply being drawn.
-            ply_string (str): A string describing the ply being drawn.
+            header_width (int): The width of the header to be drawn.
+            header_height (int): The height of the header to be drawn.
 
         Returns:
-            frame (Image.Image): An image depicting the game board in its current state.
+            image (Image.Image): An image of the header.
         """
 
-        board_image = self._draw_board(
-            board=board,
-            ply_string=ply_string,
-        )
+        image = Image.new(mode="RGB", size=(header_width, header_height), color="white")
+        draw = ImageDraw.ImageDraw(im=image)
+        for text, font, xy in self._header_texts(header_width=header_width, header_height=header_height):
+            draw.text(
+                xy=xy,
+                text=text,
+                anchor="ms",
+                align="center",
+                font=font,
+                fill="black"
+            )
+        return image
 
-        if not self._settings.display_header:
-            return board_image
+    def _iter_frames(self, workers: int = 1, cache_frames: bool = True) -> Iterator[Image.Image]:
+        """
+        Lazily draw a frame for each ply in the frame window of the current settings.
 
-        header_height = self._header_image.size[1]
+        A frame already cached with the same render settings is reused rather than redrawn, whichever frame window
+        it was drawn for. Drawn frames are cached too unless they are only streamed to an encoder. With more than
+        one worker, the frames are split into consecutive ranges which are drawn in a pool of processes, skipping
+        ranges which are already cached. Only a few ranges per worker are drawn ahead of the frames being used, so
+        the number of frames held in memory doesn't depend on the length of the game. The frames are identical to
+        those drawn in this process.
 
-        frame = Image.new(
-            mode="RGB",
-            size=(self._settings.plot_size, self._settings.plot_size + header_height),
-            color="white"
-        )
-        frame.paste(board_image, (0, header_height))
-        frame.paste(self._header_image, (0, 0))
+        Args:
+            workers (int): The number of processes to draw frames in (default 1 i.e. only this process).
+            cache_frames (bool): Indicator of whether drawn frames should be cached (default True).
 
-        return frame
+        Yields:
+            (Image.Image): An image of each frame.
 
-    def _draw_frames(self) -> None:
+        Raises:
+            ValueError: If the number of workers is less than 1.
+        """
+
+        if workers < 1:
+            raise ValueError("Please choose at least 1 worker.")
+
+        start_frame, end_frame = self._replay_frame_window()
+        render_key = self._settings.render_key
+        plies = range(len(self._history))[start_frame:end_frame + 1]
+        boards = self._history.iter_boards(start=start_frame, end=end_frame + 1)
+        renderer = None
+
+        if workers == 1:
+            previous_frame, previous_board = None, None
+            for ply, (ply_string, board) in zip(plies, boards):
+                frame = self._frame_cache.get(key=(ply, render_key))
+                if frame is None:
+                    if renderer is None:
+                        renderer = self._create_renderer()
+                    frame = renderer.draw(
+                        board=board,
+                        ply_string=ply_string,
+                        previous_frame=previous_frame,
+                        previous_board=previous_board
+                    )
+                    if cache_frames:
+                        self._frame_cache.put(key=(ply, render_key), frame=frame)
+                previous_frame, previous_board = frame, board
+                yield frame
+            return
+
+        boards = list(boards)
+        chunk_size = ChessPlot.__frames_per_chunk
+        executor = None
+        pending = deque()
+        try:
+            for start in range(0, len(boards), chunk_size):
+                keys = [(ply, render_key) for ply in plies[start:start + chunk_size]]
+                frames = [self._frame_cache.get(key=key) for key in keys]
+                if any(frame is None for frame in frames):
+                    if executor is None:
+                        executor = ProcessPoolExecutor(
+                            max_workers=workers,
+                            initializer=_start_worker,
+                            initargs=(self._create_renderer(),)
+                        )
+                    frames = executor.submit(_draw_frame_range, boards[start:start + chunk_size])
+                pending.append((keys, frames))
+                if len(pending) >= workers * 2:
+                    yield from self._collect_frames(*pending.popleft(), cache_frames=cache_frames)
+            while pending:
+                yield from self._collect_frames(*pending.popleft(), cache_frames=cache_frames)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    def _create_renderer(self) -> _Renderer:
         """
-        Draw a list of frames, one for each ply played in the game.
+        Create a renderer for the current settings, drawing the header if needed.
+
+        Returns:
+            (_Renderer): A renderer which draws frames with the current settings.
         """
 
         if self._settings.display_header:
-            header_height = int(self._settings.plot_size * 0.15)
             self._header_image = self._draw_header(
                 header_width=self._settings.plot_size,
-                header_height=header_height,
+                header_height=int(self._settings.plot_size * 0.15),
             )
+        return _Renderer(settings=self._settings, header_image=self._header_image)
+
+    def _collect_frames(
+            self,
+            keys: List[tuple],
+            frames: Union[List[Image.Image], Future],
+            cache_frames: bool
+    ) -> List[Image.Image]:
+        """
+        Collect a range of frames which were either cached or drawn by a worker, caching any drawn frames if needed.
 
-        # Create fonts
-        self._square_name_font = self._scale_font(
-            text="a",
-            font_name="arial.ttf",
-            max_width=int(self._settings.square_width * 0.4),
-            max_height=int(self._settings.square_width * 0.4)
-        )
-        self._unicode_font = self._scale_font(
-            text="♔",
-            font_name="seguisym.ttf",
-            max_width=self._settings.square_width,
-            max_height=self._settings.square_width
-        )
-        if self._settings.display_notation:
-            self._move_text_font = self._scale_font(
-                text="1. e4",
-                font_name="arial.ttf",
-                max_width=int(self._settings.square_width * 0.8),
-                max_height=int(self._settings.square_width * 0.8)
-            )
+        Args:
+            keys (list): The cache key of each frame.
+            frames (list | Future): The cached frames, or a future for the frames being drawn by a worker.
+            cache_frames (bool): Indicator of whether drawn frames should be cached.
+
+        Returns:
+            frames (list): An image of each frame.
+        """
 
-        self._frames = []
-        for ply_string, board in self._boards[self._settings.start_frame:self._settings.end_frame + 1]:
-            self._frames.append(self._draw(board=board, ply_string=ply_string))
+        if isinstance(frames, Future):
+            frames = frames.result()
+            for key, frame in zip(keys, frames if cache_frames else []):
+                self._frame_cache.put(key=key, frame=frame)
+        return frames
 
-        return
+    def _draw_frames(self, workers: int = 1, cache_frames: bool = True) -> List[Image.Image]:
+        """
+        Draw a list of frames, one for each ply in the frame window of the current settings.
+
+        Args:
+            workers (int): The number of processes to draw frames in (default 1 i.e. only this process).
+            cache_frames (bool): Indicator of whether drawn frames should be cached (default True).
+
+        Returns:
+            frames (list): An image of each frame.
+
+        Raises:
+            ValueError: If the number of workers is less than 1.
+        """
+
+        return list(self._iter_frames(workers=workers, cache_frames=cache_frames))
+
+    def _draw_frame(self, frame: int, cache_frames: bool = True) -> Image.Image:
+        """
+        Draw a single frame with the render settings of the current settings, whatever the frame window.
+
+        The game must already have been replayed as far as the frame.
+
+        Args:
+            frame (int): The frame to be drawn.
+            cache_frames (bool): Indicator of whether a drawn frame should be cached (default True).
+
+        Returns:
+            image (Image.Image): An image of the frame.
+        """
+
+        key = (frame, self._settings.render_key)
+        image = self._frame_cache.get(key=key)
+        if image is None:
+            (ply_string, board), = self._history.iter_boards(start=frame, end=frame + 1)
+            image = self._create_renderer().draw(board=board, ply_string=ply_string)
+            if cache_frames:
+                self._frame_cache.put(key=key, frame=image)
+        return image
 
     def _update_plot_settings(self, **kwargs: Generic[T]) -> bool:
         """
         Update plot settings.
 
-        Only make updates if a change has occurred. If settings haven't changed, then we don't
-        need to recreate frames.
+        Only make updates if a change has occurred. Frames are cached by their render settings, so a change
+        to only the start or end frame never causes a frame to be redrawn.
 
         Args:
             **kwargs (dict): A set of keyword arguments containing various plot settings.
@@ -393,11 +669,17 @@ class ChessPlot:
 
         Returns:
             settings_change (bool): Indicator of whether any settings have changed.
+
+        Raises:
+            ValueError: If the ChessPlot was created with metadata_only.
         """
 
+        if self._ply_count is None:
+            raise ValueError("This ChessPlot was created with metadata_only=True so it cannot be plotted.")
+
         new_settings = _Settings(**kwargs)
         if new_settings.end_frame is None:
-            new_settings.update_end_frame(end_frame=len(self._boards) - 1)
+            new_settings.update_end_frame(end_frame=self._ply_count - 1)
 
         if new_settings == self._settings:
             return False
@@ -406,15 +688,207 @@ class ChessPlot:
 
         return True
 
-    def to_gif(self, save_path: str = None, duration: int = 2000, **kwargs: Generic[T]) -> None:
+    def _save(self, save_path: Union[str, BinaryIO, None], extension: str, write: Callable[[BinaryIO], None]) -> None:
+        """
+        Write an output to a path or a writable file-like object.
+
+        If writing to a path fails, the partly written file is removed.
+
+        Args:
+            save_path (str | BinaryIO): A path, a writable binary file-like object, or None to use a path beside the
+                input .pgn file.
+            extension (str): The file extension used for a default path e.g. '.gif'.
+            write (Callable): A function which writes the output to an open binary file.
+
+        Raises:
+            ValueError: If no save path is given and the game wasn't read from a .pgn file.
+        """
+
+        if save_path is not None and hasattr(save_path, "write"):
+            write(save_path)
+            return
+        if save_path is None:
+            save_path = self._default_save_path(extension=extension)
+        with open(save_path, "wb") as file:
+            try:
+                write(file)
+            except BaseException:  # don't leave a partly written file behind
+                file.close()
+                os.remove(save_path)
+                raise
+        return
+
+    def _encode_frames(self, frames: Iterator[Image.Image], encode: Callable[[Iterator[Image.Image]], None]) -> None:
+        """
+        Encode frames while they are being drawn, recording the time of each stage.
+
+        Args:
+            frames (Iterator): A generator which draws each frame, in order.
+            encode (Callable): A function which encodes every frame of an iterator.
+        """
+
+        self.timings = _run_pipeline(frames=frames, encode=encode, max_queued=ChessPlot.__frames_queued)
+        return
+
+    def _write_gif(self, file: BinaryIO, frames: Iterable[Image.Image], duration: int) -> None:
+        """
+        Encode a set of frames as a .gif.
+
+        Args:
+            file (BinaryIO): A writable binary file.
+            frames (Iterable): The frames to be encoded, in order.
+            duration (int): The time in milliseconds each frame of the .gif should last.
+
+        Raises:
+            ValueError: If there are no frames, in which case nothing is written.
+        """
+
+        frames = iter(frames)
+        last_frame = next(frames, None)
+        if last_frame is None:
+            raise ValueError("A .gif must contain at least one frame.")
+        writer = _GifWriter(
+            file=file,
+            duration=duration,
+            palette=_theme_palette(theme=self._settings.theme),
+            loop=0  # infinite loop
+        )
+        writer.write(frame=last_frame)
+        for last_frame in frames:
+            writer.write(frame=last_frame)
+        writer.write(frame=last_frame)  # add last frame twice before loop restarts
+        writer.close()
+        return
+
+    def _write_pdf(self, file: BinaryIO) -> None:
+        """
+        Draw the frame window of the current settings as a vector .pdf with one page per frame.
+
+        Pages are drawn straight from the board snapshots rather than from raster frames, and each page is written
+        as soon as it is drawn.
+
+        Args:
+            file (BinaryIO): A writable binary file.
+        """
+
+        start_frame, end_frame = self._replay_frame_window()
+        header_texts = []
+        if self._settings.display_header:
+            header_texts = self._header_texts(
+                header_width=self._settings.plot_size,
+                header_height=int(self._settings.plot_size * 0.15)
+            )
+        writer = _PdfWriter(file=file, resolution=ChessPlot.__pdf_resolution)
+        renderer = _PdfRenderer(settings=self._settings, header_texts=header_texts, writer=writer)
+        for ply_string, board in self._history.iter_boards(start=start_frame, end=end_frame + 1):
+            renderer.draw(board=board, ply_string=ply_string)
+        writer.close()
+        return
+
+    def _iter_svg_frames(self) -> Iterator[str]:
+        """
+        Lazily draw an .svg document for each ply in the frame window of the current settings.
+
+        Documents are built straight from the board snapshots rather than from raster frames.
+
+        Yields:
+            (str): The .svg document of each frame.
+        """
+
+        start_frame, end_frame = self._replay_frame_window()
+        header_texts = []
+        if self._settings.display_header:
+            header_texts = self._header_texts(
+                header_width=self._settings.plot_size,
+                header_height=int(self._settings.plot_size * 0.15)
+            )
+        renderer = _SvgRenderer(settings=self._settings, header_texts=header_texts)
+        for ply_string, board in self._history.iter_boards(start=start_frame, end=end_frame + 1):
+            yield renderer.draw(board=board, ply_string=ply_string)
+
+    def _sequence_paths(
+            self,
+            directory: Union[str, None],
+            pattern: str,
+            frames: Union[Iterable[int], None],
+            extension: str,
+            **kwargs: Generic[T]
+    ) -> Tuple[int, int, Dict[int, str]]:
+        """
+        Check the arguments of a sequence of frames to be saved, update the plot settings and create the directory
+        the files are saved in.
+
+        Args:
+            directory (str): A directory where the files should be saved, or None to use a directory beside the
+                input .pgn file named after it.
+            pattern (str): A format string for the name of each file, given the frame number as frame.
+            frames (Iterable): The frames to be plotted, or None for every frame from start_frame to end_frame.
+            extension (str): The extension of each file e.g. ".png".
+
+        Keyword Args:
+            See to_png_sequence.
+
+        Returns:
+            start_frame (int): The first frame to be drawn.
+            end_frame (int): The last frame to be drawn.
+            save_paths (dict): The path each selected frame should be saved to, keyed by frame in order.
+
+        Raises:
+            ValueError: If the pattern or frames are invalid, or frames are given with a start or end frame.
+        """
+
+        if pattern.format(frame=0) == pattern.format(frame=1):
+            raise ValueError(f"The pattern must include the frame number e.g. 'frame_{{frame:04d}}{extension}'.")
+
+        if frames is not None:
+            if "start_frame" in kwargs or "end_frame" in kwargs:
+                raise ValueError("Please choose either frames or a start_frame and end_frame, not both.")
+            frames = sorted(set(frames))
+            if not frames:
+                raise ValueError("Please choose at least one frame.")
+            kwargs["start_frame"] = frames[0]
+            kwargs["end_frame"] = frames[-1]
+        self._update_plot_settings(**kwargs)
+        start_frame, end_frame = self._replay_frame_window()
+        if frames is None:
+            frames = range(start_frame, end_frame + 1)
+
+        if directory is None:
+            directory = self._default_save_path(extension="")
+        os.makedirs(directory, exist_ok=True)
+        save_paths = {frame: os.path.join(directory, pattern.format(frame=frame)) for frame in frames}
+        return start_frame, end_frame, save_paths
+
+    @staticmethod
+    def _write_png(file: BinaryIO, image: Image.Image) -> None:
+        """
+        Encode a frame as a .png.
+
+        Args:
+            file (BinaryIO): A writable binary file.
+            image (Image.Image): The frame to be encoded.
+        """
+
+        image.save(fp=file, format="png")
+        return
+
+    def to_gif(
+            self,
+            save_path: Union[str, BinaryIO] = None,
+            duration: int = 2000,
+            workers: int = 1,
+            **kwargs: Generic[T]
+    ) -> None:
         """
         Save the ChessPlot to a gif at a given location.
 
         If the given location is None, the location of the input .pgn file will be used with the .gif extension.
 
         Args:
-            save_path (str): A location where the produced .gif should be saved (default None).
+            save_path (str | BinaryIO): A location or writable binary file-like object where the produced .gif
+                should be saved (default None).
             duration (int): The time in milliseconds each frame of the .gif should last (default 2000).
+            workers (int): The number of processes to draw frames in (default 1).
 
         Keyword Args:
             plot_size (int): The width each frame of the gif should be (default 800).
@@ -426,33 +900,52 @@ class ChessPlot:
             theme (str): The theme to be used for the plot.
         """
 
-        settings_change = self._update_plot_settings(**kwargs)
-
-        if settings_change:
-            self._draw_frames()
-
-        if save_path is None:
-            save_path = self.pgn.replace(".pgn", ".gif")
-
-        save_images = self._frames + [self._frames[-1]]  # add last element twice before loop restarts
-        save_images[0].save(
-            fp=save_path,
-            format="gif",
-            save_all=True,
-            append_images=save_images[1:],
-            duration=duration,  # 1 second per loop
-            loop=0  # infinite loop
+        self._update_plot_settings(**kwargs)
+        self._save(
+            save_path=save_path,
+            extension=".gif",
+            write=lambda file: self._encode_frames(
+                frames=self._iter_frames(workers=workers, cache_frames=False),
+                encode=lambda frames: self._write_gif(file=file, frames=frames, duration=duration)
+            )
         )
         return
 
-    def to_pdf(self, save_path: str = None, **kwargs: Generic[T]) -> None:
+    def to_gif_bytes(self, duration: int = 2000, workers: int = 1, **kwargs: Generic[T]) -> bytes:
+        """
+        Encode the ChessPlot as a gif in memory.
+
+        Args:
+            duration (int): The time in milliseconds each frame of the .gif should last (default 2000).
+            workers (int): The number of processes to draw frames in (default 1).
+
+        Keyword Args:
+            plot_size (int): The width each frame of the gif should be (default 800).
+            board_only (bool): Indicator of whether only the board should be plotted (default False).
+            display_notation (bool): Indicator of whether to display move notation on the plot (default True).
+            flip_perspective (bool): Indicator of whether the board perspective should be flipped (default False).
+            start_frame (int): The frame on which the gif should begin (default 0).
+            end_frame (int) The frame on which the gif should end (default None).
+            theme (str): The theme to be used for the plot.
+
+        Returns:
+            (bytes): The contents of the .gif.
+        """
+
+        buffer = io.BytesIO()
+        self.to_gif(save_path=buffer, duration=duration, workers=workers, **kwargs)
+        return buffer.getvalue()
+
+    def to_pdf(self, save_path: Union[str, BinaryIO] = None, **kwargs: Generic[T]) -> None:
         """
         Save the ChessPlot to a pdf at a given location.
 
         If the given location is None, the location of the input .pgn file will be used with the .pdf extension.
+        Each page is drawn with vector graphics, so it stays sharp at any zoom.
 
         Args:
-            save_path (str): A location where the produced .pdf should be saved.
+            save_path (str | BinaryIO): A location or writable binary file-like object where the produced .pdf
+                should be saved.
 
         Keyword Args:
             plot_size (int): The width each frame of the gif should be (default 800).
@@ -464,25 +957,32 @@ class ChessPlot:
             theme (str): The theme to be used for the plot.
         """
 
-        settings_change = self._update_plot_settings(**kwargs)
+        self._update_plot_settings(**kwargs)
+        self._save(save_path=save_path, extension=".pdf", write=self._write_pdf)
+        return
 
-        if settings_change:
-            self._draw_frames()
+    def to_pdf_bytes(self, **kwargs: Generic[T]) -> bytes:
+        """
+        Encode the ChessPlot as a pdf in memory.
 
-        if save_path is None:
-            save_path = self.pgn.replace(".pgn", ".pdf")
-
-        save_images = self._frames
-        save_images[0].save(
-            fp=save_path,
-            format="pdf",
-            save_all=True,
-            append_images=save_images[1:],
-            resolution=1800
-        )
-        return
+        Keyword Args:
+            plot_size (int): The width each frame of the gif should be (default 800).
+            board_only (bool): Indicator of whether only the board should be plotted (default False).
+            display_notation (bool): Indicator of whether to display move notation on the plot (default True).
+            flip_perspective (bool): Indicator of whether the board perspective should be flipped (default False).
+            start_frame (int): The frame on which the gif should begin (default 0).
+            end_frame (int) The frame on which the gif should end (default None).
+            theme (str): The theme to be used for the plot.
+
+        Returns:
+            (bytes): The contents of the .pdf.
+        """
+
+        buffer = io.BytesIO()
+        self.to_pdf(save_path=buffer, **kwargs)
+        return buffer.getvalue()
 
-    def to_png(self, frame: int, save_path: str = None, **kwargs: Generic[T]):
+    def to_png(self, frame: int, save_path: Union[str, BinaryIO] = None, **kwargs: Generic[T]):
         """
         Save a ChessPlot frame to a .png file at a given location.
 
@@ -490,7 +990,8 @@ class ChessPlot:
 
         Args:
             frame (int): The frame to be plotted.
-            save_path (str): A location where the produced .pdf should be saved.
+            save_path (str | BinaryIO): A location or writable binary file-like object where the produced .png
+                should be saved.
 
         Keyword Args:
             plot_size (int): The width each frame of the gif should be (default 800).
@@ -502,14 +1003,331 @@ class ChessPlot:
 
         kwargs["start_frame"] = frame
         kwargs["end_frame"] = frame
-        settings_change = self._update_plot_settings(**kwargs)
+        self._update_plot_settings(**kwargs)
+        self._save(
+            save_path=save_path,
+            extension=".png",
+            write=lambda file: self._write_png(file=file, image=self._draw_frames()[0])
+        )
+        return
 
-        if settings_change:
-            self._draw_frames()
+    def to_png_bytes(self, frame: int, **kwargs: Generic[T]) -> bytes:
+        """
+        Encode a ChessPlot frame as a png in memory.
 
-        if save_path is None:
-            save_path = self.pgn.replace(".pgn", ".png")
+        Args:
+            frame (int): The frame to be plotted.
+
+        Keyword Args:
+            plot_size (int): The width each frame of the gif should be (default 800).
+            board_only (bool): Indicator of whether only the board should be plotted (default False).
+            display_notation (bool): Indicator of whether to display move notation on the plot (default True).
+            flip_perspective (bool): Indicator of whether the board perspective should be flipped (default False).
+            theme (str): The theme to be used for the plot.
+
+        Returns:
+            (bytes): The contents of the .png.
+        """
+
+        buffer = io.BytesIO()
+        self.to_png(frame=frame, save_path=buffer, **kwargs)
+        return buffer.getvalue()
+
+    def to_png_sequence(
+            self,
+            directory: str = None,
+            pattern: str = "frame_{frame:04d}.png",
+            frames: Iterable[int] = None,
+            compress_level: int = 6,
+            workers: int = 1,
+            **kwargs: Generic[T]
+    ) -> List[str]:
+        """
+        Save a set of ChessPlot frames to .png files in a given directory.
+
+        The frames are drawn in a single pass and encoded concurrently in a pool of threads. If the given
+        directory is None, a directory beside the input .pgn file named after it will be used. The directory is
+        created if it doesn't exist.
+
+        Args:
+            directory (str): A directory where the produced .png files should be saved (default None).
+            pattern (str): A format string for the name of each file, given the frame number as frame
+                (default "frame_{frame:04d}.png").
+            frames (Iterable): The frames to be plotted (default None i.e. every frame from start_frame to
+                end_frame).
+            compress_level (int): The zlib compression level from 0 (fastest) to 9 (smallest) (default 6).
+            workers (int): The number of processes to draw frames in (default 1).
+
+        Keyword Args:
+            plot_size (int): The width each frame should be (default 800).
+            board_only (bool): Indicator of whether only the board should be plotted (default False).
+            display_notation (bool): Indicator of whether to display move notation on the plot (default True).
+            flip_perspective (bool): Indicator of whether the board perspective should be flipped (default False).
+            start_frame (int): The first frame to be plotted, which can't be given with frames (default 0).
+            end_frame (int) The last frame to be plotted, which can't be given with frames (default None).
+            theme (str): The theme to be used for the plot.
+
+        Returns:
+            save_paths (list): The path of each file saved, in order of frame.
+
+        Raises:
+            ValueError: If the compression level, pattern or frames are invalid, or frames are given with a start or
+                end frame.
+        """
+
+        if not 0 <= compress_level <= 9:
+            raise ValueError("Please choose a compression level between 0 and 9.")
+        start_frame, end_frame, save_paths = self._sequence_paths(
+            directory=directory,
+            pattern=pattern,
+            frames=frames,
+            extension=".png",
+            **kwargs
+        )
+
+        threads = os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            pending = deque()
+            images = self._iter_frames(workers=workers, cache_frames=False)
+            for frame, image in zip(range(start_frame, end_frame + 1), images):
+                if frame not in save_paths:
+                    continue
+                pending.append(
+                    executor.submit(image.save, fp=save_paths[frame], format="png", compress_level=compress_level)
+                )
+                if len(pending) >= threads * 2:  # limit the frames waiting to be encoded
+                    pending.popleft().result()
+            while pending:
+                pending.popleft().result()
+        return list(save_paths.values())
+
+    def to_array(self, **kwargs: Generic[T]) -> np.ndarray:
+        """
+        Draw the frames of the ChessPlot into a single NumPy array e.g. for encoding video or as model input.
+
+        The frames are composited straight into the array rather than drawn as images, and are identical to the
+        frames of the other outputs. The array holds every frame at once, so it takes about 2 MB per frame at the
+        default plot size.
+
+        Keyword Args:
+            plot_size (int): The width each frame should be (default 800).
+            board_only (bool): Indicator of whether only the board should be plotted (default False).
+            display_notation (bool): Indicator of whether to display move notation on the plot (default True).
+            flip_perspective (bool): Indicator of whether the board perspective should be flipped (default False).
+            start_frame (int): The first frame to be drawn (default 0).
+            end_frame (int) The last frame to be drawn (default None).
+            theme (str): The theme to be used for the plot.
+
+        Returns:
+            frames (np.ndarray): The RGB pixels of each frame as unsigned 8-bit integers, with shape
+                (frames, height, width, 3).
+        """
+
+        self._update_plot_settings(**kwargs)
+        start_frame, end_frame = self._replay_frame_window()
+        boards = list(self._history.iter_boards(start=start_frame, end=end_frame + 1))
+        return self._create_renderer().draw_stack(boards=boards)
+
+    def to_svg(self, frame: int, save_path: Union[str, BinaryIO] = None, **kwargs: Generic[T]) -> None:
+        """
+        Save a ChessPlot frame to a .svg file at a given location.
+
+        If the given location is None, the location of the input .pgn file will be used with the .svg extension.
+
+        Args:
+            frame (int): The frame to be plotted.
+            save_path (str | BinaryIO): A location or writable binary file-like object where the produced .svg
+                should be saved.
+
+        Keyword Args:
+            plot_size (int): The width each frame should be (default 800).
+            board_only (bool): Indicator of whether only the board should be plotted (default False).
+            display_notation (bool): Indicator of whether to display move notation on the plot (default True).
+            flip_perspective (bool): Indicator of whether the board perspective should be flipped (default False).
+            theme (str): The theme to be used for the plot.
+        """
+
+        kwargs["start_frame"] = frame
+        kwargs["end_frame"] = frame
+        self._update_plot_settings(**kwargs)
+        self._save(
+            save_path=save_path,
+            extension=".svg",
+            write=lambda file: file.write(next(self._iter_svg_frames()).encode("utf-8"))
+        )
+        return
+
+    def to_svg_sequence(
+            self,
+            directory: str = None,
+            pattern: str = "frame_{frame:04d}.svg",
+            frames: Iterable[int] = None,
+            **kwargs: Generic[T]
+    ) -> List[str]:
+        """
+        Save a set of ChessPlot frames to .svg files in a given directory.
+
+        If the given directory is None, a directory beside the input .pgn file named after it will be used. The
+        directory is created if it doesn't exist.
+
+        Args:
+            directory (str): A directory where the produced .svg files should be saved (default None).
+            pattern (str): A format string for the name of each file, given the frame number as frame
+                (default "frame_{frame:04d}.svg").
+            frames (Iterable): The frames to be plotted (default None i.e. every frame from start_frame to
+                end_frame).
+
+        Keyword Args:
+            plot_size (int): The width each frame should be (default 800).
+            board_only (bool): Indicator of whether only the board should be plotted (default False).
+            display_notation (bool): Indicator of whether to display move notation on the plot (default True).
+            flip_perspective (bool): Indicator of whether the board perspective should be flipped (default False).
+            start_frame (int): The first frame to be plotted, which can't be given with frames (default 0).
+            end_frame (int) The last frame to be plotted, which can't be given with frames (default None).
+            theme (str): The theme to be used for the plot.
+
+        Returns:
+            save_paths (list): The path of each file saved, in order of frame.
+
+        Raises:
+            ValueError: If the pattern or frames are invalid, or frames are given with a start or end frame.
+        """
+
+        start_frame, end_frame, save_paths = self._sequence_paths(
+            directory=directory,
+            pattern=pattern,
+            frames=frames,
+            extension=".svg",
+            **kwargs
+        )
+
+        for frame, document in zip(range(start_frame, end_frame + 1), self._iter_svg_frames()):
+            if frame not in save_paths:
+                continue
+            with open(save_paths[frame], "w", encoding="utf-8") as file:
+                file.write(document)
+        return list(save_paths.values())
+
+    def to_svg_diffs(self, **kwargs: Generic[T]) -> List[str]:
+        """
+        Encode the ChessPlot as the .svg document of its first frame followed by a diff for each following frame.
+
+        Each diff is a unified diff without context from the document of the previous frame. As every element of a
+        document is on its own line, a diff only holds the lines of the pieces which moved and the move text, so
+        the frames can be sent as compact move-by-move updates and rebuilt by applying each diff in turn.
+
+        Keyword Args:
+            plot_size (int): The width each frame should be (default 800).
+            board_only (bool): Indicator of whether only the board should be plotted (default False).
+            display_notation (bool): Indicator of whether to display move notation on the plot (default True).
+            flip_perspective (bool): Indicator of whether the board perspective should be flipped (default False).
+            start_frame (int): The first frame to be plotted (default 0).
+            end_frame (int) The last frame to be plotted (default None).
+            theme (str): The theme to be used for the plot.
+
+        Returns:
+            updates (list): The .svg document of the first frame, then the diff to each following frame.
+        """
+
+        self._update_plot_settings(**kwargs)
+        updates = []
+        previous_lines = None
+        for frame, document in enumerate(self._iter_svg_frames(), start=self._settings.start_frame):
+            lines = document.splitlines(keepends=True)
+            if previous_lines is None:
+                updates.append(document)
+            else:
+                updates.append(
+                    "".join(
+                        difflib.unified_diff(
+                            previous_lines,
+                            lines,
+                            fromfile=f"frame_{frame - 1}.svg",
+                            tofile=f"frame_{frame}.svg",
+                            n=0
+                        )
+                    )
+                )
+            previous_lines = lines
+        return updates
+
+    def export(
+            self,
+            targets: Dict[str, Union[str, BinaryIO, None]],
+            duration: int = 2000,
+            png_frame: int = None,
+            workers: int = 1,
+            **kwargs: Generic[T]
+    ) -> None:
+        """
+        Save the ChessPlot in several formats at once.
+
+        Every format is encoded concurrently in a pool of threads, so exporting takes about as long as drawing the
+        frames and running the slowest encoder. When a .gif is exported, each frame is passed to its encoder through
+        a bounded queue as soon as it is drawn, and the .png encoder is started with its frame as it goes by, so only
+        a few frames are held in memory. Otherwise only the .png frame is drawn. The .pdf is drawn with vector graphics
+        alongside the other formats. Each thread loads its own fonts, and a file which fails part way through being
+        written is removed.
+
+        Args:
+            targets (dict): A location or writable binary file-like object for each format to be saved, keyed by
+                "gif", "pdf" or "png". A location of None uses the location of the input .pgn file.
+            duration (int): The time in milliseconds each frame of the .gif should last (default 2000).
+            png_frame (int): The frame saved to the .png (default None i.e. the last frame).
+            workers (int): The number of processes to draw frames in (default 1).
+
+        Keyword Args:
+            plot_size (int): The width each frame should be (default 800).
+            board_only (bool): Indicator of whether only the board should be plotted (default False).
+            display_notation (bool): Indicator of whether to display move notation on the plot (default True).
+            flip_perspective (bool): Indicator of whether the board perspective should be flipped (default False).
+            start_frame (int): The frame on which the .gif and .pdf should begin (default 0).
+            end_frame (int) The frame on which the .gif and .pdf should end (default None).
+            theme (str): The theme to be used for the plot.
+
+        Raises:
+            ValueError: If no formats or an unrecognised format are given, or the .png frame isn't drawn.
+        """
 
-        image = self._frames[0]
-        image.save(fp=save_path, format="png")
+        if not targets:
+            raise ValueError("Please choose at least one format to export.")
+        unrecognised = set(targets) - {"gif", "pdf", "png"}
+        if unrecognised:
+            raise ValueError(f"{sorted(unrecognised)} are not recognised formats. Please choose from gif, pdf or png.")
+
+        self._update_plot_settings(**kwargs)
+        start_frame, end_frame = self._replay_frame_window()
+        if png_frame is None:
+            png_frame = end_frame
+        if not start_frame <= png_frame <= end_frame:
+            raise ValueError(f"Please choose a png frame between {start_frame} and {end_frame}.")
+
+        with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+            futures = {}
+
+            def save(name: str, write: Callable[[BinaryIO], None]) -> None:
+                futures[name] = executor.submit(self._save, save_path=targets[name], extension=f".{name}", write=write)
+
+            def gif_frames() -> Iterator[Image.Image]:
+                frames = self._iter_frames(workers=workers, cache_frames=False)
+                for frame, image in zip(range(start_frame, end_frame + 1), frames):
+                    if frame == png_frame and "png" in targets:  # the .png is only encoded once its frame is drawn
+                        save(name="png", write=functools.partial(self._write_png, image=image))
+                    yield image
+
+            if "gif" in targets:
+                save(name="gif", write=lambda file: self._encode_frames(
+                    frames=gif_frames(),
+                    encode=lambda frames: self._write_gif(file=file, frames=frames, duration=duration)
+                ))
+            elif "png" in targets:
+                save(name="png", write=lambda file: self._write_png(
+                    file=file,
+                    image=self._draw_frame(frame=png_frame, cache_frames=False)
+                ))
+            if "pdf" in targets:
+                save(name="pdf", write=self._write_pdf)
+            for name in ("gif", "pdf", "png"):  # the .png encoder is only submitted by the .gif, so it's waited on last
+                if name in futures:
+                    futures[name].result()
         return
@@ -0,0 +1,234 @@
+"""Module for writing animated .gif files one frame at a time"""
+
+import struct
+import functools
+import numpy as np
+from typing import BinaryIO, Tuple
+from PIL import Image, ImageChops, ImageColor, ImageFile
+from .settings import _Theme
+
+
+_HEADER = struct.Struct("<6sHHBBB")  # signature, width, height, flags, background index, aspect ratio
+_LOOP_EXTENSION = struct.Struct("<3s11sBBHB")  # introducer, application, block size, sub-block id, loops, end
+_GRAPHIC_CONTROL = struct.Struct("<3sBHBB")  # introducer, flags, delay, transparent index, end
+_IMAGE_DESCRIPTOR = struct.Struct("<sHHHHB")  # separator, left, top, width, height, flags
+_LZW_MINIMUM_CODE_SIZE = 8
+_PALETTE_SIZE = 256
+_TRANSPARENT_INDEX = _PALETTE_SIZE - 1
+_DO_NOT_DISPOSE = 1
+_RAMP_STEPS = {  # the number of shades between each pair of colours which can be blended on a frame
+    ("white", "black"): 63,
+    ("white", "white_square"): 37,
+    ("white", "black_square"): 37,
+    ("black", "white_square"): 37,
+    ("black", "black_square"): 37,
+    ("white_square", "black_square"): 37,
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _theme_palette(theme: _Theme) -> np.ndarray:
+    """
+    Build a palette containing every colour which can appear on a frame of a given theme.
+
+    Frames are drawn in white, black and the two square colours of the theme, so every pixel is one of these or
+    an anti-aliased blend of two of them. The palette holds each colour and evenly spaced shades between each
+    pair, leaving at least one index of the colour table free to mark transparent pixels.
+
+    Args:
+        theme (_Theme): The theme of the plot.
+
+    Returns:
+        palette (np.ndarray): An array of the RGB values of each colour in the palette.
+    """
+
+    colours = {
+        "white": (255, 255, 255),
+        "black": (0, 0, 0),
+        "white_square": ImageColor.getrgb(theme.white_square_colour),
+        "black_square": ImageColor.getrgb(theme.black_square_colour),
+    }
+    palette = list(colours.values())
+    for (start_name, end_name), steps in _RAMP_STEPS.items():
+        start, end = colours[start_name], colours[end_name]
+        for step in range(1, steps + 1):
+            fraction = step / (steps + 1)
+            palette.append(tuple(round(a + (b - a) * fraction) for a, b in zip(start, end)))
+    return np.array(palette, dtype=np.int32)
+
+
+class _GifWriter:
+    """A class for streaming the frames of an animated .gif to a file as they are drawn.
+
+    Every frame shares a single global palette, built from the colours of the theme, so each colour on a frame
+    is simply mapped to the nearest colour of the palette rather than each frame being given an adaptive palette.
+    After the first frame, only the smallest rectangle containing every changed pixel is quantised and stored,
+    with unchanged pixels inside it marked transparent so the previous frame shows through. A frame identical
+    to the one before it extends the duration of that frame instead.
+
+    The header, global palette and loop extension are written with the first frame and each frame is encoded as
+    soon as the frame after it is known, so memory use doesn't depend on the number of frames.
+
+    Attributes:
+        _file (BinaryIO): The file being written to.
+        _duration (int): The time in milliseconds each frame should last.
+        _palette (np.ndarray): The RGB values of each colour in the global palette.
+        _loop (int): The number of times the animation should loop, where 0 loops forever.
+        _previous_frame (Image.Image): The last distinct frame.
+        _previous_indices (Image.Image): The palette indices of the last distinct frame, as an L image.
+        _pending_image (Image.Image): The palette indices of the frame waiting to be written, cropped to the
+            region which changed.
+        _pending_box (tuple): The position of the pending image within the frame.
+        _pending_duration (int): The duration of the pending frame.
+        _colour_keys (np.ndarray): The sorted RGB values of every colour which has been seen, packed into integers
+            and followed by a key greater than any colour.
+        _colour_indices (np.ndarray): The palette index of each colour of _colour_keys.
+    """
+
+    def __init__(self, file: BinaryIO, duration: int, palette: np.ndarray, loop: int = 0) -> None:
+        """
+        Constructor method for the _GifWriter class.
+
+        Args:
+            file (BinaryIO): A file opened for writing in binary mode.
+            duration (int): The time in milliseconds each frame should last.
+            palette (np.ndarray): The RGB values of at most 255 colours to be used by every frame.
+            loop (int): The number of times the animation should loop, where 0 loops forever (default 0).
+
+        Raises:
+            ValueError: If the palette leaves no index free for transparent pixels.
+        """
+
+        if len(palette) >= _PALETTE_SIZE:
+            raise ValueError(f"A palette can hold at most {_PALETTE_SIZE - 1} colours.")
+        self._file = file
+        self._duration = duration
+        self._palette = palette
+        self._loop = loop
+        self._previous_frame = None
+        self._previous_indices = None
+        self._pending_image = None
+        self._pending_box = None
+        self._pending_duration = 0
+        self._colour_keys = np.array([1 << 24], dtype=np.int32)  # no colour is seen yet
+        self._colour_indices = np.array([_TRANSPARENT_INDEX], dtype=np.uint8)
+
+    def write(self, frame: Image.Image) -> None:
+        """
+        Add a frame to the end of the animation.
+
+        Args:
+            frame (Image.Image): An RGB image of the frame, the same size as every other frame.
+        """
+
+        if self._previous_frame is None:
+            self._write_header(size=frame.size)
+            self._previous_indices = self._quantise(image=frame)
+            self._pending_image, self._pending_box = self._previous_indices.copy(), (0, 0) + frame.size
+            self._pending_duration = self._duration
+            self._previous_frame = frame
+            return
+
+        box = ImageChops.difference(image1=frame, image2=self._previous_frame).getbbox()
+        if box is None:
+            self._pending_duration += self._duration
+            return
+
+        self._write_pending_frame()
+        indices = self._quantise(image=frame.crop(box=box))
+        difference = ImageChops.difference(image1=indices, image2=self._previous_indices.crop(box=box))
+        self._previous_indices.paste(im=indices, box=box)
+        image = indices.copy()
+        image.paste(im=_TRANSPARENT_INDEX, mask=difference.point(lambda value: 255 if value == 0 else 0))
+        self._pending_image, self._pending_box = image, box
+        self._pending_duration = self._duration
+        self._previous_frame = frame
+        return
+
+    def close(self) -> None:
+        """
+        Write the last frame and the end of the file.
+
+        Raises:
+            ValueError: If no frames have been written.
+        """
+
+        if self._pending_image is None:
+            raise ValueError("A .gif must contain at least one frame.")
+        self._write_pending_frame()
+        self._file.write(b";")
+        if hasattr(self._file, "flush"):
+            self._file.flush()
+        return
+
+    def _write_header(self, size: Tuple[int, int]) -> None:
+        """
+        Write the header, global palette and loop extension of the file.
+
+        Args:
+            size (tuple): The width and height of each frame.
+        """
+
+        palette_bits = (_PALETTE_SIZE - 1).bit_length()
+        self._file.write(_HEADER.pack(b"GIF89a", size[0], size[1], 0x80 | (palette_bits - 1), 0, 0))
+        colour_table = self._palette.astype(np.uint8).tobytes()
+        self._file.write(colour_table.ljust(_PALETTE_SIZE * 3, b"\0"))
+        self._file.write(_LOOP_EXTENSION.pack(b"!\xff\x0b", b"NETSCAPE2.0", 3, 1, self._loop, 0))
+        return
+
+    def _write_pending_frame(self) -> None:
+        """
+        Encode the pending frame.
+
+        Every frame is left in place when the next is drawn, so transparent pixels show the frame before.
+
+        The image data is compressed by Pillow's LZW encoder, which has no public interface, so it is run through
+        the private ImageFile._save in the same way as by GifImagePlugin._write_frame_data. This call is unchanged
+        from Pillow 9.4, the oldest version supported, to Pillow 11.
+        """
+
+        image, box = self._pending_image, self._pending_box
+        self._file.write(
+            _GRAPHIC_CONTROL.pack(
+                b"!\xf9\x04",
+                _DO_NOT_DISPOSE << 2 | 1,  # transparent index in use
+                int(self._pending_duration / 10),
+                _TRANSPARENT_INDEX,
+                0
+            )
+        )
+        self._file.write(_IMAGE_DESCRIPTOR.pack(b",", box[0], box[1], image.size[0], image.size[1], 0))
+        self._file.write(bytes((_LZW_MINIMUM_CODE_SIZE,)))
+        ImageFile._save(image, self._file, [("gif", (0, 0) + image.size, 0, "L")])
+        self._file.write(b"\0")  # end of image data
+        self._pending_image = None
+        return
+
+    def _quantise(self, image: Image.Image) -> Image.Image:
+        """
+        Map each pixel of an image to the index of the nearest colour in the palette.
+
+        Frames only contain a few hundred distinct colours, so the nearest palette colour of each colour is found
+        the first time it is seen and remembered. Pixels are then looked up by a binary search of the colours seen
+        so far, packed into integers.
+
+        Args:
+            image (Image.Image): An RGB image.
+
+        Returns:
+            indices (Image.Image): The palette index of each pixel, as an L image.
+        """
+
+        pixels = np.asarray(image, dtype=np.int32)
+        keys = (pixels[:, :, 0] << 16) | (pixels[:, :, 1] << 8) | pixels[:, :, 2]
+        positions = np.searchsorted(self._colour_keys, keys)
+        unseen = np.unique(keys[self._colour_keys[positions] != keys])
+        if len(unseen):
+            colours = np.stack((unseen >> 16, (unseen >> 8) & 0xff, unseen & 0xff), axis=1)
+            distances = ((colours[:, np.newaxis, :] - self._palette[np.newaxis, :, :]) ** 2).sum(axis=2)
+            colour_keys = np.concatenate((self._colour_keys, unseen))
+            colour_indices = np.concatenate((self._colour_indices, distances.argmin(axis=1).astype(np.uint8)))
+            order = np.argsort(colour_keys)
+            self._colour_keys, self._colour_indices = colour_keys[order], colour_indices[order]
+            positions = np.searchsorted(self._colour_keys, keys)
+        return Image.fromarray(self._colour_indices[positions], mode="L")
@@ -0,0 +1,494 @@
+"""Module for reading the outlines of glyphs from TrueType fonts, or tracing them from other fonts"""
+
+import struct
+import functools
+import threading
+from typing import Dict, List, Tuple, Union
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+
+_FONT_FILE_CACHE_SIZE = 16
+_OUTLINE_CACHE_SIZE = 1024
+
+# flags of the points of a simple glyph
+_ON_CURVE = 0x01
+_X_SHORT = 0x02
+_Y_SHORT = 0x04
+_REPEAT = 0x08
+_X_SAME_OR_POSITIVE = 0x10
+_Y_SAME_OR_POSITIVE = 0x20
+
+# flags of the components of a composite glyph
+_ARGS_ARE_WORDS = 0x0001
+_ARGS_ARE_XY_VALUES = 0x0002
+_HAS_SCALE = 0x0008
+_MORE_COMPONENTS = 0x0020
+_HAS_X_AND_Y_SCALE = 0x0040
+_HAS_TWO_BY_TWO = 0x0080
+
+_MAX_COMPONENT_DEPTH = 8
+
+PathCommand = Tuple  # ("M", x, y), ("L", x, y), ("Q", control x, control y, x, y) or ("Z",)
+
+
+class _TrueTypeFont:
+    """A class for the glyph outlines and advances of a TrueType font file.
+
+    Only the tables needed to draw glyphs are read: the character map, horizontal metrics and glyph outlines.
+    Coordinates are in font units, with the y axis pointing up from the baseline.
+
+    Attributes:
+        units_per_em (int): The number of font units in the height of the em square.
+        _data (bytes): The contents of the font file.
+        _tables (dict): The offset of each table in the file, keyed by its tag.
+        _character_map (dict): The glyph id of each character code in the font.
+        _advances (list): The advance width of each glyph which has its own horizontal metrics.
+        _glyph_offsets (list): The offset of each glyph within the glyph table, followed by the end of the table.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Constructor method for the _TrueTypeFont class.
+
+        Args:
+            path (str): A path to a TrueType font file.
+
+        Raises:
+            ValueError: If the file isn't a TrueType font with glyph outlines.
+        """
+
+        with open(path, "rb") as file:
+            self._data = file.read()
+
+        font_offset = 0
+        if self._data[:4] == b"ttcf":  # a collection of fonts, of which the first is read
+            font_offset, = struct.unpack_from(">I", self._data, 12)
+        table_count, = struct.unpack_from(">H", self._data, font_offset + 4)
+        self._tables = {}
+        for position in range(font_offset + 12, font_offset + 12 + table_count * 16, 16):
+            tag, _, offset, _ = struct.unpack_from(">4sIII", self._data, position)
+            self._tables[tag.decode("latin-1")] = offset
+        if not {"cmap", "head", "hhea", "hmtx", "maxp", "loca", "glyf"} <= set(self._tables):
+            raise ValueError(f"{path} is not a TrueType font with glyph outlines.")
+
+        head = self._tables["head"]
+        self.units_per_em, = struct.unpack_from(">H", self._data, head + 18)
+        long_offsets, = struct.unpack_from(">h", self._data, head + 50)
+
+        metric_count, = struct.unpack_from(">H", self._data, self._tables["hhea"] + 34)
+        self._advances = list(struct.unpack_from(f">{metric_count * 2}H", self._data, self._tables["hmtx"]))[::2]
+
+        loca = self._tables["loca"]
+        glyph_count, = struct.unpack_from(">H", self._data, self._tables["maxp"] + 4)
+        if long_offsets:
+            self._glyph_offsets = list(struct.unpack_from(f">{glyph_count + 1}I", self._data, loca))
+        else:
+            offsets = struct.unpack_from(f">{glyph_count + 1}H", self._data, loca)
+            self._glyph_offsets = [offset * 2 for offset in offsets]  # short offsets are stored halved
+
+        self._character_map = self._read_character_map()
+
+    def glyph_id(self, character: str) -> int:
+        """
+        Get the glyph id of a character, or 0 (the missing glyph) if the font doesn't contain it.
+
+        Args:
+            character (str): A single character.
+
+        Returns:
+            (int): The glyph id of the character.
+        """
+
+        return self._character_map.get(ord(character), 0)
+
+    def advance(self, glyph_id: int) -> int:
+        """
+        Get the advance width of a glyph.
+
+        Args:
+            glyph_id (int): The id of the glyph.
+
+        Returns:
+            (int): The advance width of the glyph in font units.
+        """
+
+        return self._advances[min(glyph_id, len(self._advances) - 1)]
+
+    @functools.lru_cache(maxsize=_OUTLINE_CACHE_SIZE)
+    def outline(self, glyph_id: int) -> Tuple[PathCommand, ...]:
+        """
+        Get the outline of a glyph as a path.
+
+        Each contour of quadratic curves is converted into move, line and quadratic curve commands, with the
+        points on the curve which TrueType implies between consecutive control points made explicit.
+
+        Args:
+            glyph_id (int): The id of the glyph.
+
+        Returns:
+            (tuple): The commands of the path.
+        """
+
+        commands = []
+        for contour in self._contours(glyph_id=glyph_id, depth=0):
+            commands.extend(_contour_path(contour=contour))
+        return tuple(commands)
+
+    def _read_character_map(self) -> Dict[int, int]:
+        """
+        Read the Unicode character map of the font.
+
+        Returns:
+            (dict): The glyph id of each character code in the font.
+
+        Raises:
+            ValueError: If the font has no Unicode character map.
+        """
+
+        cmap = self._tables["cmap"]
+        subtable_count, = struct.unpack_from(">H", self._data, cmap + 2)
+        subtables = {}
+        for position in range(cmap + 4, cmap + 4 + subtable_count * 8, 8):
+            platform, encoding, offset = struct.unpack_from(">HHI", self._data, position)
+            subtable_format, = struct.unpack_from(">H", self._data, cmap + offset)
+            subtables[(platform, encoding, subtable_format)] = cmap + offset
+
+        for key in ((3, 10, 12), (0, 4, 12), (0, 6, 12)):
+            if key in subtables:
+                return self._read_segmented_coverage(offset=subtables[key])
+        for key in ((3, 1, 4), (0, 3, 4), (0, 1, 4), (0, 0, 4)):
+            if key in subtables:
+                return self._read_segment_mapping(offset=subtables[key])
+        raise ValueError("The font has no Unicode character map.")
+
+    def _read_segment_mapping(self, offset: int) -> Dict[int, int]:
+        """
+        Read a format 4 character map subtable, which covers the basic multilingual plane.
+
+        Args:
+            offset (int): The offset of the subtable in the file.
+
+        Returns:
+            (dict): The glyph id of each character code in the subtable.
+        """
+
+        segment_count = struct.unpack_from(">H", self._data, offset + 6)[0] // 2
+        end_codes = struct.unpack_from(f">{segment_count}H", self._data, offset + 14)
+        start_codes = struct.unpack_from(f">{segment_count}H", self._data, offset + 16 + segment_count * 2)
+        deltas = struct.unpack_from(f">{segment_count}h", self._data, offset + 16 + segment_count * 4)
+        range_offsets_start = offset + 16 + segment_count * 6
+        range_offsets = struct.unpack_from(f">{segment_count}H", self._data, range_offsets_start)
+
+        character_map = {}
+        for segment in range(segment_count):
+            for code in range(start_codes[segment], end_codes[segment] + 1):
+                if code == 0xffff:
+                    continue
+                if range_offsets[segment] == 0:
+                    glyph_id = (code + deltas[segment]) & 0xffff
+                else:
+                    position = range_offsets_start + segment * 2 + range_offsets[segment]
+                    glyph_id, = struct.unpack_from(">H", self._data, position + (code - start_codes[segment]) * 2)
+                    if glyph_id:
+                        glyph_id = (glyph_id + deltas[segment]) & 0xffff
+                if glyph_id:
+                    character_map[code] = glyph_id
+        return character_map
+
+    def _read_segmented_coverage(self, offset: int) -> Dict[int, int]:
+        """
+        Read a format 12 character map subtable, which covers every Unicode plane.
+
+        Args:
+            offset (int): The offset of the subtable in the file.
+
+        Returns:
+            (dict): The glyph id of each character code in the subtable.
+        """
+
+        group_count, = struct.unpack_from(">I", self._data, offset + 12)
+        character_map = {}
+        for position in range(offset + 16, offset + 16 + group_count * 12, 12):
+            start_code, end_code, start_glyph_id = struct.unpack_from(">III", self._data, position)
+            for code in range(start_code, end_code + 1):
+                character_map[code] = start_glyph_id + code - start_code
+        return character_map
+
+    def _contours(self, glyph_id: int, depth: int) -> List[List[Tuple[float, float, bool]]]:
+        """
+        Read the contours of a glyph, combining the components of composite glyphs.
+
+        Args:
+            glyph_id (int): The id of the glyph.
+            depth (int): The number of composite glyphs this glyph is a component of.
+
+        Returns:
+            (list): The x coordinate, y coordinate and on-curve flag of each point of each contour.
+        """
+
+        if glyph_id + 1 >= len(self._glyph_offsets) or depth > _MAX_COMPONENT_DEPTH:
+            return []
+        start, end = self._glyph_offsets[glyph_id], self._glyph_offsets[glyph_id + 1]
+        if start == end:  # a glyph without an outline e.g. a space
+            return []
+        position = self._tables["glyf"] + start
+        contour_count, = struct.unpack_from(">h", self._data, position)
+        if contour_count >= 0:
+            return self._simple_contours(position=position + 10, contour_count=contour_count)
+        return self._composite_contours(position=position + 10, depth=depth)
+
+    def _simple_contours(self, position: int, contour_count: int) -> List[List[Tuple[float, float, bool]]]:
+        """
+        Read the contours of a simple glyph.
+
+        Args:
+            position (int): The offset of the contour end points of the glyph in the file.
+            contour_count (int): The number of contours of the glyph.
+
+        Returns:
+            (list): The x coordinate, y coordinate and on-curve flag of each point of each contour.
+        """
+
+        data = self._data
+        end_points = struct.unpack_from(f">{contour_count}H", data, position)
+        point_count = end_points[-1] + 1 if end_points else 0
+        position += contour_count * 2
+        instruction_length, = struct.unpack_from(">H", data, position)
+        position += 2 + instruction_length
+
+        flags = []
+        while len(flags) < point_count:
+            flag = data[position]
+            position += 1
+            repeat = 0
+            if flag & _REPEAT:
+                repeat = data[position]
+                position += 1
+            flags.extend([flag] * (repeat + 1))
+
+        coordinates = []
+        for short_flag, same_flag in ((_X_SHORT, _X_SAME_OR_POSITIVE), (_Y_SHORT, _Y_SAME_OR_POSITIVE)):
+            values, value = [], 0
+            for flag in flags[:point_count]:
+                if flag & short_flag:
+                    delta = data[position]
+                    position += 1
+                    value += delta if flag & same_flag else -delta
+                elif not flag & same_flag:
+                    value += struct.unpack_from(">h", data, position)[0]
+                    position += 2
+                values.append(value)
+            coordinates.append(values)
+
+        contours, start = [], 0
+        for end in end_points:
+            contours.append([
+                (coordinates[0][point], coordinates[1][point], bool(flags[point] & _ON_CURVE))
+                for point in range(start, end + 1)
+            ])
+            start = end + 1
+        return contours
+
+    def _composite_contours(self, position: int, depth: int) -> List[List[Tuple[float, float, bool]]]:
+        """
+        Read the contours of a composite glyph, transforming the contours of each of its components.
+
+        Components positioned by matching points rather than by an offset are placed without an offset.
+
+        Args:
+            position (int): The offset of the first component of the glyph in the file.
+            depth (int): The number of composite glyphs this glyph is a component of.
+
+        Returns:
+            (list): The x coordinate, y coordinate and on-curve flag of each point of each contour.
+        """
+
+        data = self._data
+        contours = []
+        flags = _MORE_COMPONENTS
+        while flags & _MORE_COMPONENTS:
+            flags, glyph_id = struct.unpack_from(">HH", data, position)
+            position += 4
+            if flags & _ARGS_ARE_WORDS:
+                first, second = struct.unpack_from(">hh", data, position)
+                position += 4
+            else:
+                first, second = struct.unpack_from(">bb", data, position)
+                position += 2
+            dx, dy = (first, second) if flags & _ARGS_ARE_XY_VALUES else (0, 0)
+
+            xx, xy, yx, yy = 1.0, 0.0, 0.0, 1.0
+            if flags & _HAS_SCALE:
+                xx = yy = struct.unpack_from(">h", data, position)[0] / 16384
+                position += 2
+            elif flags & _HAS_X_AND_Y_SCALE:
+                xx, yy = (value / 16384 for value in struct.unpack_from(">hh", data, position))
+                position += 4
+            elif flags & _HAS_TWO_BY_TWO:
+                xx, xy, yx, yy = (value / 16384 for value in struct.unpack_from(">hhhh", data, position))
+                position += 8
+
+            for contour in self._contours(glyph_id=glyph_id, depth=depth + 1):
+                contours.append([
+                    (x * xx + y * yx + dx, x * xy + y * yy + dy, on_curve) for x, y, on_curve in contour
+                ])
+        return contours
+
+
+def _contour_path(contour: List[Tuple[float, float, bool]]) -> List[PathCommand]:
+    """
+    Convert a TrueType contour into path commands.
+
+    Args:
+        contour (list): The x coordinate, y coordinate and on-curve flag of each point of the contour.
+
+    Returns:
+        commands (list): The move, line, quadratic curve and close commands of the contour.
+    """
+
+    if not contour:
+        return []
+
+    # start from a point on the curve, adding the midpoint of two control points if there isn't one
+    start = next((index for index, point in enumerate(contour) if point[2]), None)
+    if start is None:
+        (x0, y0, _), (x1, y1, _) = contour[-1], contour[0]
+        points = [((x0 + x1) / 2, (y0 + y1) / 2, True)] + contour
+    else:
+        points = contour[start:] + contour[:start]
+
+    commands = [("M", points[0][0], points[0][1])]
+    control = None
+    for x, y, on_curve in points[1:] + points[:1]:
+        if on_curve:
+            commands.append(("L", x, y) if control is None else ("Q", control[0], control[1], x, y))
+            control = None
+        elif control is None:
+            control = (x, y)
+        else:
+            middle = ((control[0] + x) / 2, (control[1] + y) / 2)
+            commands.append(("Q", control[0], control[1], middle[0], middle[1]))
+            control = (x, y)
+    commands.append(("Z",))
+    return commands
+
+
+class _TracedFont:
+    """A class for the glyph outlines and advances of a font without TrueType outlines, e.g. a CFF OpenType font.
+
+    Each glyph is rasterised and its pixels are traced into rectangles, so it can be drawn as a path in the same
+    way as a TrueType outline, with edges which are only stepped when zoomed in far beyond the size of a frame.
+    The glyph id of each character is its character code. Coordinates are in pixels of the rasterised glyphs,
+    with the y axis pointing up from the baseline.
+
+    Attributes:
+        units_per_em (int): The number of pixels in the height of the em square of the rasterised glyphs.
+        _font (ImageFont.FreeTypeFont): The font the glyphs are rasterised with.
+        _lock (threading.Lock): A lock held while rasterising a glyph, as the font can't be used by two threads at
+            once.
+    """
+
+    __trace_size = 256
+    __coverage_threshold = 128  # the least coverage of a pixel, out of 255, for it to be part of a glyph
+
+    def __init__(self, path: str) -> None:
+        """
+        Constructor method for the _TracedFont class.
+
+        Args:
+            path (str): A path to a font file which can be loaded by ImageFont.truetype.
+        """
+
+        self.units_per_em = _TracedFont.__trace_size
+        self._font = ImageFont.truetype(font=path, size=_TracedFont.__trace_size)
+        self._lock = threading.Lock()
+
+    def glyph_id(self, character: str) -> int:
+        """
+        Get the glyph id of a character.
+
+        Args:
+            character (str): A single character.
+
+        Returns:
+            (int): The glyph id of the character.
+        """
+
+        return ord(character)
+
+    def advance(self, glyph_id: int) -> int:
+        """
+        Get the advance width of a glyph.
+
+        Args:
+            glyph_id (int): The id of the glyph.
+
+        Returns:
+            (int): The advance width of the glyph in pixels of the rasterised glyph.
+        """
+
+        with self._lock:
+            return round(self._font.getlength(text=chr(glyph_id)))
+
+    @functools.lru_cache(maxsize=_OUTLINE_CACHE_SIZE)
+    def outline(self, glyph_id: int) -> Tuple[PathCommand, ...]:
+        """
+        Get the outline of a glyph as a path.
+
+        Runs of covered pixels in each row are merged with the same runs in the rows below them, so each
+        rectangle of the path covers as many rows as possible.
+
+        Args:
+            glyph_id (int): The id of the glyph.
+
+        Returns:
+            (tuple): The commands of the path.
+        """
+
+        character = chr(glyph_id)
+        with self._lock:
+            left, top, right, bottom = self._font.getbbox(text=character, anchor="ls")
+            if right <= left or bottom <= top:  # a glyph without an outline e.g. a space
+                return ()
+            mask = Image.new(mode="L", size=(right - left, bottom - top))
+            ImageDraw.Draw(im=mask).text(xy=(-left, -top), text=character, font=self._font, fill=255, anchor="ls")
+        pixels = np.asarray(mask) >= _TracedFont.__coverage_threshold
+
+        rectangles = []
+        open_runs = {}  # the first row of each run of the previous row, keyed by its first and last column
+        for row in range(pixels.shape[0] + 1):
+            runs = set()
+            if row < pixels.shape[0]:
+                edges = np.flatnonzero(np.diff(np.concatenate(([False], pixels[row], [False])).astype(np.int8)))
+                runs = set(zip(edges[::2].tolist(), edges[1::2].tolist()))
+            for run in set(open_runs) - runs:
+                rectangles.append((run, open_runs.pop(run), row))
+            for run in runs - set(open_runs):
+                open_runs[run] = row
+
+        commands = []
+        for (start, end), first_row, end_row in sorted(rectangles, key=lambda rectangle: (rectangle[1], rectangle[0])):
+            x0, x1, y0, y1 = left + start, left + end, -(top + first_row), -(top + end_row)
+            commands.extend([("M", x0, y0), ("L", x1, y0), ("L", x1, y1), ("L", x0, y1), ("Z",)])
+        return tuple(commands)
+
+
+@functools.lru_cache(maxsize=_FONT_FILE_CACHE_SIZE)
+def _load_outlines(path: str) -> Union[_TrueTypeFont, _TracedFont]:
+    """
+    Load the glyph outlines of a font file, caching the result.
+
+    Outlines are read from a TrueType font, and traced from any other font, such as a CFF OpenType font.
+
+    Args:
+        path (str): A path to a font file.
+
+    Returns:
+        (_TrueTypeFont | _TracedFont): The glyph outlines of the font.
+    """
+
+    try:
+        return _TrueTypeFont(path=path)
+    except ValueError:
+        return _TracedFont(path=path)
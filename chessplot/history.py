@@ -0,0 +1,140 @@
+"""Module for storing the board history of a game"""
+
+from array import array
+from typing import Iterator, Tuple
+
+
+class _History:
+    """A class for a compact history of board snapshots, one for each ply of a game.
+
+    A ply changes at most four squares, so rather than storing every 64-byte board, each ply stores only the
+    squares it changed as (square, piece code) pairs. A full board is stored as a checkpoint every
+    checkpoint_interval ply, so any board can be rebuilt by applying at most checkpoint_interval - 1 deltas to
+    the nearest checkpoint before it.
+
+    Attributes:
+        _checkpoint_interval (int): The number of ply between each full board checkpoint.
+        _checkpoints (list): Full board snapshots of every checkpoint_interval-th ply.
+        _deltas (bytearray): The (square, piece code) pairs changed by each ply, one after another.
+        _delta_offsets (array): The offset of the deltas of each ply within _deltas.
+        _ply_strings (bytearray): The encoded ply strings of each ply, one after another.
+        _ply_string_offsets (array): The offset of the ply string of each ply within _ply_strings.
+        _last_board (bytes): The most recently added board snapshot.
+    """
+
+    def __init__(self, checkpoint_interval: int = 16) -> None:
+        """
+        Constructor method for the _History class.
+
+        Args:
+            checkpoint_interval (int): The number of ply between each full board checkpoint (default 16).
+        """
+
+        self._checkpoint_interval = checkpoint_interval
+        self._checkpoints = []
+        self._deltas = bytearray()
+        self._delta_offsets = array("I", [0])
+        self._ply_strings = bytearray()
+        self._ply_string_offsets = array("I", [0])
+        self._last_board = None
+
+    def __len__(self) -> int:
+        return len(self._delta_offsets) - 1
+
+    def append(self, ply_string: str, board: bytes) -> None:
+        """
+        Add the board snapshot following a ply to the end of the history.
+
+        Args:
+            ply_string (str): A string describing the ply e.g. 1. e4.
+            board (bytes): A snapshot of the game board following the ply.
+        """
+
+        if len(self) % self._checkpoint_interval == 0:
+            self._checkpoints.append(board)
+        if self._last_board is not None:
+            last_board = self._last_board
+            for square in range(64):
+                if board[square] != last_board[square]:
+                    self._deltas += bytes((square, board[square]))
+        self._delta_offsets.append(len(self._deltas))
+        self._ply_strings += ply_string.encode("utf-8")
+        self._ply_string_offsets.append(len(self._ply_strings))
+        self._last_board = board
+        return
+
+    def ply_string_at(self, ply: int) -> str:
+        """
+        Get the ply string of a given ply.
+
+        Args:
+            ply (int): The number of the ply, where 0 is the starting position.
+
+        Returns:
+            (str): A string describing the ply e.g. 1. e4.
+        """
+
+        start, end = self._ply_string_offsets[ply], self._ply_string_offsets[ply + 1]
+        return self._ply_strings[start:end].decode("utf-8")
+
+    def board_at(self, ply: int) -> bytes:
+        """
+        Get the board snapshot following a given ply.
+
+        Args:
+            ply (int): The number of the ply, where 0 is the starting position.
+
+        Returns:
+            (bytes): A snapshot of the game board following the ply.
+
+        Raises:
+            IndexError: If the ply is not in the history.
+        """
+
+        if not 0 <= ply < len(self):
+            raise IndexError(f"Ply {ply} is not in the history.")
+        checkpoint = ply // self._checkpoint_interval
+        if ply % self._checkpoint_interval == 0:
+            return self._checkpoints[checkpoint]
+        board = bytearray(self._checkpoints[checkpoint])
+        self._apply_deltas(board=board, start=checkpoint * self._checkpoint_interval + 1, end=ply + 1)
+        return bytes(board)
+
+    def iter_boards(self, start: int = 0, end: int = None) -> Iterator[Tuple[str, bytes]]:
+        """
+        Iterate over the ply strings and board snapshots of a range of ply.
+
+        The range is interpreted in the same way as a list slice. Only the first board is rebuilt from a
+        checkpoint, each following board is made by applying one delta.
+
+        Args:
+            start (int): The number of the first ply (default 0).
+            end (int): The number of the ply after the last ply (default None i.e. the end of the history).
+
+        Yields:
+            (tuple): The ply string and board snapshot of each ply.
+        """
+
+        plies = range(len(self))[start:end]
+        if not plies:
+            return
+        board = bytearray(self.board_at(plies.start))
+        yield self.ply_string_at(plies.start), bytes(board)
+        for ply in plies[1:]:
+            self._apply_deltas(board=board, start=ply, end=ply + 1)
+            yield self.ply_string_at(ply), bytes(board)
+
+    def _apply_deltas(self, board: bytearray, start: int, end: int) -> None:
+        """
+        Apply the deltas of a range of ply to a board in place.
+
+        Args:
+            board (bytearray): The board to be updated.
+            start (int): The number of the first ply.
+            end (int): The number of the ply after the last ply.
+        """
+
+        deltas = self._deltas
+        for position in range(self._delta_offsets[start], self._delta_offsets[end], 2):
+            board[deltas[position]] = deltas[position + 1]
+        return
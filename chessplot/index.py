@@ -0,0 +1,326 @@
+"""Module for indexing the games in a .pgn database"""
+
+import io
+import os
+import sys
+import zlib
+import struct
+import functools
+import itertools
+from array import array
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator, List, Tuple
+from .parser import _Parser, _Metadata
+from .tokenizer import _Tokenizer
+
+
+_INDEXED_TAGS = ("White", "Black", "Date", "Event", "Result")
+
+
+@dataclass(frozen=True)
+class _IndexEntry:
+    """A class for the index entry of a single game."""
+    offset: int
+    length: int
+    skipped_games: int
+    white: str
+    black: str
+    date: str
+    event: str
+    result: str
+
+
+class _GameIndex:
+    """A class for a byte-offset index of the games in a .pgn database.
+
+    The index is stored in a sidecar file beside the .pgn (e.g. games.pgn.idx) consisting of a header, a fixed-width
+    record for each game and a blob of the White, Black, Date, Event and Result tags of every game. Each record holds
+    the byte offset and length of the text the game is read from, the number of games which end within that text
+    before the game begins and the end of the tags of the game within the blob. Opening the index copies the records
+    straight into an array, so no work is done per game, and the tags of a game are only decoded when its entry is
+    read. Any game can then be read by seeking straight to it.
+
+    Games are told apart by _Parser.iter_tagged_games, so they are numbered in the same way as by
+    ChessPlot.from_database. A game which begins on the same line as the result of the game before it is read from
+    the start of that line, skipping the games which end on it first.
+
+    If the .pgn has only been appended to since the index was written, only the new part of the file is scanned.
+
+    Attributes:
+        pgn_path (str): A path to the indexed .pgn file.
+        index_path (str): A path to the sidecar index file.
+        end_states (list): A list of strings which denote the end of a game e.g. 1-0.
+        _records (array): The offset, length, number of skipped games and end of the tags of each game in turn.
+        _tags (bytes): The indexed tags of every game, each separated by a null character.
+    """
+
+    __magic = b"CPGNIDX2"
+    __header = struct.Struct("<8sQQI")  # magic, game count, indexed size, last game crc
+    __record_fields = 4  # offset, length, skipped games, end of tags
+    __tag_separator = b"\x00"
+
+    def __init__(self, pgn_path: str, end_states: List[str], index_path: str = None) -> None:
+        """
+        Constructor method for the _GameIndex class.
+
+        Loads the sidecar index for the given file, creating or updating it if needed.
+
+        Args:
+            pgn_path (str): A path to the .pgn file to be indexed.
+            end_states (list): A list of strings which denote the end of a game e.g. 1-0.
+            index_path (str): A path to the sidecar index file (default None i.e. pgn_path + '.idx').
+
+        Raises:
+            ValueError: If given file is not a .pgn
+            FileNotFoundError: If given path is not valid
+        """
+
+        if not pgn_path.endswith(".pgn"):
+            raise ValueError(f"File {pgn_path} is not a valid .pgn.")
+        self.pgn_path = pgn_path
+        self.index_path = index_path if index_path is not None else pgn_path + ".idx"
+        self.end_states = list(end_states)
+        self._records = array("Q")
+        self._tags = b""
+        self._update()
+
+    @classmethod
+    def for_file(cls, pgn_path: str, end_states: List[str]) -> "_GameIndex":
+        """
+        Get an up-to-date index for a given file, reusing the index last loaded by this process if it is for the
+        same unchanged file.
+
+        Args:
+            pgn_path (str): A path to the .pgn file to be indexed.
+            end_states (list): A list of strings which denote the end of a game e.g. 1-0.
+
+        Returns:
+            (_GameIndex): The index of the file.
+        """
+
+        stat = os.stat(pgn_path)
+        return _load_index(
+            pgn_path=os.path.abspath(pgn_path),
+            end_states=tuple(end_states),
+            size=stat.st_size,
+            modified=stat.st_mtime_ns
+        )
+
+    def __len__(self) -> int:
+        return len(self._records) // _GameIndex.__record_fields
+
+    def entry(self, game_number: int) -> _IndexEntry:
+        """
+        Get the index entry of a given game.
+
+        Args:
+            game_number (int): The position of the game in the database, starting from 0.
+
+        Returns:
+            (_IndexEntry): The index entry of the game.
+
+        Raises:
+            ValueError: If there is no game with the given number.
+        """
+
+        if not 0 <= game_number < len(self):
+            raise ValueError(f"Please choose a game number between 0 and {len(self) - 1}.")
+        position = game_number * _GameIndex.__record_fields
+        offset, length, skipped_games, tags_end = self._records[position:position + _GameIndex.__record_fields]
+        tags_start = self._records[position - 1] if game_number else 0
+        tags = bytes(self._tags[tags_start:tags_end]).split(_GameIndex.__tag_separator)
+        return _IndexEntry(offset, length, skipped_games, *(tag.decode("utf-8", errors="replace") for tag in tags))
+
+    def read_game(self, game_number: int) -> Tuple[_Metadata, List[List[str]]]:
+        """
+        Read and parse a given game.
+
+        Args:
+            game_number (int): The position of the game in the database, starting from 0.
+
+        Returns:
+            (_Metadata): A collection of metadata about the game.
+            moves (list): A list of pairs of ply played during the game.
+
+        Raises:
+            ValueError: If there is no game with the given number.
+        """
+
+        entry = self.entry(game_number=game_number)
+        with open(self.pgn_path, "rb") as file:
+            file.seek(entry.offset)
+            text = file.read(entry.length).decode("utf-8-sig", errors="replace")
+        games = _Parser.iter_stream(stream=io.StringIO(text), end_states=self.end_states)
+        return next(itertools.islice(games, entry.skipped_games, None))
+
+    def _update(self) -> None:
+        """
+        Load the sidecar index, scanning any part of the .pgn which is not yet indexed.
+
+        The last indexed game is always re-scanned as it may have been incomplete when it was indexed. If the
+        .pgn has been changed other than by appending to it, the index is rebuilt from scratch.
+        """
+
+        pgn_size = os.path.getsize(self.pgn_path)
+        indexed_size = self._load()
+        if indexed_size == pgn_size:
+            return
+
+        records, tags = self._records, bytearray(self._tags)
+        scan_from, skipped_games = 0, 0
+        if records:  # re-scan the last game
+            scan_from, _length, skipped_games, _tags_end = records[-_GameIndex.__record_fields:]
+            del records[-_GameIndex.__record_fields:]
+            del tags[records[-1] if records else 0:]
+
+        with open(self.pgn_path, "rb") as pgn_file:
+            pgn_file.seek(scan_from)
+            for offset, length, skipped, game_tags in self._scan(
+                    pgn_file=pgn_file,
+                    position=scan_from,
+                    skipped_games=skipped_games
+            ):
+                tags += _GameIndex.__tag_separator.join(tag.encode("utf-8") for tag in game_tags)
+                records.extend((offset, length, skipped, len(tags)))
+            self._tags = tags
+            last_game_crc = self._last_game_crc(pgn_file=pgn_file)
+
+        stored_records = array("Q", records)
+        if sys.byteorder == "big":
+            stored_records.byteswap()
+        with open(self.index_path, "wb") as index_file:
+            index_file.write(_GameIndex.__header.pack(_GameIndex.__magic, len(self), pgn_size, last_game_crc))
+            index_file.write(stored_records.tobytes())
+            index_file.write(tags)
+        return
+
+    def _load(self) -> int:
+        """
+        Load the sidecar index into memory.
+
+        Returns:
+            indexed_size (int): The size of the .pgn at the time it was indexed. Returns None if the index is
+                missing, invalid or the .pgn has changed other than by appending to it.
+        """
+
+        try:
+            with open(self.index_path, "rb") as index_file:
+                data = index_file.read()
+        except FileNotFoundError:
+            return None
+        if len(data) < _GameIndex.__header.size:
+            return None
+
+        magic, count, indexed_size, last_game_crc = _GameIndex.__header.unpack_from(data)
+        records_end = _GameIndex.__header.size + count * _GameIndex.__record_fields * self._records.itemsize
+        if magic != _GameIndex.__magic or len(data) < records_end or os.path.getsize(self.pgn_path) < indexed_size:
+            return None
+
+        self._records.frombytes(data[_GameIndex.__header.size:records_end])
+        if sys.byteorder == "big":
+            self._records.byteswap()
+        self._tags = memoryview(data)[records_end:]
+
+        with open(self.pgn_path, "rb") as pgn_file:
+            if self._last_game_crc(pgn_file=pgn_file) != last_game_crc:  # file has been rewritten
+                self._records, self._tags = array("Q"), b""
+                return None
+
+        return indexed_size
+
+    def _last_game_crc(self, pgn_file: BinaryIO) -> int:
+        """
+        Calculate a checksum of the last indexed game, used to detect whether the .pgn has been rewritten.
+
+        Args:
+            pgn_file (BinaryIO): The open .pgn file.
+
+        Returns:
+            (int): A CRC-32 checksum of the last indexed game.
+        """
+
+        if not self._records:
+            return 0
+        offset, length = self._records[-_GameIndex.__record_fields:-2]
+        pgn_file.seek(offset)
+        return zlib.crc32(pgn_file.read(length))
+
+    def _scan(self, pgn_file: BinaryIO, position: int, skipped_games: int) -> Iterator[Tuple[int, int, int, List[str]]]:
+        """
+        Scan a .pgn file for the boundaries and tags of each game.
+
+        The file is split into games by _Parser.iter_tagged_games while keeping track of the line each token was
+        read from. A game is read from the start of the line of its first token to the end of the line of its last
+        token.
+
+        Args:
+            pgn_file (BinaryIO): The open .pgn file positioned at the start of a line.
+            position (int): The current byte offset of the file.
+            skipped_games (int): The number of games which end on the current line before the first game to be
+                indexed begins.
+
+        Yields:
+            offset (int): The byte offset the game is read from.
+            length (int): The number of bytes the game is read from.
+            skipped_games (int): The number of games which end within these bytes before the game begins.
+            tags (list): The indexed tag values of the game.
+        """
+
+        line = [position, position]  # the start and end of the line being read
+        game_tokens = []  # the type of each token of the current game and the start and end of its line
+
+        def read_lines() -> Iterator[str]:
+            for text in pgn_file:
+                line[:] = line[1], line[1] + len(text)
+                yield text.decode("utf-8-sig" if line[0] == 0 else "utf-8", errors="replace")
+            return
+
+        def track_lines(tokens: Iterator[Tuple[str, str]]) -> Iterator[Tuple[str, str]]:
+            for token in tokens:
+                game_tokens.append((token[0], line[0], line[1]))
+                yield token
+            return
+
+        tokenizer = _Tokenizer(end_states=self.end_states, skip_annotations=True)
+        games = _Parser.iter_tagged_games(tokens=track_lines(tokens=tokenizer.tokenize(lines=read_lines())))
+        games_to_skip = skipped_games
+        result_line, games_ended_on_line = position, 0
+        for tags, _moves in games:
+            if game_tokens[-1][0] == _Tokenizer.TAG:  # the tags of the following game have begun
+                tokens, game_tokens[:] = game_tokens[:-1], game_tokens[-1:]
+            else:
+                tokens, game_tokens[:] = game_tokens[:], []
+            (_, game_start, _), (last_token_type, last_line_start, game_end) = tokens[0], tokens[-1]
+
+            if games_to_skip:  # the rest of a game which was indexed before
+                games_to_skip -= 1
+            else:
+                skipped_games = games_ended_on_line if game_start == result_line else 0
+                yield game_start, game_end - game_start, skipped_games, [tags.get(tag, "") for tag in _INDEXED_TAGS]
+
+            if last_token_type == _Tokenizer.RESULT:  # count the games ending on each line
+                if last_line_start != result_line:
+                    result_line, games_ended_on_line = last_line_start, 0
+                games_ended_on_line += 1
+        return
+
+
+@functools.lru_cache(maxsize=1)
+def _load_index(pgn_path: str, end_states: Tuple[str, ...], size: int, modified: int) -> _GameIndex:
+    """
+    Load the index of a given file, caching it while the file is unchanged.
+
+    Only the most recently used index is kept, as the index of a large database can take tens of MB. Opening
+    games from the same database in turn reuses it, and opening another database releases it.
+
+    Args:
+        pgn_path (str): A path to the .pgn file to be indexed.
+        end_states (tuple): The strings which denote the end of a game e.g. 1-0.
+        size (int): The size of the file, used to invalidate the cache.
+        modified (int): The modification time of the file, used to invalidate the cache.
+
+    Returns:
+        (_GameIndex): The index of the file.
+    """
+
+    return _GameIndex(pgn_path=pgn_path, end_states=list(end_states))
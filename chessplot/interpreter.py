@@ -3,8 +3,8 @@ Module containing all classes used by the chessplot package.
 """
 
 import numpy as np
-import copy
-from .piece import _Piece
+from typing import List, Tuple
+from .piece import _Piece, _EMPTY_SQUARE
 from .ply import _Ply
 
 
@@ -18,6 +18,20 @@ class _Interpreter:
         _ply_count (int): A count of the number of moves played in the game.
     """
 
+    __rook_directions = [(1, 0), (0, 1), (0, -1), (-1, 0)]
+    __bishop_directions = [(1, 1), (-1, 1), (-1, -1), (1, -1)]
+
+    __step_offsets = {
+        "N": [(2, 1), (1, 2), (-1, 2), (-2, 1), (-2, -1), (-1, -2), (1, -2), (2, -1)],
+        "K": __bishop_directions + __rook_directions,
+    }
+
+    __ray_directions = {
+        "B": __bishop_directions,
+        "R": __rook_directions,
+        "Q": __bishop_directions + __rook_directions,
+    }
+
     def __init__(self, piece_positions: str) -> None:
         """
         Constructor method for the _Interpreter class.
@@ -85,7 +99,7 @@ class _Interpreter:
 
         self._ply_count += 1
         self._board[current_row, current_col] = None
-        piece.update_position(row=row, col=col, ply_number=self._ply_count)
+        piece.update_position(row=row, col=col)
         if promoted_piece_rank is not None:  # if pawn promotion, create a new piece at the new position
             new_piece_name = promoted_piece_rank.lower() if not piece.is_white else promoted_piece_rank
             new_piece = _Piece(name=new_piece_name, row=row, col=col)
@@ -127,6 +141,88 @@ class _Interpreter:
 
         return
 
+    def _find_candidate_pieces(self, ply: _Ply, white_to_move: bool) -> List[_Piece]:
+        """
+        Find the pieces which could make a given ply.
+
+        Rather than generating the moves of every piece on the board, this works backwards from the new position
+        of the ply. Knight and king offsets and sliding piece rays are cast outwards from the new position, stopping
+        at the first piece found, and pawn origins are calculated directly.
+
+        Args:
+            ply (_Ply): The ply to be executed.
+            white_to_move (bool): Indicator of whether it's white's move or not.
+
+        Returns:
+            candidate_pieces (list): A list of pieces which could make the ply.
+        """
+
+        row = ply.new_position.row
+        col = ply.new_position.col
+        piece_rank = ply.piece_rank
+        target = self._board[row, col]
+        if target is not None and target.is_white == white_to_move:  # can't move onto a piece of the same colour
+            return []
+
+        if piece_rank == "P":
+            origins = self._find_pawn_origins(ply=ply, white_to_move=white_to_move)
+        elif piece_rank in _Interpreter.__step_offsets:
+            origins = [
+                (row + row_step, col + col_step) for row_step, col_step in _Interpreter.__step_offsets[piece_rank]
+                if 0 <= row + row_step < 8 and 0 <= col + col_step < 8
+            ]
+        else:
+            origins = []
+            for row_step, col_step in _Interpreter.__ray_directions[piece_rank]:
+                origin_row, origin_col = row + row_step, col + col_step
+                while 0 <= origin_row < 8 and 0 <= origin_col < 8:
+                    if self._board[origin_row, origin_col] is not None:  # the first piece on the ray
+                        origins.append((origin_row, origin_col))
+                        break
+                    origin_row, origin_col = origin_row + row_step, origin_col + col_step
+
+        candidate_pieces = []
+        for origin_row, origin_col in origins:
+            piece = self._board[origin_row, origin_col]
+            if piece is not None and piece.is_white == white_to_move and piece.rank == piece_rank:
+                candidate_pieces.append(piece)
+        return candidate_pieces
+
+    def _find_pawn_origins(self, ply: _Ply, white_to_move: bool) -> List[Tuple[int, int]]:
+        """
+        Find the squares from which a pawn could make a given ply.
+
+        Args:
+            ply (_Ply): The ply to be executed.
+            white_to_move (bool): Indicator of whether it's white's move or not.
+
+        Returns:
+            origins (list): A list of (row, col) squares.
+        """
+
+        row = ply.new_position.row
+        col = ply.new_position.col
+        row_step = 1 if white_to_move else -1
+        origin_row = row - row_step
+        if not 0 <= origin_row < 8:
+            return []
+
+        if ply.is_capture:  # pawns capture diagonally, including en passant
+            if ply.piece_col_number is not None:
+                origin_cols = [ply.piece_col_number]
+            else:
+                origin_cols = [col - 1, col + 1]
+            return [(origin_row, origin_col) for origin_col in origin_cols if 0 <= origin_col < 8]
+
+        if self._board[row, col] is not None:  # pawns can't capture forwards
+            return []
+        if self._board[origin_row, col] is None:
+            double_step_row = 3 if white_to_move else 4
+            if row == double_step_row:  # pawn can move forward two squares on its first move
+                return [(origin_row - row_step, col)]
+            return []
+        return [(origin_row, col)]
+
     def execute_ply(self, ply: _Ply, white_to_move: bool) -> None:
         """
         Execute a given ply.
@@ -143,20 +239,7 @@ class _Interpreter:
             self._castle(white_to_move=white_to_move, castle_king_side=ply.castle_king_side)
             return
 
-        candidate_pieces = []
-        for row in range(0, 8):
-            for col in range(0, 8):
-                piece = self._board[row, col]
-                if piece is None:  # if square is empty, skip
-                    continue
-                if piece.is_white != white_to_move:  # if piece is the wrong colour, skip
-                    continue
-                is_candidate_piece = (
-                        piece.rank == ply.piece_rank
-                        and ply.new_position in piece.get_possible_positions(self._board, ply_number=self._ply_count)
-                )
-                if is_candidate_piece:
-                    candidate_pieces.append(piece)
+        candidate_pieces = self._find_candidate_pieces(ply=ply, white_to_move=white_to_move)
 
         if len(candidate_pieces) == 1:
             self._move_piece(
@@ -210,15 +293,17 @@ class _Interpreter:
 
         raise InterpreterError(ply_string=ply.ply_string)
 
-    def get_board(self) -> np.ndarray:
+    def get_board(self) -> bytes:
         """
-        Get a copy of the current game board.
+        Get a snapshot of the current game board.
+
+        The snapshot is an immutable 64-byte string of piece codes which shares nothing with the board itself.
 
         Returns:
-            (np.ndarray): Current game board.
+            (bytes): The piece code on each square, indexed by row * 8 + col.
         """
 
-        return copy.deepcopy(self._board)
+        return bytes(_EMPTY_SQUARE if piece is None else ord(piece.name) for piece in self._board.flat)
 
 
 class InterpreterError(Exception):
@@ -1,8 +1,17 @@
 
+import io
 import re
 import datetime
-from typing import Tuple, Dict, List
+import functools
+from typing import Tuple, Dict, List, Iterable, Iterator, IO
 from .ply import _Ply, UnrecognisedPlyError
+from .tokenizer import _Tokenizer
+
+
+_KING_SIDE_CASTLE_PATTERN = re.compile("^O-O$|^0-0$")
+_QUEEN_SIDE_CASTLE_PATTERN = re.compile("^O-O-O$|^0-0-0$")
+_PLY_PATTERN = re.compile("^([NBRKQ]?)([a-h]?)([1-8]?)(x?)([a-h][1-8])(=[NBRQ])?")
+_PLY_CACHE_SIZE = 8192
 
 
 class _Metadata:
@@ -21,6 +30,10 @@ class _Metadata:
         fen (str): The FEN string for the start of the game.
     """
 
+    __slots__ = (
+        "event", "site", "date", "event_round", "white", "black", "white_elo", "black_elo", "result", "fen"
+    )
+
     __default_fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
 
     def __init__(self, tags: Dict[str, str] = None):
@@ -75,6 +88,8 @@ class _Parser:
         """
         Parse a given file into a set of metadata tags and a move set.
 
+        Only the first game in the file is parsed. Use iter_games to parse every game in a file.
+
         Args:
             file_path (str): A path to the .pgn file to be parsed.
             end_states (list): A list of strings which denote the end of a game e.g. 1-0.
@@ -88,33 +103,201 @@ class _Parser:
             FileNotFoundError: If given path is not valid
         """
 
+        games = _Parser.iter_games(file_path=file_path, end_states=end_states)
+        return _Parser._first_game(games=games, source=f"File {file_path}")
+
+    @staticmethod
+    def parse_text(pgn_text: str, end_states: List[str]) -> Tuple[_Metadata, List[List[str]]]:
+        """
+        Parse a given string of PGN text into a set of metadata tags and a move set.
+
+        Only the first game in the text is parsed.
+
+        Args:
+            pgn_text (str): The PGN text to be parsed.
+            end_states (list): A list of strings which denote the end of a game e.g. 1-0.
+
+        Returns:
+            (_Metadata): A collection of metadata about the game.
+            moves (list): A list of pairs of ply played during the game.
+
+        Raises:
+            ValueError: If text contains no move set
+        """
+
+        games = _Parser._iter_games_from_lines(lines=pgn_text.splitlines(), end_states=end_states)
+        return _Parser._first_game(games=games, source="Text")
+
+    @staticmethod
+    def parse_stream(stream: IO, end_states: List[str]) -> Tuple[_Metadata, List[List[str]]]:
+        """
+        Parse a readable file-like object into a set of metadata tags and a move set.
+
+        Only the first game in the stream is parsed.
+
+        Args:
+            stream (IO): A readable file-like object containing PGN text, in either text or binary mode.
+            end_states (list): A list of strings which denote the end of a game e.g. 1-0.
+
+        Returns:
+            (_Metadata): A collection of metadata about the game.
+            moves (list): A list of pairs of ply played during the game.
+
+        Raises:
+            ValueError: If stream contains no move set
+        """
+
+        games = _Parser.iter_stream(stream=stream, end_states=end_states)
+        return _Parser._first_game(games=games, source="Stream")
+
+    @staticmethod
+    def _first_game(
+            games: Iterator[Tuple[_Metadata, List[List[str]]]],
+            source: str
+    ) -> Tuple[_Metadata, List[List[str]]]:
+        """
+        Take the first game from an iterator of parsed games.
+
+        Args:
+            games (iterator): An iterator of parsed games.
+            source (str): A description of where the games came from, used in error messages.
+
+        Returns:
+            (_Metadata): A collection of metadata about the game.
+            moves (list): A list of pairs of ply played during the game.
+
+        Raises:
+            ValueError: If there are no games or the first game contains no move set
+        """
+
+        try:
+            metadata, moves = next(games)
+        except StopIteration:
+            raise ValueError(f"{source} contains no move set")
+        finally:
+            games.close()
+
+        if not moves:
+            raise ValueError(f"{source} contains no move set")
+
+        return metadata, moves
+
+    @staticmethod
+    def iter_games(file_path: str, end_states: List[str]) -> Iterator[Tuple[_Metadata, List[List[str]]]]:
+        """
+        Lazily parse every game in a given file.
+
+        The file is read line by line and only the game currently being parsed is held in memory, so
+        databases of any size can be streamed. A game ends at its result token, which may appear anywhere
+        in a line, or at the start of the tags of the following game.
+
+        Args:
+            file_path (str): A path to the .pgn file to be parsed.
+            end_states (list): A list of strings which denote the end of a game e.g. 1-0.
+
+        Yields:
+            (_Metadata): A collection of metadata about the game.
+            moves (list): A list of pairs of ply played during the game.
+
+        Raises:
+            ValueError: If given file is not a .pgn
+            FileNotFoundError: If given path is not valid
+        """
+
         if not file_path.endswith(".pgn"):
             raise ValueError(f"File {file_path} is not a valid .pgn.")
-        file = open(file_path, "r")
+        with open(file_path, "r", encoding="utf-8-sig", errors="replace") as file:
+            yield from _Parser._iter_games_from_lines(lines=file, end_states=end_states)
+
+    @staticmethod
+    def iter_stream(stream: IO, end_states: List[str]) -> Iterator[Tuple[_Metadata, List[List[str]]]]:
+        """
+        Lazily parse every game in a readable file-like object.
+
+        The stream may be opened in either text or binary mode, and binary streams are decoded as UTF-8. The
+        stream is read line by line and is left open once every game has been parsed.
+
+        Args:
+            stream (IO): A readable file-like object containing PGN text.
+            end_states (list): A list of strings which denote the end of a game e.g. 1-0.
+
+        Yields:
+            (_Metadata): A collection of metadata about the game.
+            moves (list): A list of pairs of ply played during the game.
+        """
+
+        if isinstance(stream.read(0), str):
+            yield from _Parser._iter_games_from_lines(lines=stream, end_states=end_states)
+            return
+        lines = io.TextIOWrapper(stream, encoding="utf-8-sig", errors="replace")
+        try:
+            yield from _Parser._iter_games_from_lines(lines=lines, end_states=end_states)
+        finally:
+            lines.detach()  # stop the wrapper closing the stream
+
+    @staticmethod
+    def _iter_games_from_lines(
+            lines: Iterable[str],
+            end_states: List[str]
+    ) -> Iterator[Tuple[_Metadata, List[List[str]]]]:
+        """
+        Parse every game in an iterable of PGN lines.
+
+        Args:
+            lines (iterable): The lines of PGN text to be parsed.
+            end_states (list): A list of strings which denote the end of a game e.g. 1-0.
+
+        Yields:
+            (_Metadata): A collection of metadata about the game.
+            moves (list): A list of pairs of ply played during the game.
+        """
+
+        tokenizer = _Tokenizer(end_states=end_states, skip_annotations=True)
+        for tags, moves in _Parser.iter_tagged_games(tokens=tokenizer.tokenize(lines=lines)):
+            yield _Metadata(tags=tags), moves
+
+    @staticmethod
+    def iter_tagged_games(tokens: Iterable[Tuple[str, str]]) -> Iterator[Tuple[Dict[str, str], List[List[str]]]]:
+        """
+        Split a stream of tokens into games, yielding the raw tags and move pairs of each.
+
+        Move numbers are used to group the ply into pairs. A game ends at its result token, at the start of the
+        tags of the following game, or at the end of the tokens. This is the only place games are told apart, so
+        every game is numbered in the same way however the database is read.
+
+        Args:
+            tokens (iterable): The type and text of each token, produced by a _Tokenizer which skips annotations.
+
+        Yields:
+            tags (dict): The value of each tag of the game.
+            moves (list): A list of pairs of ply played during the game, ending with the result if there is one.
+        """
+
         tags = {}
-        moves_string = ""
-        for line in file:
-            tag_search = re.search(r"\[(.*)]", line)
-            if tag_search is not None:
-                tag = tag_search.group(1)
-                tag = tag.replace('"', "")
+        moves = []
+        for token_type, token in tokens:
+            if token_type == _Tokenizer.SAN:
+                if not moves:
+                    moves.append([])
+                moves[-1].append(token)
+            elif token_type == _Tokenizer.MOVE_NUMBER:
+                if not (token.endswith("...") and moves and len(moves[-1]) == 1):  # not a continuation of a pair
+                    moves.append([])
+            elif token_type == _Tokenizer.TAG:
+                if moves:  # tags of a new game have begun before a result was found
+                    yield tags, [move for move in moves if move]
+                    tags, moves = {}, []
+                tag = token.replace('"', "")
                 key, value = tag.split(" ", 1)
                 tags[key] = value
-            else:  # extract move set
-                moves_string += line
-                if line.endswith(tuple(end_states)):
-                    break
-        if not moves_string:
-            raise ValueError(f"File {file_path} contains no move set")
-
-        moves_string = moves_string.replace("\n", " ")
-        moves = [
-            [ply for ply in move.strip().split(" ") if ply != ""]
-            for move in re.split("\\d+\\.", moves_string) if move != ''
-        ]
-        moves = [move for move in moves if move]  # remove empty moves
-
-        return _Metadata(tags=tags), moves
+            elif token_type == _Tokenizer.RESULT:
+                if not moves:
+                    moves.append([])
+                moves[-1].append(token)
+                yield tags, [move for move in moves if move]
+                tags, moves = {}, []
+        if moves:
+            yield tags, [move for move in moves if move]
 
     @staticmethod
     def parse_fen(fen: str) -> Tuple[str, bool, int]:
@@ -157,6 +340,7 @@ class _Parser:
             raise ValueError(f"{fen} is not a valid FEN string.")
 
     @staticmethod
+    @functools.lru_cache(maxsize=_PLY_CACHE_SIZE)
     def parse_ply_string(ply_string: str) -> _Ply:
         """Parse a given ply string and return a _Ply object.
 
@@ -168,6 +352,9 @@ class _Parser:
             - Pawn promotions e.g. e8=Q.
             - Disambiguated piece moves e.g. N1e4, Nce4, Nc3e4.
 
+        Parsed ply are cached by ply string, so the same (immutable) _Ply object is returned each time a ply
+        string is repeated. See ply_cache_info for the cache statistics.
+
         Args:
             ply_string (str): A string representation of the ply e.g. e4.
 
@@ -180,15 +367,15 @@ class _Parser:
 
         ply_elements = {"ply_string": ply_string}
 
-        if re.match("^O-O$|^0-0$", string=ply_string):  # castle king-side
+        if _KING_SIDE_CASTLE_PATTERN.match(ply_string):  # castle king-side
             ply_elements["castle_king_side"] = True
             return _Ply(**ply_elements)
 
-        if re.match("^O-O-O$|^0-0-0$", string=ply_string):  # castle queen-side
+        if _QUEEN_SIDE_CASTLE_PATTERN.match(ply_string):  # castle queen-side
             ply_elements["castle_queen_side"] = True
             return _Ply(**ply_elements)
 
-        match = re.match("^([NBRKQ]?)([a-h]?)([1-8]?)(x?)([a-h][1-8])(=[NBRQ])?", ply_string)  # standard move
+        match = _PLY_PATTERN.match(ply_string)  # standard move
 
         if not match:
             raise UnrecognisedPlyError(ply_string=ply_string)
@@ -205,3 +392,21 @@ class _Parser:
             ply_elements["promoted_piece_rank"] = match.group(6)[1]
 
         return _Ply(**ply_elements)
+
+    @staticmethod
+    def ply_cache_info() -> "functools._CacheInfo":
+        """
+        Get statistics for the cache of parsed ply.
+
+        Returns:
+            (functools._CacheInfo): The cache hits, misses, maximum size and current size.
+        """
+
+        return _Parser.parse_ply_string.cache_info()
+
+    @staticmethod
+    def clear_ply_cache() -> None:
+        """Clear the cache of parsed ply and reset its statistics."""
+
+        _Parser.parse_ply_string.cache_clear()
+        return
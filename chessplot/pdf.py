@@ -0,0 +1,575 @@
+"""Module for writing vector .pdf files one page at a time"""
+
+import zlib
+import functools
+from typing import BinaryIO, List, Optional, Tuple
+from PIL import ImageColor, ImageFont
+from .glyphs import _load_outlines, PathCommand
+from .renderer import _format_decimal, _text_baseline
+
+
+_POINTS_PER_INCH = 72
+_MAX_CODES_PER_FONT = 255  # each glyph of a Type 3 font is shown by a single byte code, of which 0 is unused
+
+
+_format_number = functools.partial(_format_decimal, decimals=3)  # coordinates are rounded to 0.001 pixels
+
+
+def _path_operators(commands: Tuple[PathCommand, ...]) -> List[str]:
+    """
+    Convert path commands into .pdf path construction operators.
+
+    Quadratic curves are converted into the equivalent cubic curves, as .pdf paths only support cubic curves.
+
+    Args:
+        commands (tuple): The commands of the path.
+
+    Returns:
+        operators (list): The path construction operators.
+    """
+
+    operators = []
+    current = (0.0, 0.0)
+    for command in commands:
+        if command[0] == "M":
+            current = command[1:]
+            operators.append(f"{_format_number(current[0])} {_format_number(current[1])} m")
+        elif command[0] == "L":
+            current = command[1:]
+            operators.append(f"{_format_number(current[0])} {_format_number(current[1])} l")
+        elif command[0] == "Q":
+            control_x, control_y, x, y = command[1:]
+            first = (current[0] + (control_x - current[0]) * 2 / 3, current[1] + (control_y - current[1]) * 2 / 3)
+            second = (x + (control_x - x) * 2 / 3, y + (control_y - y) * 2 / 3)
+            operators.append(" ".join(_format_number(value) for value in first + second + (x, y)) + " c")
+            current = (x, y)
+        else:
+            operators.append("h")
+    return operators
+
+
+def _path_bounds(commands: Tuple[PathCommand, ...]) -> Tuple[float, float, float, float]:
+    """
+    Find a box containing a path, including the control points of its curves.
+
+    Args:
+        commands (tuple): The commands of a path with at least one point.
+
+    Returns:
+        (tuple): The left, lower, right and upper coordinates of the box.
+    """
+
+    xs = [value for command in commands for value in command[1::2]]
+    ys = [value for command in commands for value in command[2::2]]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+class _Type3Font:
+    """A class for a subset of the glyphs of a font, embedded in a .pdf as a Type 3 font.
+
+    Glyphs are given single byte codes in the order they are first used, and their outlines are only written
+    once the document is finished. Fonts with an outline width are coloured: each glyph is filled in black on
+    top of a white outline, in the same way as the pieces of a raster frame. Otherwise each glyph is filled in
+    the colour of the text.
+
+    Attributes:
+        number (int): The object number of the font.
+        name (str): The name of the font in the resources of each page.
+        path (str): A path to the font file.
+        outline_width (float): The width of the outline of each glyph in font units, or None if not outlined.
+        codes (dict): The code of each glyph used so far, keyed by glyph id.
+        characters (dict): The character each code was first used to show, keyed by code.
+    """
+
+    def __init__(self, number: int, path: str, outline_width: Optional[float]) -> None:
+        """
+        Constructor method for the _Type3Font class.
+
+        Args:
+            number (int): The object number of the font.
+            path (str): A path to the font file.
+            outline_width (float): The width of the outline of each glyph in font units, or None if not outlined.
+        """
+
+        self.number = number
+        self.name = f"F{number}"
+        self.path = path
+        self.outline_width = outline_width
+        self.codes = {}
+        self.characters = {}
+
+
+class _PdfCanvas:
+    """A class for the drawing operations of a page, or of a form shared between pages, of a vector .pdf.
+
+    Coordinates are given in pixels of a frame, from the top left corner, in the same way as for a raster frame.
+
+    Attributes:
+        size (tuple): The width and height of the canvas in pixels.
+        _writer (_PdfWriter): The writer of the document the canvas belongs to.
+        _operators (list): The drawing operators of the canvas so far.
+        _fonts (dict): The object number of each font used on the canvas, keyed by its name.
+        _forms (dict): The object number of each form drawn on the canvas, keyed by its name.
+    """
+
+    def __init__(self, writer: "_PdfWriter", size: Tuple[int, int]) -> None:
+        """
+        Constructor method for the _PdfCanvas class.
+
+        Args:
+            writer (_PdfWriter): The writer of the document the canvas belongs to.
+            size (tuple): The width and height of the canvas in pixels.
+        """
+
+        self.size = size
+        self._writer = writer
+        self._operators = []
+        self._fonts = {}
+        self._forms = {}
+
+    def fill_rectangle(self, box: Tuple[float, float, float, float], colour: str) -> None:
+        """
+        Fill a rectangle.
+
+        Args:
+            box (tuple): The left, upper, right and lower coordinates of the rectangle.
+            colour (str): The colour of the rectangle e.g. "#e2e7ee".
+        """
+
+        left, upper, right, lower = box
+        self._operators.append(
+            f"{self._colour(colour=colour)} rg {_format_number(left)} {_format_number(upper)} "
+            f"{_format_number(right - left)} {_format_number(lower - upper)} re f"
+        )
+        return
+
+    def draw_text(
+            self,
+            text: str,
+            font: ImageFont.FreeTypeFont,
+            xy: Tuple[float, float],
+            anchor: str = "la",
+            clip_box: Tuple[float, float, float, float] = None
+    ) -> None:
+        """
+        Draw a line of black text.
+
+        Anchors are interpreted in the same way as by ImageDraw.text, using the metrics of the given font.
+
+        Args:
+            text (str): The text to be drawn.
+            font (ImageFont.FreeTypeFont): The font of the text, which must be a font file read by ImageFont.truetype.
+            xy (tuple): The position of the anchor of the text.
+            anchor (str): The horizontal ("l" or "m") and vertical ("a", "m" or "s") alignment of the text with
+                its position (default "la").
+            clip_box (tuple): The left, upper, right and lower coordinates of a box outside which nothing of the
+                text is drawn (default None).
+        """
+
+        operators = self._show_glyphs(text=text, font=font, xy=xy, anchor=anchor, outline_width=None)
+        if clip_box is not None:
+            left, upper, right, lower = clip_box
+            operators = [
+                f"q {_format_number(left)} {_format_number(upper)} {_format_number(right - left)} "
+                f"{_format_number(lower - upper)} re W n"
+            ] + operators + ["Q"]
+        self._operators.append("0 g")
+        self._operators.extend(operators)
+        return
+
+    def draw_piece(self, text: str, font: ImageFont.FreeTypeFont, xy: Tuple[float, float], stroke_width: int) -> None:
+        """
+        Draw a piece glyph centred on a point, filled in black on top of a white outline.
+
+        Args:
+            text (str): The unicode character of the piece.
+            font (ImageFont.FreeTypeFont): The font of the piece, which must be a font file read by ImageFont.truetype.
+            xy (tuple): The position of the centre of the piece.
+            stroke_width (int): The width in pixels of the outline around the piece.
+        """
+
+        units_per_em = _load_outlines(path=font.path).units_per_em
+        outline_width = stroke_width * 2 * units_per_em / font.size  # the outline is centred on the glyph edge
+        self._operators.extend(
+            self._show_glyphs(text=text, font=font, xy=xy, anchor="mm", outline_width=round(outline_width, 3))
+        )
+        return
+
+    def draw_form(self, form: Tuple[str, int]) -> None:
+        """
+        Draw a form, covering the whole canvas.
+
+        Args:
+            form (tuple): The name and object number of the form, as returned by _PdfWriter.add_form.
+        """
+
+        name, number = form
+        self._forms[name] = number
+        self._operators.append(f"/{name} Do")
+        return
+
+    def content(self) -> bytes:
+        """
+        Get the content stream of the canvas.
+
+        Returns:
+            (bytes): The drawing operators of the canvas.
+        """
+
+        return "\n".join(self._operators).encode("latin-1")
+
+    def resources(self) -> str:
+        """
+        Get the resource dictionary of the fonts and forms used on the canvas.
+
+        Returns:
+            (str): The resource dictionary.
+        """
+
+        fonts = " ".join(f"/{name} {number} 0 R" for name, number in self._fonts.items())
+        forms = " ".join(f"/{name} {number} 0 R" for name, number in self._forms.items())
+        return f"<< /Font << {fonts} >> /XObject << {forms} >> >>"
+
+    def _show_glyphs(
+            self,
+            text: str,
+            font: ImageFont.FreeTypeFont,
+            xy: Tuple[float, float],
+            anchor: str,
+            outline_width: Optional[float]
+    ) -> List[str]:
+        """
+        Create the operators which show a line of text in Type 3 fonts made from the glyphs of a font.
+
+        Args:
+            text (str): The text to be shown.
+            font (ImageFont.FreeTypeFont): The font of the text.
+            xy (tuple): The position of the anchor of the text.
+            anchor (str): The horizontal and vertical alignment of the text with its position.
+            outline_width (float): The width of the outline of each glyph in font units, or None if not outlined.
+
+        Returns:
+            operators (list): The text operators.
+        """
+
+        outlines = _load_outlines(path=font.path)
+        scale = font.size / outlines.units_per_em
+        glyph_ids = [outlines.glyph_id(character=character) for character in text]
+        width = sum(outlines.advance(glyph_id=glyph_id) for glyph_id in glyph_ids) * scale
+
+        x, y = xy[0], _text_baseline(font=font, y=xy[1], anchor=anchor)
+        if anchor[0] == "m":
+            x -= width / 2
+
+        # the canvas is flipped so y points down, so the text matrix flips each glyph back up
+        operators = [f"BT 1 0 0 -1 {_format_number(x)} {_format_number(y)} Tm"]
+        current_font = None
+        run = []
+        for character, glyph_id in zip(text, glyph_ids):
+            type3_font, code = self._writer.glyph_code(
+                path=font.path,
+                outline_width=outline_width,
+                glyph_id=glyph_id,
+                character=character
+            )
+            if type3_font is not current_font:
+                if run:
+                    operators.append(f"<{bytes(run).hex()}> Tj")
+                    run = []
+                self._fonts[type3_font.name] = type3_font.number
+                operators.append(f"/{type3_font.name} {_format_number(font.size)} Tf")
+                current_font = type3_font
+            run.append(code)
+        if run:
+            operators.append(f"<{bytes(run).hex()}> Tj")
+        operators.append("ET")
+        return operators
+
+    @staticmethod
+    def _colour(colour: str) -> str:
+        """
+        Format a colour as the operands of a .pdf colour operator.
+
+        Args:
+            colour (str): A colour e.g. "#e2e7ee".
+
+        Returns:
+            (str): The red, green and blue components of the colour between 0 and 1.
+        """
+
+        return " ".join(_format_number(component / 255) for component in ImageColor.getrgb(colour)[:3])
+
+
+class _PdfWriter:
+    """A class for streaming the pages of a vector .pdf to a file as they are drawn.
+
+    Pages are drawn with vector operations on a _PdfCanvas, using coordinates in pixels of a frame which are
+    scaled to the size of the page by the resolution. Each page is written as soon as it is added, so memory use
+    doesn't depend on the number of pages. Text and pieces are shown in Type 3 fonts holding only the glyphs used
+    in the document, which are written once every page has been added along with the page tree, catalog and
+    cross-reference table. Offsets of each object are counted as they are written rather than read from the file,
+    so the file doesn't need to be seekable.
+
+    Attributes:
+        _file (BinaryIO): The file being written to.
+        _resolution (float): The number of pixels of a frame per inch of a page.
+        _offset (int): The number of bytes written so far.
+        _object_offsets (dict): The offset of each object written so far, keyed by object number.
+        _object_count (int): The number of object numbers used so far.
+        _page_numbers (list): The object number of each page written so far.
+        _fonts (dict): The Type 3 fonts used so far, keyed by font file and outline width.
+    """
+
+    __catalog_number = 1
+    __page_tree_number = 2
+    __bfchar_limit = 100  # the most mappings a single beginbfchar block may hold
+
+    def __init__(self, file: BinaryIO, resolution: float) -> None:
+        """
+        Constructor method for the _PdfWriter class.
+
+        Args:
+            file (BinaryIO): A file opened for writing in binary mode.
+            resolution (float): The number of pixels of a frame per inch of a page.
+        """
+
+        self._file = file
+        self._resolution = resolution
+        self._offset = 0
+        self._object_offsets = {}
+        self._object_count = _PdfWriter.__page_tree_number
+        self._page_numbers = []
+        self._fonts = {}
+        self._write(data=b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+    def canvas(self, size: Tuple[int, int]) -> _PdfCanvas:
+        """
+        Create a canvas to draw a page or form on.
+
+        Args:
+            size (tuple): The width and height of the canvas in pixels.
+
+        Returns:
+            (_PdfCanvas): An empty canvas.
+        """
+
+        return _PdfCanvas(writer=self, size=size)
+
+    def add_form(self, canvas: _PdfCanvas) -> Tuple[str, int]:
+        """
+        Write a canvas as a form, which can be drawn on any number of pages but is only stored once.
+
+        Args:
+            canvas (_PdfCanvas): The canvas of the form.
+
+        Returns:
+            (tuple): The name and object number of the form.
+        """
+
+        width, height = canvas.size
+        number = self._write_object(
+            dictionary=f"/Type /XObject /Subtype /Form /BBox [0 0 {width} {height}] /Resources {canvas.resources()}",
+            stream=canvas.content()
+        )
+        return f"X{number}", number
+
+    def add_page(self, canvas: _PdfCanvas) -> None:
+        """
+        Write a canvas as a page at the end of the document.
+
+        Args:
+            canvas (_PdfCanvas): The canvas of the page.
+        """
+
+        width, height = canvas.size
+        scale = _POINTS_PER_INCH / self._resolution
+        page_width, page_height = width * scale, height * scale
+        flip = f"{_format_number(scale)} 0 0 {_format_number(-scale)} 0 {_format_number(page_height)} cm\n"
+        contents_number = self._write_object(dictionary="", stream=flip.encode("ascii") + canvas.content())
+        self._page_numbers.append(
+            self._write_object(
+                dictionary=f"/Type /Page /Parent {_PdfWriter.__page_tree_number} 0 R "
+                           f"/MediaBox [0 0 {_format_number(page_width)} {_format_number(page_height)}] "
+                           f"/Resources {canvas.resources()} /Contents {contents_number} 0 R"
+            )
+        )
+        return
+
+    def glyph_code(
+            self,
+            path: str,
+            outline_width: Optional[float],
+            glyph_id: int,
+            character: str
+    ) -> Tuple[_Type3Font, int]:
+        """
+        Get the Type 3 font and code which show a glyph, adding the glyph to a font if it hasn't been used.
+
+        Args:
+            path (str): A path to the font file of the glyph.
+            outline_width (float): The width of the outline of the glyph in font units, or None if not outlined.
+            glyph_id (int): The id of the glyph.
+            character (str): The character the glyph is shown for, used when text is extracted from the .pdf.
+
+        Returns:
+            (tuple): The Type 3 font and code of the glyph.
+        """
+
+        fonts = self._fonts.setdefault((path, outline_width), [])
+        for font in fonts:
+            if glyph_id in font.codes:
+                return font, font.codes[glyph_id]
+        if not fonts or len(fonts[-1].codes) == _MAX_CODES_PER_FONT:
+            self._object_count += 1  # reserve the number of the font, which is written when the document ends
+            fonts.append(_Type3Font(number=self._object_count, path=path, outline_width=outline_width))
+        font = fonts[-1]
+        font.codes[glyph_id] = len(font.codes) + 1
+        font.characters[font.codes[glyph_id]] = character
+        return font, font.codes[glyph_id]
+
+    def close(self) -> None:
+        """
+        Write the fonts, page tree, catalog and cross-reference table, ending the file.
+
+        Raises:
+            ValueError: If no pages have been added.
+        """
+
+        if not self._page_numbers:
+            raise ValueError("A .pdf must contain at least one page.")
+        for fonts in self._fonts.values():
+            for font in fonts:
+                self._write_font(font=font)
+        kids = " ".join(f"{number} 0 R" for number in self._page_numbers)
+        self._write_object(
+            dictionary=f"/Type /Pages /Kids [{kids}] /Count {len(self._page_numbers)}",
+            number=_PdfWriter.__page_tree_number
+        )
+        self._write_object(
+            dictionary=f"/Type /Catalog /Pages {_PdfWriter.__page_tree_number} 0 R",
+            number=_PdfWriter.__catalog_number
+        )
+
+        xref_offset = self._offset
+        entries = [f"xref\n0 {self._object_count + 1}\n", "0000000000 65535 f \n"]
+        for number in range(1, self._object_count + 1):
+            entries.append(f"{self._object_offsets[number]:010d} 00000 n \n")
+        entries.append(f"trailer\n<< /Size {self._object_count + 1} /Root {_PdfWriter.__catalog_number} 0 R >>\n")
+        entries.append(f"startxref\n{xref_offset}\n%%EOF\n")
+        self._write(data="".join(entries).encode("ascii"))
+        if hasattr(self._file, "flush"):
+            self._file.flush()
+        return
+
+    def _write_font(self, font: _Type3Font) -> None:
+        """
+        Write a Type 3 font, the outline of each of its glyphs and the map from its codes to unicode text.
+
+        Args:
+            font (_Type3Font): The font to be written.
+        """
+
+        outlines = _load_outlines(path=font.path)
+        procedures, widths = [], []
+        for glyph_id, code in font.codes.items():
+            advance = outlines.advance(glyph_id=glyph_id)
+            path = _path_operators(commands=outlines.outline(glyph_id=glyph_id))
+            if not path:  # a glyph without an outline e.g. a space
+                operators = [f"{advance} 0 0 0 0 0 d1"]
+            elif font.outline_width is None:
+                bounds = " ".join(_format_number(value) for value in _path_bounds(commands=outlines.outline(glyph_id)))
+                operators = [f"{advance} 0 {bounds} d1"] + path + ["f"]
+            else:
+                operators = [f"{advance} 0 d0", f"1 g 1 G {_format_number(font.outline_width)} w 1 j 1 J"]
+                operators += path + ["B", "0 g"] + path + ["f"]
+            procedures.append((code, self._write_object(dictionary="", stream="\n".join(operators).encode("ascii"))))
+            widths.append(advance)
+
+        scale = f"{1 / outlines.units_per_em:.10g}"
+        procedure_entries = " ".join(f"/g{code} {number} 0 R" for code, number in procedures)
+        differences = " ".join(f"/g{code}" for code, _ in procedures)
+        to_unicode_number = self._write_object(dictionary="", stream=self._to_unicode_map(font=font))
+        self._write_object(
+            dictionary=f"/Type /Font /Subtype /Type3 /FontBBox [0 0 0 0] /FontMatrix [{scale} 0 0 {scale} 0 0] "
+                       f"/CharProcs << {procedure_entries} >> "
+                       f"/Encoding << /Type /Encoding /Differences [1 {differences}] >> "
+                       f"/FirstChar 1 /LastChar {len(procedures)} /Widths [{' '.join(map(str, widths))}] "
+                       f"/Resources << >> /ToUnicode {to_unicode_number} 0 R",
+            number=font.number
+        )
+        return
+
+    @staticmethod
+    def _to_unicode_map(font: _Type3Font) -> bytes:
+        """
+        Create the CMap which maps each code of a Type 3 font to the character it shows, so that text can be
+        selected and extracted from the .pdf.
+
+        Args:
+            font (_Type3Font): The font to be mapped.
+
+        Returns:
+            (bytes): The contents of the CMap stream.
+        """
+
+        entries = [
+            f"<{code:02x}> <{character.encode('utf-16-be').hex()}>" for code, character in font.characters.items()
+        ]
+        lines = [
+            "/CIDInit /ProcSet findresource begin",
+            "12 dict begin",
+            "begincmap",
+            "/CIDSystemInfo << /Registry (Adobe) /Ordering (UCS) /Supplement 0 >> def",
+            "/CMapName /Adobe-Identity-UCS def",
+            "/CMapType 2 def",
+            "1 begincodespacerange",
+            "<00> <ff>",
+            "endcodespacerange"
+        ]
+        for start in range(0, len(entries), _PdfWriter.__bfchar_limit):
+            block = entries[start:start + _PdfWriter.__bfchar_limit]
+            lines += [f"{len(block)} beginbfchar"] + block + ["endbfchar"]
+        lines += ["endcmap", "CMapName currentdict /CMapResource defineresource pop", "end", "end"]
+        return "\n".join(lines).encode("ascii")
+
+    def _write_object(self, dictionary: str, stream: bytes = None, number: int = None) -> int:
+        """
+        Write an object whose value is a dictionary, optionally followed by a compressed stream.
+
+        Args:
+            dictionary (str): The entries of the dictionary, without the enclosing << and >>.
+            stream (bytes): The contents of the stream, if any (default None).
+            number (int): A reserved object number to write the object as (default None i.e. the next number).
+
+        Returns:
+            number (int): The object number of the object.
+        """
+
+        if number is None:
+            self._object_count += 1
+            number = self._object_count
+        self._object_offsets[number] = self._offset
+        if stream is None:
+            self._write(data=f"{number} 0 obj\n<< {dictionary} >>\nendobj\n".encode("latin-1"))
+            return number
+        stream = zlib.compress(stream)
+        self._write(
+            data=f"{number} 0 obj\n<< {dictionary} /Filter /FlateDecode /Length {len(stream)} >>\nstream\n".encode(
+                "latin-1"
+            )
+        )
+        self._write(data=stream)
+        self._write(data=b"\nendstream\nendobj\n")
+        return number
+
+    def _write(self, data: bytes) -> None:
+        """
+        Write data to the file, keeping count of the bytes written.
+
+        Args:
+            data (bytes): The data to be written.
+        """
+
+        self._file.write(data)
+        self._offset += len(data)
+        return
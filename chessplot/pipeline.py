@@ -0,0 +1,122 @@
+"""Module for overlapping the drawing and encoding of frames"""
+
+import threading
+import time
+from dataclasses import dataclass
+from queue import Queue, Full
+from typing import Callable, Iterator
+from PIL import Image
+
+
+_END = object()  # marks the end of the frames in the queue
+_PUT_TIMEOUT = 0.1  # seconds between checks of whether the encoder has stopped
+
+
+@dataclass(frozen=True)
+class _StageTimings:
+    """A class for the time in seconds spent in each stage of drawing and encoding a plot.
+
+    Attributes:
+        frames (int): The number of frames passed from the render stage to the encode stage.
+        render (float): The time spent drawing frames.
+        encode (float): The time spent encoding frames.
+        render_blocked (float): The time the render stage waited for space in the queue.
+        encode_idle (float): The time the encode stage waited for frames to be drawn.
+        total (float): The time from the first frame being requested to the file being finished.
+    """
+    frames: int
+    render: float
+    encode: float
+    render_blocked: float
+    encode_idle: float
+    total: float
+
+
+class _Failure:
+    """A class for passing an exception raised while drawing frames to the encode stage."""
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def _run_pipeline(
+        frames: Iterator[Image.Image],
+        encode: Callable[[Iterator[Image.Image]], None],
+        max_queued: int
+) -> _StageTimings:
+    """
+    Draw frames in a background thread while they are encoded in this thread.
+
+    The frames are passed between the stages through a queue holding at most max_queued frames, so drawing pauses
+    whenever the encoder falls behind and memory use is limited to a few frames. Any exception raised while
+    drawing is raised again in this thread, and drawing stops if the encoder raises an exception.
+
+    Args:
+        frames (Iterator): A generator which draws each frame, in order. It is closed once the pipeline finishes.
+        encode (Callable): A function which encodes every frame of an iterator.
+        max_queued (int): The greatest number of frames drawn but not yet encoded.
+
+    Returns:
+        (_StageTimings): The time spent in each stage.
+    """
+
+    queue = Queue(maxsize=max_queued)
+    stopped = threading.Event()
+    render_timings = {"frames": 0, "render": 0.0, "render_blocked": 0.0}
+
+    def put(item: object) -> None:
+        start = time.perf_counter()
+        while not stopped.is_set():
+            try:
+                queue.put(item, timeout=_PUT_TIMEOUT)
+                break
+            except Full:
+                continue
+        render_timings["render_blocked"] += time.perf_counter() - start
+
+    def render() -> None:
+        try:
+            while not stopped.is_set():
+                start = time.perf_counter()
+                frame = next(frames, _END)
+                render_timings["render"] += time.perf_counter() - start
+                put(item=frame)
+                if frame is _END:
+                    return
+                render_timings["frames"] += 1
+        except BaseException as error:
+            put(item=_Failure(error=error))
+
+    encode_idle = 0.0
+
+    def queued_frames() -> Iterator[Image.Image]:
+        nonlocal encode_idle
+        while True:
+            start = time.perf_counter()
+            item = queue.get()
+            encode_idle += time.perf_counter() - start
+            if item is _END:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+
+    start = time.perf_counter()
+    thread = threading.Thread(target=render, daemon=True)
+    thread.start()
+    try:
+        encode(queued_frames())
+    finally:
+        stopped.set()
+        thread.join()
+        frames.close()
+    total = time.perf_counter() - start
+
+    return _StageTimings(
+        frames=render_timings["frames"],
+        render=render_timings["render"],
+        encode=total - encode_idle,
+        render_blocked=render_timings["render_blocked"],
+        encode_idle=encode_idle,
+        total=total
+    )
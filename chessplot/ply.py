@@ -5,20 +5,36 @@ from .position import _Position
 class _Ply:
     """Class representing a ply.
 
+    Ply are immutable so that a single parsed ply can be shared by every game in which it is played.
+
     Attributes:
-        ply_string (str): The string representation of the ply.
-        piece_rank (str): The rank of the piece being moved.
-        piece_col (str): The initial column of the piece being moved.
-        piece_row (str): The initial row of the piece being moved.
-        piece_row_number (int): The initial row number of the piece being moved.
-        piece_col_number (int): The initial column number of the piece being moved.
-        new_position (_Position): The new position of the piece.
-        promoted_piece_rank (str): The rank of the piece promoted to during the move (if any).
-        castle_king_side (bool): Indicator of whether the ply is a king-side castle.
-        castle_queen_side (bool): Indicator of whether the ply is a queen-side castle.
-        is_capture (bool): Indicator of whether the ply is a capture.
+        _ply_string (str): The string representation of the ply.
+        _piece_rank (str): The rank of the piece being moved.
+        _piece_col (str): The initial column of the piece being moved.
+        _piece_row (str): The initial row of the piece being moved.
+        _piece_row_number (int): The initial row number of the piece being moved.
+        _piece_col_number (int): The initial column number of the piece being moved.
+        _new_position (_Position): The new position of the piece.
+        _promoted_piece_rank (str): The rank of the piece promoted to during the move (if any).
+        _castle_king_side (bool): Indicator of whether the ply is a king-side castle.
+        _castle_queen_side (bool): Indicator of whether the ply is a queen-side castle.
+        _is_capture (bool): Indicator of whether the ply is a capture.
     """
 
+    __slots__ = (
+        "_ply_string",
+        "_piece_rank",
+        "_piece_row",
+        "_piece_col",
+        "_piece_row_number",
+        "_piece_col_number",
+        "_new_position",
+        "_promoted_piece_rank",
+        "_castle_king_side",
+        "_castle_queen_side",
+        "_is_capture",
+    )
+
     __row_names = "12345678"
     __col_names = "hgfedcba"
 
@@ -47,20 +63,75 @@ class _Ply:
             castle_queen_side (bool): Indicator of whether the ply is a queen-side castle (default False).
             is_capture (bool): Indicator of whether the ply is a capture (default False).
         """
-        self.ply_string = ply_string
-        self.piece_rank = piece_rank
-        self.piece_row = piece_row
-        self.piece_col = piece_col
-        self.piece_row_number = _Ply.__row_names.index(self.piece_row) if self.piece_row is not None else None
-        self.piece_col_number = _Ply.__col_names.index(self.piece_col) if self.piece_col is not None else None
+        self._ply_string = ply_string
+        self._piece_rank = piece_rank
+        self._piece_row = piece_row
+        self._piece_col = piece_col
+        self._piece_row_number = _Ply.__row_names.index(piece_row) if piece_row is not None else None
+        self._piece_col_number = _Ply.__col_names.index(piece_col) if piece_col is not None else None
         if new_position_name is not None:
-            self.new_position = _Position.from_name(name=new_position_name)
+            self._new_position = _Position.from_name(name=new_position_name)
         else:
-            self.new_position = None
-        self.promoted_piece_rank = promoted_piece_rank
-        self.castle_king_side = castle_king_side
-        self.castle_queen_side = castle_queen_side
-        self.is_capture = is_capture
+            self._new_position = None
+        self._promoted_piece_rank = promoted_piece_rank
+        self._castle_king_side = castle_king_side
+        self._castle_queen_side = castle_queen_side
+        self._is_capture = is_capture
+
+    @property
+    def ply_string(self) -> str:
+        """Get ply_string."""
+        return self._ply_string
+
+    @property
+    def piece_rank(self) -> str:
+        """Get piece_rank."""
+        return self._piece_rank
+
+    @property
+    def piece_row(self) -> str:
+        """Get piece_row."""
+        return self._piece_row
+
+    @property
+    def piece_col(self) -> str:
+        """Get piece_col."""
+        return self._piece_col
+
+    @property
+    def piece_row_number(self) -> int:
+        """Get piece_row_number."""
+        return self._piece_row_number
+
+    @property
+    def piece_col_number(self) -> int:
+        """Get piece_col_number."""
+        return self._piece_col_number
+
+    @property
+    def new_position(self) -> _Position:
+        """Get new_position."""
+        return self._new_position
+
+    @property
+    def promoted_piece_rank(self) -> str:
+        """Get promoted_piece_rank."""
+        return self._promoted_piece_rank
+
+    @property
+    def castle_king_side(self) -> bool:
+        """Get castle_king_side."""
+        return self._castle_king_side
+
+    @property
+    def castle_queen_side(self) -> bool:
+        """Get castle_queen_side."""
+        return self._castle_queen_side
+
+    @property
+    def is_capture(self) -> bool:
+        """Get is_capture."""
+        return self._is_capture
 
 
 class UnrecognisedPlyError(Exception):
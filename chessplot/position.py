@@ -5,6 +5,10 @@ class _Position:
     """
     A class for piece positions.
 
+    Positions are flyweights: there is exactly one instance for each of the 64 squares, plus a single shared
+    instance for every position which lies off the board. Constructing a position returns the existing instance,
+    so positions can be compared by identity.
+
     Attributes:
         _row (int): The row number of the position.
         _col (int): The column number of the position.
@@ -12,21 +16,47 @@ class _Position:
         _is_legal (bool): Indicator of whether the position is legal or not i.e. on the board.
     """
 
+    __slots__ = ("_row", "_col", "_name", "_is_legal")
+
     __row_names = "12345678"
     __col_names = "hgfedcba"
 
-    def __init__(self, row: int, col: int) -> None:
+    def __new__(cls, row: int, col: int) -> "_Position":
+        """
+        Get the position with a given row and column number.
+
+        Args:
+             row (int): Row number of the position.
+             col (int): Column number of the position.
+
+        Returns:
+            (_Position): The position, or the shared off-board position if it does not lie on the board.
+        """
+        if 0 <= row < 8 and 0 <= col < 8:
+            return _POSITIONS[row * 8 + col]
+        return _OFF_BOARD
+
+    @classmethod
+    def _create(cls, row: int, col: int) -> "_Position":
         """
-        Constructor method for the _Position class.
+        Create a new position, bypassing the table of existing positions.
 
         Args:
              row (int): Row number of the position.
              col (int): Column number of the position.
+
+        Returns:
+            (_Position): The new position.
         """
-        self._row = row
-        self._col = col
-        self._name = self._set_name()
-        self._is_legal = self._check_legality()
+        position = object.__new__(cls)
+        position._row = row
+        position._col = col
+        position._name = position._set_name()
+        position._is_legal = position._check_legality()
+        return position
+
+    def __reduce__(self) -> tuple:
+        return _Position, (self._row, self._col)
 
     @classmethod
     def from_name(cls, name: str):
@@ -63,14 +93,16 @@ class _Position:
     def __eq__(self, other: object) -> bool:
         """__eq__ method for the Position class."""
         if not isinstance(other, _Position):
-            return NotImplemented(f"Cannot compare type Position with type {type(other)}.")
-        if self.row == other.row and self.col == other.col:
-            return True
-        else:
-            return False
+            return NotImplemented
+        return self is other
+
+    def __hash__(self) -> int:
+        return self._row * 8 + self._col
 
     def _set_name(self) -> str:
         """Set the name of the position."""
+        if self.row < 0 or self.col < 0:  # negative indices would otherwise wrap around
+            return ""
         try:
             return self.__col_names[self.col] + self.__row_names[self.row]
         except IndexError:
@@ -88,3 +120,7 @@ class _Position:
             return False
         else:
             return True
+
+
+_POSITIONS = tuple(_Position._create(row=square // 8, col=square % 8) for square in range(64))
+_OFF_BOARD = _Position._create(row=-1, col=-1)
@@ -0,0 +1,909 @@
+"""Module for rendering the parts of a plot which are shared between frames"""
+
+import math
+import functools
+import threading
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
+from PIL import Image, ImageFont, ImageDraw
+from .settings import _Settings, _Theme
+from .piece import _Piece, _EMPTY_SQUARE
+
+
+_BACKGROUND_CACHE_SIZE = 32
+_SPRITE_CACHE_SIZE = 32
+_FONT_CACHE_SIZE = 64
+_FIT_CACHE_SIZE = 1024
+_PIECE_NAMES = "KQRBNPkqrbnp"
+
+_thread_fonts = threading.local()  # the fonts loaded by each thread
+
+
+@dataclass(frozen=True)
+class _Sprite:
+    """A class for a piece rasterised once, to be pasted onto frames.
+
+    The outline is pasted in white and then the glyph in white and in black, exactly as drawing the piece as text
+    with a white outline would.
+    """
+    offset: Tuple[int, int]
+    outline: Image.Image
+    glyph: Image.Image
+
+
+def _scale_font(text: str, font_name: str, max_width: int, max_height: int) -> ImageFont.FreeTypeFont:
+    """
+    Scale a font to fit a given piece of text within a bounding box.
+
+    Both the fitted size and the loaded font are cached, so fitting the same text again costs nothing.
+
+    Args:
+        text (str): The text to be fitted.
+        font_name (str): The name of the font.
+        max_width (int): The maximum width of the scaled text.
+        max_height (int): The maximum height of the scaled text.
+
+    Returns:
+        font (ImageFont.FreeTypeFont): A font object scaled to the correct size.
+    """
+
+    font_size = _fit_font_size(text=text, font_name=font_name, max_width=max_width, max_height=max_height)
+    return _load_font(font_name=font_name, font_size=font_size)
+
+
+def _load_font(font_name: str, font_size: int) -> ImageFont.FreeTypeFont:
+    """
+    Load a font of a given size, caching it for the rest of the thread.
+
+    A FreeType font can't be used by two threads at once, so each thread loads and caches its own fonts, and
+    frames and pages can be drawn in several threads at the same time.
+
+    Args:
+        font_name (str): The name of the font.
+        font_size (int): The size of the font.
+
+    Returns:
+        font (ImageFont.FreeTypeFont): The loaded font.
+    """
+
+    load = getattr(_thread_fonts, "load", None)
+    if load is None:
+        load = _thread_fonts.load = functools.lru_cache(maxsize=_FONT_CACHE_SIZE)(ImageFont.truetype)
+    return load(font=font_name, size=font_size)
+
+
+def _text_size(font: ImageFont.FreeTypeFont, text: str) -> Tuple[int, int]:
+    """
+    Measure a piece of text from its origin, as FreeTypeFont.getsize did before it was removed in Pillow 10.
+
+    Args:
+        font (ImageFont.FreeTypeFont): The font of the text.
+        text (str): The text to be measured.
+
+    Returns:
+        (tuple): The right and lower edges of the text, measured from the top left of its origin.
+    """
+
+    _, _, right, lower = font.getbbox(text)
+    return right, lower
+
+
+@functools.lru_cache(maxsize=_FIT_CACHE_SIZE)
+def _fit_font_size(text: str, font_name: str, max_width: int, max_height: int) -> int:
+    """
+    Find the font size at which a given piece of text first reaches the edge of a bounding box.
+
+    This is the smallest even size of at least 12 at which the text is as wide as max_width or as tall as
+    max_height. A first guess is made by scaling the size of the text at 12, and then the size is found by a
+    binary search around it, so only a handful of sizes are ever loaded.
+
+    Args:
+        text (str): The text to be fitted.
+        font_name (str): The name of the font.
+        max_width (int): The maximum width of the scaled text.
+        max_height (int): The maximum height of the scaled text.
+
+    Returns:
+        font_size (int): The fitted font size.
+    """
+
+    def fits(font_size: int) -> bool:
+        text_width, text_height = _text_size(font=_load_font(font_name=font_name, font_size=font_size), text=text)
+        return text_width < max_width and text_height < max_height
+
+    font_size = 12
+    if not fits(font_size=font_size):
+        return font_size
+    text_width, text_height = _text_size(font=_load_font(font_name=font_name, font_size=font_size), text=text)
+    if text_width == 0 and text_height == 0:  # text with no size can never fill the box
+        return font_size
+
+    # smallest scale at which either dimension reaches the box, as an even size
+    scale = min(
+        max_width / text_width if text_width else math.inf,
+        max_height / text_height if text_height else math.inf
+    )
+    estimate = max(int(font_size * scale) // 2 * 2, font_size + 2)
+
+    # find sizes either side of the edge of the box, in units of 2pt
+    lower, upper = font_size // 2, estimate // 2
+    step = 1
+    while fits(font_size=upper * 2):
+        lower, upper = upper, upper + step
+        step *= 2
+    if upper - 1 > lower:  # the estimate is usually correct, so check the size just below it first
+        if fits(font_size=(upper - 1) * 2):
+            lower = upper - 1
+        else:
+            upper = upper - 1
+    while upper - lower > 1:
+        middle = (lower + upper) // 2
+        if fits(font_size=middle * 2):
+            lower = middle
+        else:
+            upper = middle
+    return upper * 2
+
+
+def _blend(region: np.ndarray, colour: int, mask: np.ndarray) -> None:
+    """
+    Blend a grey level into a region of an image array through an alpha mask.
+
+    The result is rounded in the same way as Image.paste, so blending is identical to pasting the colour with
+    the mask.
+
+    Args:
+        region (np.ndarray): A view of the region of an RGB image array, which is blended in place.
+        colour (int): The grey level to be blended in, from 0 (black) to 255 (white).
+        mask (np.ndarray): The alpha mask as integers with shape (height, width, 1), the same width and height as
+            the region.
+    """
+
+    blended = region * (255 - mask) + colour * mask + 128
+    region[...] = ((blended >> 8) + blended) >> 8
+    return
+
+
+def _intersect_boxes(box: Tuple[int, int, int, int], other: Tuple[int, int, int, int]) -> Optional[Tuple[int, ...]]:
+    """
+    Find the intersection of two boxes.
+
+    Args:
+        box (tuple): The left, upper, right and lower coordinates of a box.
+        other (tuple): The left, upper, right and lower coordinates of another box.
+
+    Returns:
+        intersection (tuple): The left, upper, right and lower coordinates of the intersection, or None if the
+            boxes don't overlap.
+    """
+
+    left, upper = max(box[0], other[0]), max(box[1], other[1])
+    right, lower = min(box[2], other[2]), min(box[3], other[3])
+    if left >= right or upper >= lower:
+        return None
+    return left, upper, right, lower
+
+
+def _square_labels(square_width: int, flip_perspective: bool) -> List[Tuple[str, Tuple[float, float]]]:
+    """
+    Lay out the names of the ranks and files of the board, to the left of and below the squares.
+
+    Args:
+        square_width (int): The width of each square of the board.
+        flip_perspective (bool): Indicator of whether the board perspective is flipped.
+
+    Returns:
+        labels (list): The text and the position of the centre of each rank and file name.
+    """
+
+    x_origin, y_origin = square_width, square_width
+    labels = []
+    for row in range(0, 8):
+        row_text = "12345678"[row] if flip_perspective else "12345678"[7 - row]
+        labels.append((row_text, (x_origin - square_width * 0.5, y_origin + square_width * row + square_width * 0.5)))
+    for col in range(0, 8):
+        col_text = "abcdefgh"[7 - col] if flip_perspective else "abcdefgh"[col]
+        labels.append((col_text, (x_origin + square_width * col + square_width * 0.5, y_origin + square_width * 8.5)))
+    return labels
+
+
+def _format_decimal(value: float, decimals: int) -> str:
+    """
+    Format a number as compactly as possible for the text of a vector document.
+
+    Args:
+        value (float): The number to be formatted.
+        decimals (int): The number of decimal places to round the number to.
+
+    Returns:
+        (str): The number, without any trailing zeros.
+    """
+
+    text = f"{value:.{decimals}f}".rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
+
+
+def _text_baseline(font: ImageFont.FreeTypeFont, y: float, anchor: str) -> float:
+    """
+    Find the baseline of a line of text from the vertical position of its anchor.
+
+    Anchors are interpreted in the same way as by ImageDraw.text, using the metrics of the given font.
+
+    Args:
+        font (ImageFont.FreeTypeFont): The font of the text.
+        y (float): The vertical position of the anchor of the text.
+        anchor (str): The horizontal ("l" or "m") and vertical ("a", "m" or "s") alignment of the text.
+
+    Returns:
+        (float): The vertical position of the baseline.
+    """
+
+    ascent, descent = font.getmetrics()
+    if anchor[1] == "a":
+        return y + ascent
+    if anchor[1] == "m":
+        return y + (ascent - descent) / 2
+    return y
+
+
+@dataclass(frozen=True)
+class _VectorLayout:
+    """A class for the size, fonts and square names of a frame drawn as a vector document, laid out in the same way
+    as a raster frame."""
+    size: Tuple[int, int]
+    y_offset: int
+    piece_font: ImageFont.FreeTypeFont
+    move_text_font: Optional[ImageFont.FreeTypeFont]
+    square_name_font: ImageFont.FreeTypeFont
+    square_labels: List[Tuple[str, Tuple[float, float]]]
+
+
+def _vector_layout(settings: _Settings) -> _VectorLayout:
+    """
+    Lay out a frame to be drawn as a vector document.
+
+    Args:
+        settings (_Settings): A collection of settings for the plot.
+
+    Returns:
+        (_VectorLayout): The size of the frame, the height of its header, the fonts of the pieces, move text and
+            square names and the text and position of the centre of each square name.
+    """
+
+    square_width = settings.square_width
+    if settings.display_header:
+        y_offset = int(settings.plot_size * 0.15)
+        size = (settings.plot_size, settings.plot_size + y_offset)
+    else:
+        y_offset = 0
+        size = (square_width * 10, square_width * 10)
+
+    move_text_font = None
+    if settings.display_notation:
+        move_text_font = _scale_font(
+            text="1. e4",
+            font_name="arial.ttf",
+            max_width=int(square_width * 0.8),
+            max_height=int(square_width * 0.8)
+        )
+
+    return _VectorLayout(
+        size=size,
+        y_offset=y_offset,
+        piece_font=_scale_font(text="♔", font_name="seguisym.ttf", max_width=square_width, max_height=square_width),
+        move_text_font=move_text_font,
+        square_name_font=_scale_font(
+            text="a",
+            font_name="arial.ttf",
+            max_width=int(square_width * 0.4),
+            max_height=int(square_width * 0.4)
+        ),
+        square_labels=[
+            (text, (x, y + y_offset))
+            for text, (x, y) in _square_labels(square_width=square_width, flip_perspective=settings.flip_perspective)
+        ]
+    )
+
+
+@functools.lru_cache(maxsize=_BACKGROUND_CACHE_SIZE)
+def _draw_background(square_width: int, theme: _Theme, flip_perspective: bool) -> Image.Image:
+    """
+    Draw the empty board and its square coordinates, which are the same for every frame of a plot.
+
+    The image will be a 10x10 grid. The result is cached and shared between every ChessPlot in the process, so it
+    must never be drawn on directly. Each frame should start from a copy of it.
+
+    Args:
+        square_width (int): The width of each square of the board.
+        theme (_Theme): The theme to be used for the board.
+        flip_perspective (bool): Indicator of whether the board perspective is flipped.
+
+    Returns:
+        image (Image.Image): An image of the empty board.
+    """
+
+    image = Image.new(mode="RGB", size=(square_width * 10, square_width * 10), color="white")
+    draw = ImageDraw.ImageDraw(im=image)
+
+    square_name_font = _scale_font(
+        text="a",
+        font_name="arial.ttf",
+        max_width=int(square_width * 0.4),
+        max_height=int(square_width * 0.4)
+    )
+
+    x_origin, y_origin = square_width, square_width
+
+    for row in range(0, 8):
+        for col in range(0, 8):
+            x = x_origin + square_width * col
+            y = y_origin + square_width * row
+            square_colour = theme.white_square_colour if (row + col) % 2 == 0 else theme.black_square_colour
+            draw.rectangle(xy=((x, y), (x + square_width, y + square_width)), fill=square_colour)
+
+    for text, xy in _square_labels(square_width=square_width, flip_perspective=flip_perspective):
+        draw.text(
+            xy=xy,
+            text=text,
+            anchor="mm",
+            align="center",
+            font=square_name_font,
+            fill="black",
+            stroke_width=0
+        )
+
+    return image
+
+
+@functools.lru_cache(maxsize=_SPRITE_CACHE_SIZE)
+def _draw_piece_sprites(square_width: int, font_name: str) -> Dict[int, _Sprite]:
+    """
+    Rasterise the alpha masks of every piece for a given square size.
+
+    The result is cached and shared between every ChessPlot in the process.
+
+    Args:
+        square_width (int): The width of each square of the board.
+        font_name (str): The name of the font containing the piece glyphs.
+
+    Returns:
+        sprites (dict): The sprite of each piece, keyed by the code of the piece in a board snapshot. Each sprite
+            is offset from the top left corner of the square it is pasted onto.
+    """
+
+    font = _scale_font(text="♔", font_name=font_name, max_width=square_width, max_height=square_width)
+
+    # the masks are drawn in the centre of a canvas three squares wide so that no part of a piece is cut off
+    canvas_size = (square_width * 3, square_width * 3)
+    centre = square_width + square_width * 0.5
+    start = (math.modf(centre)[0], math.modf(centre)[0])
+
+    sprites = {}
+    for name in _PIECE_NAMES:
+        piece_unicode = _Piece.get_unicode(name=name)
+        outline = _draw_mask(text=piece_unicode, font=font, canvas_size=canvas_size, centre=centre, start=start,
+                             stroke_width=3)
+        glyph = _draw_mask(text=piece_unicode, font=font, canvas_size=canvas_size, centre=centre, start=start)
+
+        box = outline.getbbox() or (0, 0, 1, 1)
+        sprites[ord(name)] = _Sprite(
+            offset=(box[0] - square_width, box[1] - square_width),
+            outline=outline.crop(box=box),
+            glyph=glyph.crop(box=box),
+        )
+
+    return sprites
+
+
+def _draw_mask(
+        text: str,
+        font: ImageFont.FreeTypeFont,
+        canvas_size: Tuple[int, int],
+        centre: float,
+        start: Tuple[float, float],
+        stroke_width: int = 0
+) -> Image.Image:
+    """
+    Rasterise the alpha mask of a piece of text centred on a canvas.
+
+    Unlike ImageDraw.text, which also fills in the text after drawing its outline, only the outline is drawn
+    when a stroke width is given, so that each mask matches a single pass of ImageDraw.text exactly.
+
+    Args:
+        text (str): The text to be rasterised.
+        font (ImageFont.FreeTypeFont): The font of the text.
+        canvas_size (tuple): The width and height of the canvas.
+        centre (float): The x and y coordinate of the centre of the text.
+        start (tuple): The fractional part of the coordinates of the centre of the text.
+        stroke_width (int): The width of the outline of the text (default 0).
+
+    Returns:
+        mask (Image.Image): The alpha mask of the text.
+    """
+
+    mask, offset = font.getmask2(text, "L", stroke_width=stroke_width, anchor="mm", start=start)
+    canvas = Image.new(mode="L", size=canvas_size, color=0)
+    left, upper = int(centre) + offset[0], int(centre) + offset[1]
+    # the mask is a core image, so it is pasted onto the core image of the canvas
+    canvas.im.paste(mask, (left, upper, left + mask.size[0], upper + mask.size[1]))
+    return canvas
+
+
+class _ImageCanvas:
+    """A class for drawing a frame as an image, onto which _Renderer pastes the move text and piece sprites.
+
+    Attributes:
+        image (Image.Image): The frame being drawn.
+        _background (Image.Image): The background of each frame.
+        _sprites (dict): The pre-rendered sprite of each piece, keyed by the code of the piece.
+    """
+
+    __white = (255, 255, 255)
+    __black = (0, 0, 0)
+
+    def __init__(self, image: Image.Image, background: Image.Image, sprites: Dict[int, _Sprite]) -> None:
+        """
+        Constructor method for the _ImageCanvas class.
+
+        Args:
+            image (Image.Image): The frame to be drawn on.
+            background (Image.Image): The background of each frame.
+            sprites (dict): The pre-rendered sprite of each piece, keyed by the code of the piece.
+        """
+
+        self.image = image
+        self._background = background
+        self._sprites = sprites
+
+    def restore(self, box: Tuple[int, int, int, int]) -> None:
+        """
+        Restore a region of the frame to the background.
+
+        Args:
+            box (tuple): The left, upper, right and lower coordinates of the region.
+        """
+
+        self.image.paste(im=self._background.crop(box=box), box=box)
+        return
+
+    def paste(self, image: Image.Image, box: Tuple[int, int, int, int]) -> None:
+        """
+        Paste an image over a region of the frame.
+
+        Args:
+            image (Image.Image): The image to be pasted, the same size as the region.
+            box (tuple): The left, upper, right and lower coordinates of the region.
+        """
+
+        self.image.paste(im=image, box=box)
+        return
+
+    def paste_sprite(self, piece_code: int, xy: Tuple[int, int], box: Tuple[int, int, int, int]) -> None:
+        """
+        Paste the part of a piece sprite within a region of the frame, as its outline in white and then its glyph in
+        white and in black.
+
+        Args:
+            piece_code (int): The code of the piece.
+            xy (tuple): The position of the top left corner of the whole sprite.
+            box (tuple): The left, upper, right and lower coordinates of the region, within the sprite.
+        """
+
+        sprite = self._sprites[piece_code]
+        outline, glyph = sprite.outline, sprite.glyph
+        if box != (xy[0], xy[1], xy[0] + outline.size[0], xy[1] + outline.size[1]):
+            mask_box = (box[0] - xy[0], box[1] - xy[1], box[2] - xy[0], box[3] - xy[1])
+            outline, glyph = outline.crop(box=mask_box), glyph.crop(box=mask_box)
+        self.image.paste(im=_ImageCanvas.__white, box=box, mask=outline)  # add outline to piece
+        self.image.paste(im=_ImageCanvas.__white, box=box, mask=glyph)
+        self.image.paste(im=_ImageCanvas.__black, box=box, mask=glyph)
+        return
+
+
+class _ArrayCanvas:
+    """A class for compositing a frame into an array, in the same way as pasting onto an _ImageCanvas.
+
+    Attributes:
+        array (np.ndarray): The RGB array of the frame being drawn.
+        _background (np.ndarray): The background of each frame as an array.
+        _sprites (dict): The outline and glyph masks of each sprite as arrays, keyed by the code of the piece.
+    """
+
+    def __init__(
+            self,
+            array: np.ndarray,
+            background: np.ndarray,
+            sprites: Dict[int, Tuple[np.ndarray, np.ndarray]]
+    ) -> None:
+        """
+        Constructor method for the _ArrayCanvas class.
+
+        Args:
+            array (np.ndarray): The RGB array of the frame to be drawn on.
+            background (np.ndarray): The background of each frame as an array.
+            sprites (dict): The outline and glyph masks of each sprite as integer arrays with shape (height, width,
+                1), keyed by the code of the piece.
+        """
+
+        self.array = array
+        self._background = background
+        self._sprites = sprites
+
+    def restore(self, box: Tuple[int, int, int, int]) -> None:
+        """
+        Restore a region of the frame to the background.
+
+        Args:
+            box (tuple): The left, upper, right and lower coordinates of the region.
+        """
+
+        left, upper, right, lower = box
+        self.array[upper:lower, left:right] = self._background[upper:lower, left:right]
+        return
+
+    def paste(self, image: Image.Image, box: Tuple[int, int, int, int]) -> None:
+        """
+        Paste an image over a region of the frame.
+
+        Args:
+            image (Image.Image): The image to be pasted, the same size as the region.
+            box (tuple): The left, upper, right and lower coordinates of the region.
+        """
+
+        left, upper, right, lower = box
+        self.array[upper:lower, left:right] = np.asarray(image)
+        return
+
+    def paste_sprite(self, piece_code: int, xy: Tuple[int, int], box: Tuple[int, int, int, int]) -> None:
+        """
+        Blend the part of a piece sprite within a region of the frame, as its outline in white and then its glyph in
+        white and in black.
+
+        Args:
+            piece_code (int): The code of the piece.
+            xy (tuple): The position of the top left corner of the whole sprite.
+            box (tuple): The left, upper, right and lower coordinates of the region, within the sprite.
+        """
+
+        outline, glyph = self._sprites[piece_code]
+        left, upper, right, lower = box
+        masks = (slice(upper - xy[1], lower - xy[1]), slice(left - xy[0], right - xy[0]))
+        region = self.array[upper:lower, left:right]
+        _blend(region=region, colour=255, mask=outline[masks])  # add outline to piece
+        _blend(region=region, colour=255, mask=glyph[masks])
+        _blend(region=region, colour=0, mask=glyph[masks])
+        return
+
+
+class _Renderer:
+    """A class for drawing the frames of a plot from board snapshots.
+
+    A renderer holds everything needed to draw a frame, so it can be sent to another process to draw part of a
+    plot. Only the settings and header are pickled, the background, sprites and fonts are fetched from the
+    process-wide caches when the renderer is unpickled.
+
+    Attributes:
+        settings (_Settings): A collection of settings for the plot.
+        header_image (Image.Image): A header image for each frame of the plot, or None if it isn't displayed.
+        _background (Image.Image): The background of each frame, including the header and empty board.
+        _piece_sprites (dict): The pre-rendered sprite of each piece, keyed by the code of the piece.
+        _move_text_font (ImageFont.FreeTypeFont): A font for drawing move notations.
+        _background_array (np.ndarray): The background as an array, or None until a frame is drawn as an array.
+        _sprite_arrays (dict): The outline and glyph masks of each sprite as arrays, keyed by the code of the piece,
+            or None until a frame is drawn as an array.
+    """
+
+    def __init__(self, settings: _Settings, header_image: Image.Image = None) -> None:
+        """
+        Constructor method for the _Renderer class.
+
+        Args:
+            settings (_Settings): A collection of settings for the plot.
+            header_image (Image.Image): A header image for each frame of the plot (default None).
+        """
+
+        self.settings = settings
+        self.header_image = header_image
+
+        board_background = _draw_background(
+            square_width=settings.square_width,
+            theme=settings.theme,
+            flip_perspective=settings.flip_perspective
+        )
+        if settings.display_header:
+            header_height = header_image.size[1]
+            self._background = Image.new(
+                mode="RGB",
+                size=(settings.plot_size, settings.plot_size + header_height),
+                color="white"
+            )
+            self._background.paste(board_background, (0, header_height))
+            self._background.paste(header_image, (0, 0))
+        else:
+            self._background = board_background
+
+        self._piece_sprites = _draw_piece_sprites(square_width=settings.square_width, font_name="seguisym.ttf")
+        self._move_text_font = None
+        if settings.display_notation:
+            self._move_text_font = _scale_font(
+                text="1. e4",
+                font_name="arial.ttf",
+                max_width=int(settings.square_width * 0.8),
+                max_height=int(settings.square_width * 0.8)
+            )
+        self._background_array = None
+        self._sprite_arrays = None
+
+    def __getstate__(self) -> Tuple[_Settings, Image.Image]:
+        return self.settings, self.header_image
+
+    def __setstate__(self, state: Tuple[_Settings, Image.Image]) -> None:
+        settings, header_image = state
+        self.__init__(settings=settings, header_image=header_image)
+
+    def draw(
+            self,
+            board: bytes,
+            ply_string: str = "",
+            previous_frame: Image.Image = None,
+            previous_board: bytes = None
+    ) -> Image.Image:
+        """
+        Draw an image of the board in its current state.
+
+        If the previous frame is given, it is copied and only the squares which have changed since the previous
+        board and the move text are redrawn. The result is identical to drawing the whole frame.
+
+        Args:
+            board (bytes): A snapshot of the game board following the ply being drawn.
+            ply_string (str): A string describing the ply being drawn.
+            previous_frame (Image.Image): The frame of the previous board (default None).
+            previous_board (bytes): A snapshot of the game board drawn in the previous frame (default None).
+
+        Returns:
+            frame (Image.Image): An image depicting the game board in its current state.
+        """
+
+        frame = self._background.copy() if previous_frame is None else previous_frame.copy()
+        canvas = _ImageCanvas(image=frame, background=self._background, sprites=self._piece_sprites)
+        if previous_frame is None:
+            self._draw_board(canvas=canvas, board=board, ply_string=ply_string)
+            return frame
+
+        for box in self._changed_boxes(board=board, previous_board=previous_board):
+            self._draw_board(canvas=canvas, board=board, ply_string=ply_string, box=box)
+        return frame
+
+    def _draw_board(
+            self,
+            canvas: Union[_ImageCanvas, _ArrayCanvas],
+            board: bytes,
+            ply_string: str = "",
+            box: Tuple[int, int, int, int] = None
+    ) -> None:
+        """
+        Draw the pieces of a given game board and the ply being drawn onto a copy of the background.
+
+        Pieces are pasted from pre-rendered sprites rather than drawn as text. Squares are drawn in order from the
+        top left of the frame, each square covering any part of a piece in the square before it which overlaps it.
+        As the squares are already drawn on the background, any part of a piece which overlaps a square drawn after
+        it is covered by restoring the background.
+
+        If a box is given, only that region of the frame is redrawn, starting from the background. The move text
+        is only drawn if the box contains the whole strip above the board.
+
+        Args:
+            canvas (_ImageCanvas | _ArrayCanvas): A copy of the background of the plot, or of an earlier frame, to
+                draw on.
+            board (bytes): A snapshot of the game board to be drawn.
+            ply_string (str): A string describing the ply being drawn e.g. 1. e4.
+            box (tuple): The left, upper, right and lower coordinates of the region to be redrawn (default None
+                i.e. the whole frame, which must be a copy of the background).
+        """
+
+        square_width = self.settings.square_width
+        y_offset = self.header_image.size[1] if self.settings.display_header else 0
+        x_origin, y_origin = square_width, square_width + y_offset
+        board_end = x_origin + square_width * 8 + 1  # the squares are drawn including their bottom right edge
+        frame_width, frame_height = self._background.size
+
+        if box is None:
+            box = (0, 0, frame_width, frame_height)
+        else:
+            canvas.restore(box=box)
+
+        # move text, which is covered by the board where they overlap
+        move_text_box = (0, y_offset, frame_width, y_origin)
+        if self.settings.display_notation and _intersect_boxes(box, move_text_box) == move_text_box:
+            move_text_strip = self._background.crop(box=move_text_box)
+            ImageDraw.ImageDraw(im=move_text_strip).text(
+                xy=(x_origin, square_width * 0.5),
+                text=ply_string,
+                align="left",
+                font=self._move_text_font,
+                fill="black"
+            )
+            canvas.paste(image=move_text_strip, box=move_text_box)
+
+        if not self.settings.flip_perspective:
+            board = board[::-1]  # rotate the board by 180 degrees
+
+        for square, piece_code in enumerate(board):
+            if piece_code == _EMPTY_SQUARE:
+                continue
+            row, col = divmod(square, 8)
+            x = x_origin + square_width * col
+            y = y_origin + square_width * row
+            sprite = self._piece_sprites[piece_code]
+            sprite_x, sprite_y = x + sprite.offset[0], y + sprite.offset[1]
+            sprite_box = (sprite_x, sprite_y, sprite_x + sprite.outline.size[0], sprite_y + sprite.outline.size[1])
+            paste_box = _intersect_boxes(sprite_box, box)
+            if paste_box is None:
+                continue
+            canvas.paste_sprite(piece_code=piece_code, xy=(sprite_x, sprite_y), box=paste_box)
+
+            # restore the squares drawn after this one, to the right and below
+            if col < 7:
+                restore_box = _intersect_boxes(
+                    (x + square_width, y, min(x + square_width * 2 + 1, board_end), y + square_width + 1),
+                    box
+                )
+                if restore_box is not None:
+                    canvas.restore(box=restore_box)
+            if row < 7:
+                restore_box = _intersect_boxes(
+                    (
+                        max(x - square_width, x_origin),
+                        y + square_width,
+                        min(x + square_width * 2 + 1, board_end),
+                        y + square_width * 2 + 1
+                    ),
+                    box
+                )
+                if restore_box is not None:
+                    canvas.restore(box=restore_box)
+        return
+
+    def draw_stack(self, boards: List[Tuple[str, bytes]]) -> np.ndarray:
+        """
+        Draw the frames of a consecutive range of boards into a single array.
+
+        Frames are composited straight into the array with NumPy rather than drawn as images, using the same
+        layout as draw. Only the first frame
+        is drawn in full, each following frame is copied from the one before it and only the regions which have
+        changed are redrawn. Each frame is identical to the image drawn by draw.
+
+        Args:
+            boards (list): The ply string and board snapshot of each frame.
+
+        Returns:
+            frames (np.ndarray): An array of unsigned 8-bit integers with shape (frames, height, width, 3).
+        """
+
+        if self._background_array is None:
+            self._background_array = np.asarray(self._background)
+            self._sprite_arrays = {
+                piece_code: (
+                    np.asarray(sprite.outline, dtype=np.int32)[..., np.newaxis],
+                    np.asarray(sprite.glyph, dtype=np.int32)[..., np.newaxis]
+                )
+                for piece_code, sprite in self._piece_sprites.items()
+            }
+
+        frames = np.empty((len(boards),) + self._background_array.shape, dtype=np.uint8)
+        previous_board = None
+        for index, (ply_string, board) in enumerate(boards):
+            canvas = _ArrayCanvas(array=frames[index], background=self._background_array, sprites=self._sprite_arrays)
+            if previous_board is None:
+                frames[index] = self._background_array
+                self._draw_board(canvas=canvas, board=board, ply_string=ply_string)
+            else:
+                frames[index] = frames[index - 1]
+                for box in self._changed_boxes(board=board, previous_board=previous_board):
+                    self._draw_board(canvas=canvas, board=board, ply_string=ply_string, box=box)
+            previous_board = board
+        return frames
+
+    def _changed_boxes(self, board: bytes, previous_board: bytes) -> List[Tuple[int, int, int, int]]:
+        """
+        Find the regions of a frame which differ from the frame of the previous board.
+
+        Each changed square covers the furthest extent of any piece sprite around it. If move notation is
+        displayed, the strip above the board is always included and the squares are cut off below it.
+
+        Args:
+            board (bytes): A snapshot of the game board to be drawn.
+            previous_board (bytes): A snapshot of the game board drawn in the previous frame.
+
+        Returns:
+            boxes (list): The left, upper, right and lower coordinates of each region to be redrawn.
+        """
+
+        square_width = self.settings.square_width
+        y_offset = self.header_image.size[1] if self.settings.display_header else 0
+        x_origin, y_origin = square_width, square_width + y_offset
+        frame_width, frame_height = self._background.size
+
+        sprites = self._piece_sprites.values()
+        left = min(sprite.offset[0] for sprite in sprites)
+        upper = min(sprite.offset[1] for sprite in sprites)
+        right = max(sprite.offset[0] + sprite.outline.size[0] for sprite in sprites)
+        lower = max(sprite.offset[1] + sprite.outline.size[1] for sprite in sprites)
+
+        boxes = []
+        if self.settings.display_notation:
+            boxes.append((0, y_offset, frame_width, y_origin))
+            clip_box = (0, y_origin, frame_width, frame_height)
+        else:
+            clip_box = (0, 0, frame_width, frame_height)
+
+        for square in range(64):
+            if board[square] == previous_board[square]:
+                continue
+            row, col = divmod(square if self.settings.flip_perspective else 63 - square, 8)
+            x = x_origin + square_width * col
+            y = y_origin + square_width * row
+            changed_box = _intersect_boxes((x + left, y + upper, x + right, y + lower), clip_box)
+            if changed_box is not None:
+                boxes.append(changed_box)
+        return boxes
+
+    def draw_range(self, boards: List[Tuple[str, bytes]]) -> List[Image.Image]:
+        """
+        Draw the frames of a consecutive range of boards.
+
+        Only the first frame is drawn in full, each following frame is drawn from the one before it.
+
+        Args:
+            boards (list): The ply string and board snapshot of each frame.
+
+        Returns:
+            frames (list): An image of each frame.
+        """
+
+        frames = []
+        previous_frame, previous_board = None, None
+        for ply_string, board in boards:
+            previous_frame = self.draw(
+                board=board,
+                ply_string=ply_string,
+                previous_frame=previous_frame,
+                previous_board=previous_board
+            )
+            previous_board = board
+            frames.append(previous_frame)
+        return frames
+
+
+_worker_renderer = None  # the renderer of a worker process, set when the process starts
+
+
+def _start_worker(renderer: _Renderer) -> None:
+    """
+    Set the renderer of a worker process drawing frames for a process pool.
+
+    Unpickling the renderer fetches its background, sprites and fonts, so the caches of the worker are warm
+    before it draws its first frame.
+
+    Args:
+        renderer (_Renderer): The renderer of the plot.
+    """
+
+    global _worker_renderer
+    _worker_renderer = renderer
+    return
+
+
+def _draw_frame_range(boards: List[Tuple[str, bytes]]) -> List[Image.Image]:
+    """
+    Draw the frames of a consecutive range of boards in a worker process.
+
+    Args:
+        boards (list): The ply string and board snapshot of each frame.
+
+    Returns:
+        frames (list): An image of each frame.
+    """
+
+    return _worker_renderer.draw_range(boards=boards)
@@ -61,19 +61,20 @@ class _Settings:
         self.start_frame = start_frame
         self.end_frame = end_frame
 
-    def __hash__(self):
-        return hash(
-            (
-                self.theme,
-                self.display_header,
-                self.flip_perspective,
-                self.plot_size,
-                self.display_notation,
-                self.start_frame,
-                self.end_frame,
-            )
+    @property
+    def render_key(self) -> tuple:
+        """The settings which change how a frame is drawn, as opposed to which frames are drawn."""
+        return (
+            self.theme,
+            self.display_header,
+            self.flip_perspective,
+            self.plot_size,
+            self.display_notation,
         )
 
+    def __hash__(self):
+        return hash((self.render_key, self.start_frame, self.end_frame))
+
     def __eq__(self, other):
         if not isinstance(other, _Settings):
             return NotImplemented
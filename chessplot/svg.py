@@ -0,0 +1,203 @@
+"""Module for drawing the frames of a plot as .svg documents"""
+
+import functools
+from html import escape
+from typing import List, Tuple
+from PIL import ImageFont
+from .settings import _Settings
+from .renderer import _format_decimal, _text_baseline, _vector_layout, _PIECE_NAMES
+from .piece import _Piece, _EMPTY_SQUARE
+from .glyphs import _load_outlines
+
+
+_format_number = functools.partial(_format_decimal, decimals=2)  # coordinates are rounded to 0.01 pixels
+
+
+class _SvgRenderer:
+    """A class for drawing the frames of a plot as .svg documents, laid out in the same way as a raster frame.
+
+    Everything which is the same in every frame is built once: the header, the board and its square names, and a
+    definition of the checkered squares and of each of the 12 pieces. Drawing a frame only adds a reference to the
+    definition of each piece on the board and the move text, so drawing is string formatting alone. Each element
+    is written on its own line in the same order for every frame, so consecutive frames differ only by the lines
+    of the pieces that moved and the move text.
+
+    Attributes:
+        settings (_Settings): A collection of settings for the plot.
+        size (tuple): The width and height of each frame in pixels.
+        _layout (_VectorLayout): The height of the header, the fonts and the square names of each frame.
+        _start (str): The start of every document, up to and including the board.
+    """
+
+    __piece_stroke_width = 3
+
+    def __init__(self, settings: _Settings, header_texts: List[Tuple[str, ImageFont.FreeTypeFont, tuple]]) -> None:
+        """
+        Constructor method for the _SvgRenderer class.
+
+        Args:
+            settings (_Settings): A collection of settings for the plot.
+            header_texts (list): The text, font and position of the middle of the baseline of each line of the
+                header, or an empty list if it isn't displayed.
+        """
+
+        self.settings = settings
+        self._layout = _vector_layout(settings=settings)
+        self.size = self._layout.size
+        self._start = "\n".join(self._draw_background(header_texts=header_texts)) + "\n"
+
+    def _draw_background(self, header_texts: List[Tuple[str, ImageFont.FreeTypeFont, tuple]]) -> List[str]:
+        """
+        Draw the definitions, header, empty board and its square coordinates.
+
+        Args:
+            header_texts (list): The text, font and position of each line of the header.
+
+        Returns:
+            lines (list): The lines of the start of the document.
+        """
+
+        square_width = self.settings.square_width
+        theme = self.settings.theme
+        width, height = self.size
+        y_offset = self._layout.y_offset
+        x_origin, y_origin = square_width, square_width + y_offset
+
+        lines = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+            f'width="{width}" height="{height}" viewBox="0 0 {width} {height}">',
+            "<defs>",
+            f'<pattern id="squares" width="{square_width * 2}" height="{square_width * 2}" '
+            f'patternUnits="userSpaceOnUse" x="{x_origin}" y="{y_origin}">',
+            f'<rect width="{square_width * 2}" height="{square_width * 2}" fill="{theme.black_square_colour}"/>',
+            f'<rect width="{square_width}" height="{square_width}" fill="{theme.white_square_colour}"/>',
+            f'<rect x="{square_width}" y="{square_width}" width="{square_width}" height="{square_width}" '
+            f'fill="{theme.white_square_colour}"/>',
+            "</pattern>",
+            f'<clipPath id="move-text"><rect y="{y_offset}" width="{width}" height="{square_width}"/></clipPath>',
+        ]
+        lines.extend(self._define_pieces())
+        lines.append("</defs>")
+        lines.append(f'<rect width="{width}" height="{height}" fill="white"/>')
+
+        for text, font, (x, y) in header_texts:
+            lines.append(self._text(text=text, font=font, xy=(x, y), anchor="ms"))
+
+        lines.append(
+            f'<rect x="{x_origin}" y="{y_origin}" width="{square_width * 8}" height="{square_width * 8}" '
+            f'fill="url(#squares)"/>'
+        )
+
+        for text, xy in self._layout.square_labels:
+            lines.append(self._text(text=text, font=self._layout.square_name_font, xy=xy, anchor="mm"))
+        return lines
+
+    def _define_pieces(self) -> List[str]:
+        """
+        Define the glyph of each piece, centred on the origin and filled in black on top of a white outline.
+
+        Returns:
+            lines (list): A path for each piece.
+        """
+
+        font = self._layout.piece_font
+        outlines = _load_outlines(path=font.path)
+        scale = font.size / outlines.units_per_em
+        baseline = _text_baseline(font=font, y=0, anchor="mm")
+
+        lines = []
+        for name in _PIECE_NAMES:
+            glyph_id = outlines.glyph_id(character=_Piece.get_unicode(name=name))
+            left = -outlines.advance(glyph_id=glyph_id) * scale / 2
+            path = []
+            for command in outlines.outline(glyph_id=glyph_id):
+                # points are flipped from font units, with y pointing up, to pixels with y pointing down
+                points = []
+                for x, y in zip(command[1::2], command[2::2]):
+                    points += [_format_number(left + x * scale), _format_number(baseline - y * scale)]
+                path.append(command[0] + " ".join(points))
+            lines.append(
+                f'<path id="piece-{name}" d="{"".join(path)}" fill="black" stroke="white" '
+                f'stroke-width="{_SvgRenderer.__piece_stroke_width * 2}" stroke-linejoin="round" paint-order="stroke"/>'
+            )
+        return lines
+
+    def draw(self, board: bytes, ply_string: str = "") -> str:
+        """
+        Draw an .svg document of the board in its current state.
+
+        Args:
+            board (bytes): A snapshot of the game board following the ply being drawn.
+            ply_string (str): A string describing the ply being drawn e.g. 1. e4.
+
+        Returns:
+            (str): The .svg document.
+        """
+
+        square_width = self.settings.square_width
+        y_offset = self._layout.y_offset
+        x_origin, y_origin = square_width, square_width + y_offset
+        lines = [self._start]
+
+        # move text, which is covered by the board where they overlap
+        if self.settings.display_notation:
+            lines.append(
+                self._text(
+                    text=ply_string,
+                    font=self._layout.move_text_font,
+                    xy=(x_origin, y_offset + square_width * 0.5),
+                    anchor="la",
+                    attributes=' clip-path="url(#move-text)"'
+                ) + "\n"
+            )
+
+        if not self.settings.flip_perspective:
+            board = board[::-1]  # rotate the board by 180 degrees
+
+        for square, piece_code in enumerate(board):
+            if piece_code == _EMPTY_SQUARE:
+                continue
+            row, col = divmod(square, 8)
+            lines.append(
+                f'<use xlink:href="#piece-{chr(piece_code)}" '
+                f'x="{_format_number(x_origin + square_width * (col + 0.5))}" '
+                f'y="{_format_number(y_origin + square_width * (row + 0.5))}"/>\n'
+            )
+        lines.append("</svg>\n")
+        return "".join(lines)
+
+    @staticmethod
+    def _text(
+            text: str,
+            font: ImageFont.FreeTypeFont,
+            xy: Tuple[float, float],
+            anchor: str,
+            attributes: str = ""
+    ) -> str:
+        """
+        Create a text element for a line of black text, in the family and style of a given font.
+
+        Args:
+            text (str): The text to be drawn.
+            font (ImageFont.FreeTypeFont): The font of the text.
+            xy (tuple): The position of the anchor of the text.
+            anchor (str): The horizontal ("l" or "m") and vertical ("a", "m" or "s") alignment of the text with
+                its position.
+            attributes (str): Any other attributes of the element, each preceded by a space (default "").
+
+        Returns:
+            (str): The text element.
+        """
+
+        family, style = font.getname()
+        if anchor[0] == "m":
+            attributes += ' text-anchor="middle"'
+        if "Italic" in style or "Oblique" in style:
+            attributes += ' font-style="italic"'
+        if "Bold" in style:
+            attributes += ' font-weight="bold"'
+        x, y = xy[0], _text_baseline(font=font, y=xy[1], anchor=anchor)
+        return (
+            f'<text x="{_format_number(x)}" y="{_format_number(y)}" font-family="{escape(family)}" '
+            f'font-size="{font.size}"{attributes}>{escape(text, quote=False)}</text>'
+        )
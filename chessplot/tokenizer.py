@@ -0,0 +1,169 @@
+"""Module for tokenizing PGN text"""
+
+import re
+import functools
+from itertools import chain
+from typing import Iterable, Iterator, List, Tuple
+
+
+_TAG_PATTERN = re.compile(r"\s*\[(.*)]")
+# the leading lookaheads let the regex engine skip quickly over text which can't start an annotation
+_ANNOTATION_PATTERN = re.compile(
+    r"(?=[{;$()])"
+    r"(?:(?P<comment>\{[^}]*}|;.*)"
+    r"|(?P<open_comment>\{[^}]*$)"
+    r"|(?P<nag>\$\d+)"
+    r"|(?P<variation_start>\()"
+    r"|(?P<variation_end>\)))"
+)
+# tokens affecting variation depth
+_VARIATION_PATTERN = re.compile(r"(?=[{;()])(?:[()]|\{[^}]*}|;.*|(?P<open_comment>\{[^}]*$))")
+
+
+class _Tokenizer:
+    """A class for splitting PGN text into a stream of typed tokens in a single pass.
+
+    Each token is a tuple of its type and its text. Tags are emitted whole, with the text between the square
+    brackets, as are comments, which keep their braces.
+    """
+
+    TAG = "tag"
+    MOVE_NUMBER = "move_number"
+    SAN = "san"
+    COMMENT = "comment"
+    NAG = "nag"
+    VARIATION_START = "variation_start"
+    VARIATION_END = "variation_end"
+    RESULT = "result"
+
+    __token_cache_size = 4096
+
+    def __init__(self, end_states: List[str], skip_annotations: bool = False) -> None:
+        """
+        Constructor method for the _Tokenizer class.
+
+        Args:
+            end_states (list): A list of strings which denote the end of a game e.g. 1-0.
+            skip_annotations (bool): Indicator of whether comments, NAGs and variations should be consumed without
+                being emitted (default False).
+        """
+
+        self._skip_annotations = skip_annotations
+        results = "|".join(re.escape(end_state) for end_state in sorted(end_states, key=len, reverse=True))
+        self._token_pattern = re.compile(
+            rf"(?P<result>{results})|(?P<move_number>[0-9].*\.)(?P<san_after_number>.+)?|(?P<san>.+)", flags=re.DOTALL
+        )
+        self._split_token = functools.lru_cache(maxsize=_Tokenizer.__token_cache_size)(self._split_token)
+
+    def tokenize(self, lines: Iterable[str]) -> Iterator[Tuple[str, str]]:
+        """
+        Tokenize an iterable of PGN lines e.g. an open file.
+
+        Annotations (comments, NAGs and variation brackets) are found with a single compiled pattern and the
+        plain text between them is split on whitespace into move numbers, SAN and results. Comments may span
+        several lines. When skipping annotations, variations (including nested ones) are skipped by searching
+        only for the tokens which can open or close them.
+
+        Args:
+            lines (iterable): The lines of PGN text to be tokenized.
+
+        Yields:
+            (tuple): The type and text of each token.
+        """
+
+        skip_annotations = self._skip_annotations
+        comment_lines = None  # lines of a comment which has not yet been closed
+        variation_depth = 0  # depth of variations being skipped
+        for line in lines:
+            position = 0
+            if comment_lines is not None:
+                comment_end = line.find("}")
+                if comment_end < 0:
+                    if not skip_annotations:
+                        comment_lines.append(line)
+                    continue
+                position = comment_end + 1
+                if not skip_annotations:
+                    yield _Tokenizer.COMMENT, "".join(comment_lines) + line[:position]
+                comment_lines = None
+            elif line.startswith(("[", " [", "\t[")):
+                tag_search = _TAG_PATTERN.match(line)
+                if tag_search is not None:
+                    variation_depth = 0  # a tag always begins a new game, even after an unclosed variation
+                    yield _Tokenizer.TAG, tag_search.group(1)
+                    continue
+            elif line.startswith("%"):  # escaped line
+                continue
+
+            while True:
+                if variation_depth:
+                    for match in _VARIATION_PATTERN.finditer(line, position):
+                        token = match.group()
+                        if token == "(":
+                            variation_depth += 1
+                        elif token == ")":
+                            variation_depth -= 1
+                            if not variation_depth:
+                                position = match.end()
+                                break
+                        elif match.lastgroup == "open_comment":
+                            comment_lines = []
+                    if variation_depth:  # the rest of the line is within the variation
+                        break
+
+                for match in _ANNOTATION_PATTERN.finditer(line, position):
+                    yield from self._split_plain_text(text=line[position:match.start()])
+                    position = match.end()
+                    token_type = match.lastgroup
+                    if token_type == "open_comment":
+                        comment_lines = [match.group()] if not skip_annotations else []
+                        break
+                    if skip_annotations:
+                        if token_type == _Tokenizer.VARIATION_START:
+                            variation_depth = 1
+                            break
+                        continue
+                    yield token_type, match.group()
+                else:
+                    yield from self._split_plain_text(text=line[position:])
+
+                if not variation_depth:
+                    break
+
+    def _split_plain_text(self, text: str) -> Iterator[Tuple[str, str]]:
+        """
+        Split movetext containing no annotations into move numbers, SAN and results.
+
+        The text is split on whitespace and each word is classified by _split_token. Since a game is written with a
+        small vocabulary of words, almost every word is found in the cache of _split_token and no Python code is run
+        per word.
+
+        Args:
+            text (str): The movetext to be split.
+
+        Returns:
+            (iterator): The type and text of each token.
+        """
+
+        return chain.from_iterable(map(self._split_token, text.split()))
+
+    def _split_token(self, word: str) -> Tuple[Tuple[str, str], ...]:
+        """
+        Split a word of movetext into a result, a move number, a SAN or a move number joined to a SAN e.g. 1.e4.
+
+        Args:
+            word (str): A word of movetext, containing no whitespace.
+
+        Returns:
+            (tuple): The type and text of each token in the word.
+        """
+
+        match = self._token_pattern.fullmatch(word)
+        if match.lastgroup == _Tokenizer.RESULT:
+            return (_Tokenizer.RESULT, word),
+        if match.lastgroup == _Tokenizer.SAN:
+            return (_Tokenizer.SAN, word),
+        move_number = match.group(_Tokenizer.MOVE_NUMBER)
+        if move_number == word:
+            return (_Tokenizer.MOVE_NUMBER, word),
+        return (_Tokenizer.MOVE_NUMBER, move_number), (_Tokenizer.SAN, match.group("san_after_number"))
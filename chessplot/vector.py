@@ -0,0 +1,120 @@
+"""Module for drawing the frames of a plot as vector pages of a .pdf"""
+
+from typing import List, Tuple
+from PIL import ImageFont
+from .settings import _Settings
+from .renderer import _vector_layout
+from .piece import _Piece, _EMPTY_SQUARE
+from .pdf import _PdfWriter
+
+
+class _PdfRenderer:
+    """A class for drawing the frames of a plot as pages of a vector .pdf, laid out in the same way as a raster frame.
+
+    The header, squares and square names, which are the same on every page, are drawn once as a form shared by
+    every page, so each page only holds the move text and the pieces.
+
+    Attributes:
+        settings (_Settings): A collection of settings for the plot.
+        size (tuple): The width and height of each page in pixels of a raster frame.
+        _writer (_PdfWriter): The writer of the document the pages are added to.
+        _layout (_VectorLayout): The height of the header, the fonts and the square names of each page.
+        _background (tuple): The name and object number of the form of the background.
+    """
+
+    __piece_stroke_width = 3
+
+    def __init__(
+            self,
+            settings: _Settings,
+            header_texts: List[Tuple[str, ImageFont.FreeTypeFont, tuple]],
+            writer: _PdfWriter
+    ) -> None:
+        """
+        Constructor method for the _PdfRenderer class.
+
+        Args:
+            settings (_Settings): A collection of settings for the plot.
+            header_texts (list): The text, font and position of the middle of the baseline of each line of the
+                header, or an empty list if it isn't displayed.
+            writer (_PdfWriter): The writer of the document the pages are added to.
+        """
+
+        self.settings = settings
+        self._writer = writer
+        self._layout = _vector_layout(settings=settings)
+        self.size = self._layout.size
+        self._background = self._draw_background(header_texts=header_texts)
+
+    def _draw_background(self, header_texts: List[Tuple[str, ImageFont.FreeTypeFont, tuple]]) -> Tuple[str, int]:
+        """
+        Draw the header, empty board and its square coordinates as a form.
+
+        Args:
+            header_texts (list): The text, font and position of each line of the header.
+
+        Returns:
+            (tuple): The name and object number of the form.
+        """
+
+        square_width = self.settings.square_width
+        theme = self.settings.theme
+        canvas = self._writer.canvas(size=self.size)
+        canvas.fill_rectangle(box=(0, 0) + self.size, colour="white")
+
+        for text, font, xy in header_texts:
+            canvas.draw_text(text=text, font=font, xy=xy, anchor="ms")
+
+        x_origin, y_origin = square_width, square_width + self._layout.y_offset
+        for row in range(0, 8):
+            for col in range(0, 8):
+                x = x_origin + square_width * col
+                y = y_origin + square_width * row
+                square_colour = theme.white_square_colour if (row + col) % 2 == 0 else theme.black_square_colour
+                canvas.fill_rectangle(box=(x, y, x + square_width, y + square_width), colour=square_colour)
+
+        for text, xy in self._layout.square_labels:
+            canvas.draw_text(text=text, font=self._layout.square_name_font, xy=xy, anchor="mm")
+
+        return self._writer.add_form(canvas=canvas)
+
+    def draw(self, board: bytes, ply_string: str = "") -> None:
+        """
+        Draw a page of the board in its current state and add it to the document.
+
+        Args:
+            board (bytes): A snapshot of the game board following the ply being drawn.
+            ply_string (str): A string describing the ply being drawn e.g. 1. e4.
+        """
+
+        square_width = self.settings.square_width
+        y_offset = self._layout.y_offset
+        x_origin, y_origin = square_width, square_width + y_offset
+        canvas = self._writer.canvas(size=self.size)
+        canvas.draw_form(form=self._background)
+
+        # move text, which is covered by the board where they overlap
+        if self.settings.display_notation and ply_string:
+            canvas.draw_text(
+                text=ply_string,
+                font=self._layout.move_text_font,
+                xy=(x_origin, y_offset + square_width * 0.5),
+                clip_box=(0, y_offset, self.size[0], y_origin)
+            )
+
+        if not self.settings.flip_perspective:
+            board = board[::-1]  # rotate the board by 180 degrees
+
+        for square, piece_code in enumerate(board):
+            if piece_code == _EMPTY_SQUARE:
+                continue
+            row, col = divmod(square, 8)
+            canvas.draw_piece(
+                text=_Piece.get_unicode(name=chr(piece_code)),
+                font=self._layout.piece_font,
+                xy=(x_origin + square_width * (col + 0.5), y_origin + square_width * (row + 0.5)),
+                stroke_width=_PdfRenderer.__piece_stroke_width
+            )
+
+        self._writer.add_page(canvas=canvas)
+        return
@@ -19,7 +19,13 @@ setup(
     keywords=["chess", "pgn", "visualisation", "parser", "gif", "pdf"],
     packages=["chessplot"],
     python_requires=">=3.7",
-    install_requires=["numpy>=1.21.1", "Pillow>=8.3.1"],
+    install_requires=[
+        "numpy>=1.21.1",
+        # 9.4.0 added the start argument of FreeTypeFont.getmask2, used to draw sprites. Nothing removed in Pillow 10
+        # (e.g. FreeTypeFont.getsize) is used, so there is no upper bound. The .gif writer also calls the private
+        # ImageFile._save as Pillow's GIF plugin does, which is unchanged from 9.4 to 11.
+        "Pillow>=9.4.0",
+    ],
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: End Users/Desktop",
@@ -0,0 +1,30 @@
+"""Shared fixtures for the chessplot tests"""
+
+import os
+import pytest
+from PIL import ImageFont
+
+
+_DATA_DIRECTORY = os.path.join(os.path.dirname(__file__), "data")
+
+
+@pytest.fixture
+def data_path():
+    """Get the path of a file in the test data directory."""
+
+    def path(file_name: str) -> str:
+        return os.path.join(_DATA_DIRECTORY, file_name)
+
+    return path
+
+
+@pytest.fixture
+def fonts():
+    """Skip a test which draws frames if the fonts used by plots can't be found."""
+
+    for font_name in ("arial.ttf", "arialbd.ttf", "ariali.ttf", "seguisym.ttf"):
+        try:
+            ImageFont.truetype(font=font_name, size=10)
+        except OSError:
+            pytest.skip(f"The font {font_name} is not installed.")
+    return
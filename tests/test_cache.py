@@ -0,0 +1,47 @@
+"""Tests for caching the drawn frames of a plot"""
+
+from PIL import Image
+from chessplot import ChessPlot
+from chessplot.cache import _FrameCache
+
+
+def _frame(colour: str) -> Image.Image:
+    return Image.new(mode="RGB", size=(10, 10), color=colour)  # 400 bytes
+
+
+def test_least_recently_used_frames_are_evicted():
+    """Once the cache is full, the frames used longest ago are evicted first, and getting a frame counts as a use."""
+
+    cache = _FrameCache(max_bytes=1200)
+    frames = {key: _frame(colour=colour) for key, colour in zip("abcd", ("red", "green", "blue", "white"))}
+    for key in "abc":
+        cache.put(key=key, frame=frames[key])
+    assert cache.get(key="a") is frames["a"]
+    cache.put(key="d", frame=frames["d"])
+    assert cache.get(key="b") is None
+    assert [cache.get(key=key) for key in "acd"] == [frames["a"], frames["c"], frames["d"]]
+
+
+def test_replaced_and_oversized_frames():
+    """Replacing a frame frees the space of the old frame, and a frame larger than the whole cache isn't cached."""
+
+    cache = _FrameCache(max_bytes=800)
+    cache.put(key="a", frame=_frame(colour="red"))
+    replacement = _frame(colour="green")
+    cache.put(key="a", frame=replacement)
+    cache.put(key="b", frame=_frame(colour="blue"))
+    assert cache.get(key="a") is replacement
+    cache.put(key="c", frame=Image.new(mode="RGB", size=(20, 20)))
+    assert cache.get(key="c") is None
+    assert cache.get(key="b") is not None
+
+
+def test_changing_the_frame_window_reuses_frames(fonts, data_path, monkeypatch):
+    """Frames drawn for one frame window are reused by an overlapping window with the same settings."""
+
+    plot = ChessPlot(pgn=data_path("fischer_spassky.pgn"))
+    plot._update_plot_settings(plot_size=400, start_frame=0, end_frame=20)
+    first = list(plot._iter_frames())
+    monkeypatch.setattr(plot, "_create_renderer", lambda: None)  # any frame which is redrawn fails
+    plot._update_plot_settings(plot_size=400, start_frame=5, end_frame=15)
+    assert list(plot._iter_frames()) == first[5:16]
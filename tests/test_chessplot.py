@@ -0,0 +1,113 @@
+"""Tests for creating plots, choosing their frames and saving them"""
+
+import io
+import shutil
+import itertools
+import pytest
+from chessplot import ChessPlot
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [{"start_frame": 50, "end_frame": 10}, {"start_frame": -1, "end_frame": 3}, {"start_frame": 0, "end_frame": 86}],
+    ids=["reversed", "negative", "past_end"]
+)
+def test_frame_range_error_reports_whole_game(data_path, settings):
+    """An invalid frame window on a plot which hasn't been replayed yet reports every frame of the game."""
+
+    plot = ChessPlot(pgn=data_path("fischer_spassky.pgn"))
+    with pytest.raises(ValueError, match="between 0 and 85"):
+        plot.to_array(**settings)
+
+
+@pytest.mark.parametrize("method", ["to_png_sequence", "to_svg_sequence"])
+@pytest.mark.parametrize("settings", [{"start_frame": 0}, {"end_frame": 10}], ids=["start_frame", "end_frame"])
+def test_sequence_frames_with_frame_window_raises(data_path, tmp_path, method, settings):
+    """A sequence can be chosen by its frames or by a frame window, but not both."""
+
+    plot = ChessPlot(pgn=data_path("fischer_spassky.pgn"))
+    with pytest.raises(ValueError, match="not both"):
+        getattr(plot, method)(directory=str(tmp_path), frames=[1, 2], **settings)
+    assert not list(tmp_path.iterdir())
+
+
+def _replayed_boards(plot: ChessPlot) -> list:
+    plot._replay_to(ply=10 ** 6)
+    return list(plot._history.iter_boards())
+
+
+def test_game_from_text_or_stream_matches_file(data_path):
+    """A game given as text, a text stream or a binary stream is the same as the game read from its file."""
+
+    path = data_path("fischer_spassky.pgn")
+    with open(path, encoding="utf-8") as file:
+        text = file.read()
+    expected = _replayed_boards(plot=ChessPlot(pgn=path))
+    assert _replayed_boards(plot=ChessPlot.from_text(pgn_text=text)) == expected
+    assert _replayed_boards(plot=ChessPlot(pgn=io.StringIO(text))) == expected
+    assert _replayed_boards(plot=ChessPlot(pgn=io.BytesIO(text.encode("utf-8")))) == expected
+
+
+def test_string_is_always_a_path(data_path, tmp_path):
+    """A string is read as a path even if it looks like movetext, and is never parsed as PGN text."""
+
+    path = tmp_path / "round 1. e4.pgn"
+    shutil.copyfile(data_path("fischer_spassky.pgn"), path)
+    assert ChessPlot(pgn=str(path)).metadata.white == "Fischer, Robert J."
+    with pytest.raises(FileNotFoundError):
+        ChessPlot(pgn=str(tmp_path / "missing.pgn"))
+    with pytest.raises(ValueError):
+        ChessPlot(pgn="e4 e5 *")
+
+
+def test_text_plot_needs_save_path():
+    """A game given as text has no default save path."""
+
+    plot = ChessPlot.from_text(pgn_text="1. e4 e5 *")
+    with pytest.raises(ValueError, match="save path"):
+        plot.to_svg(frame=0)
+
+
+def test_bytes_match_saved_files(fonts, data_path, tmp_path):
+    """Encoding a plot in memory gives the same bytes as saving it to a path or a file-like object."""
+
+    plot = ChessPlot(pgn=data_path("fischer_spassky.pgn"))
+    settings = {"plot_size": 400, "end_frame": 6}
+    for extension in ("gif", "pdf"):
+        path = tmp_path / f"plot.{extension}"
+        getattr(plot, f"to_{extension}")(save_path=str(path), **settings)
+        buffer = io.BytesIO()
+        getattr(plot, f"to_{extension}")(save_path=buffer, **settings)
+        assert getattr(plot, f"to_{extension}_bytes")(**settings) == path.read_bytes() == buffer.getvalue()
+    path = tmp_path / "plot.png"
+    plot.to_png(frame=3, save_path=str(path), plot_size=400)
+    assert plot.to_png_bytes(frame=3, plot_size=400) == path.read_bytes()
+
+
+def test_export_matches_single_formats(fonts, data_path, tmp_path):
+    """Exporting several formats at once gives the same files as saving each format on its own."""
+
+    plot = ChessPlot(pgn=data_path("fischer_spassky.pgn"))
+    settings = {"plot_size": 400, "end_frame": 12}
+    targets = {extension: str(tmp_path / f"plot.{extension}") for extension in ("gif", "pdf", "png")}
+    plot.export(targets=targets, png_frame=5, **settings)
+    assert (tmp_path / "plot.gif").read_bytes() == plot.to_gif_bytes(**settings)
+    assert (tmp_path / "plot.pdf").read_bytes() == plot.to_pdf_bytes(**settings)
+    assert (tmp_path / "plot.png").read_bytes() == plot.to_png_bytes(frame=5, plot_size=400)
+
+
+def test_failed_export_leaves_no_files(fonts, data_path, tmp_path, monkeypatch):
+    """A .gif which fails part way through drawing is removed, and the .png of a later frame is never written."""
+
+    plot = ChessPlot(pgn=data_path("fischer_spassky.pgn"))
+    draw_frames = plot._iter_frames
+
+    def failing_frames(*args, **kwargs):
+        yield from itertools.islice(draw_frames(*args, **kwargs), 3)
+        raise RuntimeError("drawing failed")
+
+    monkeypatch.setattr(plot, "_iter_frames", failing_frames)
+    targets = {extension: str(tmp_path / f"plot.{extension}") for extension in ("gif", "png")}
+    with pytest.raises(RuntimeError, match="drawing failed"):
+        plot.export(targets=targets, png_frame=10, plot_size=400, end_frame=12)
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,96 @@
+"""Tests for reading the games of a .pgn database"""
+
+import io
+from typing import Iterable, List
+from chessplot import ChessPlot
+from chessplot.index import _GameIndex
+from chessplot.parser import _Parser
+
+
+_END_STATES = ["1-0", "0-1", "1/2-1/2", "*"]
+_DATABASE_FILES = ["annotated.pgn", "fischer_spassky.pgn", "special_moves.pgn"]
+
+
+def test_database_is_split_into_games(data_path):
+    """Games are split at their results and tags, but not at tags within comments, and escaped lines are ignored."""
+
+    plots = list(ChessPlot.from_database(pgn=data_path("annotated.pgn"), metadata_only=True))
+    assert [plot.metadata.white for plot in plots] == ["White Player", "Second White", "Unknown", "Fourth White"]
+    assert [plot.metadata.result for plot in plots] == ["1-0", "", "", ""]
+
+
+def test_database_stream_matches_file(data_path):
+    """A database read from a text stream gives the same games as the database read from its file."""
+
+    path = data_path("special_moves.pgn")
+    with open(path, encoding="utf-8") as file:
+        stream = io.StringIO(file.read())
+    from_file = [plot.metadata.white for plot in ChessPlot.from_database(pgn=path)]
+    from_stream = [plot.metadata.white for plot in ChessPlot.from_database(pgn=stream)]
+    assert from_stream == from_file == ["Castling White", "Passant White", "Promotion White"]
+
+
+def _game_summaries(games: Iterable[tuple]) -> list:
+    return [(metadata.white, metadata.black, metadata.result, moves) for metadata, moves in games]
+
+
+def _streamed_games(path: str) -> list:
+    return _game_summaries(games=_Parser.iter_games(file_path=path, end_states=_END_STATES))
+
+
+def _indexed_games(index: _GameIndex) -> list:
+    return _game_summaries(games=(index.read_game(game_number=game_number) for game_number in range(len(index))))
+
+
+def _database_text(data_path, file_names: List[str]) -> bytes:
+    texts = []
+    for file_name in file_names:
+        with open(data_path(file_name), "rb") as file:
+            texts.append(file.read().rstrip(b"\n") + b"\n\n")
+    return b"".join(texts)
+
+
+def test_index_reads_every_game(data_path, tmp_path):
+    """Every game read through the index is the same as the game read by streaming the database."""
+
+    path = tmp_path / "games.pgn"
+    path.write_bytes(_database_text(data_path=data_path, file_names=_DATABASE_FILES))
+    index = _GameIndex(pgn_path=str(path), end_states=_END_STATES)
+    assert len(index) == 8
+    assert _indexed_games(index=index) == _streamed_games(path=str(path))
+    assert index.entry(game_number=7).white == "Promotion White"
+    assert (tmp_path / "games.pgn.idx").exists()
+
+
+def test_appended_games_are_indexed(data_path, tmp_path, monkeypatch):
+    """Games appended to an indexed database are indexed by scanning only from the last game indexed before."""
+
+    path = tmp_path / "games.pgn"
+    path.write_bytes(_database_text(data_path=data_path, file_names=_DATABASE_FILES[:2]))
+    first_game_count = len(_GameIndex(pgn_path=str(path), end_states=_END_STATES))
+    with open(path, "ab") as file:
+        file.write(_database_text(data_path=data_path, file_names=_DATABASE_FILES[2:]))
+
+    scan_positions = []
+    scan = _GameIndex._scan
+
+    def record_scan(index, pgn_file, position, skipped_games):
+        scan_positions.append(position)
+        return scan(index, pgn_file=pgn_file, position=position, skipped_games=skipped_games)
+
+    monkeypatch.setattr(_GameIndex, "_scan", record_scan)
+    index = _GameIndex(pgn_path=str(path), end_states=_END_STATES)
+    assert len(scan_positions) == 1 and scan_positions[0] == index.entry(game_number=first_game_count - 1).offset
+    assert _indexed_games(index=index) == _streamed_games(path=str(path))
+
+
+def test_rewritten_database_is_reindexed(data_path, tmp_path):
+    """A database which is rewritten rather than appended to is indexed again from scratch."""
+
+    path = tmp_path / "games.pgn"
+    path.write_bytes(_database_text(data_path=data_path, file_names=_DATABASE_FILES))
+    _GameIndex(pgn_path=str(path), end_states=_END_STATES)
+    path.write_bytes(_database_text(data_path=data_path, file_names=_DATABASE_FILES[::-1]))
+    index = _GameIndex(pgn_path=str(path), end_states=_END_STATES)
+    assert index.entry(game_number=0).white == "Castling White"
+    assert _indexed_games(index=index) == _streamed_games(path=str(path))
@@ -0,0 +1,79 @@
+"""Tests for encoding the frames of a plot as a .gif"""
+
+import io
+import numpy as np
+import pytest
+from PIL import Image, ImageSequence
+from chessplot import ChessPlot
+from chessplot.gif import _theme_palette, _GifWriter, _PALETTE_SIZE
+from chessplot.settings import _Settings
+
+
+def _drawn_frames(plot: ChessPlot, settings: dict, duration: int) -> list:
+    """Draw the frames of a plot, merging each frame which is the same as the one before it into that frame.
+
+    The last frame is shown twice before the animation loops.
+    """
+
+    plot._update_plot_settings(**settings)
+    drawn = list(plot._iter_frames(cache_frames=False))
+    frames = []
+    for frame in drawn + drawn[-1:]:
+        if frames and frame.tobytes() == frames[-1][0].tobytes():
+            frames[-1][1] += duration
+        else:
+            frames.append([frame, duration])
+    return frames
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {"plot_size": 400, "end_frame": 12},
+        {"plot_size": 500, "end_frame": 8, "theme": "green", "flip_perspective": True}
+    ],
+    ids=["default", "green_flipped"]
+)
+def test_gif_decodes_to_drawn_frames(fonts, data_path, settings):
+    """Each frame of a .gif decodes to its drawn frame, with every pixel matched to a colour of the theme palette."""
+
+    plot = ChessPlot(pgn=data_path("fischer_spassky.pgn"))
+    gif = Image.open(io.BytesIO(plot.to_gif_bytes(duration=750, **settings)))
+    frames = _drawn_frames(plot=plot, settings=settings, duration=750)
+    palette = {tuple(colour) for colour in _theme_palette(theme=plot._settings.theme).tolist()}
+
+    assert gif.n_frames == len(frames)
+    assert gif.info["loop"] == 0
+    for decoded, (drawn, duration) in zip(ImageSequence.Iterator(gif), frames):
+        assert decoded.info["duration"] == duration
+        decoded = decoded.convert("RGB")
+        assert {colour for _, colour in decoded.getcolors(maxcolors=_PALETTE_SIZE)} <= palette
+        difference = np.abs(np.asarray(decoded, dtype=np.int32) - np.asarray(drawn, dtype=np.int32))
+        assert difference.max() <= 8  # the widest gap between neighbouring shades of a palette
+
+
+def test_only_changed_regions_are_stored():
+    """Each frame after the first stores only the region which changed, and a repeated frame extends the last."""
+
+    palette = _theme_palette(theme=_Settings().theme)
+    first = Image.new(mode="RGB", size=(60, 40), color="white")
+    second = first.copy()
+    second.paste(im=(0, 0, 0), box=(10, 5, 20, 15))
+    third = second.copy()
+    third.paste(im=(255, 255, 255), box=(12, 7, 14, 9))
+    third.paste(im=(0, 0, 0), box=(50, 30, 55, 38))
+
+    file = io.BytesIO()
+    writer = _GifWriter(file=file, duration=100, palette=palette)
+    for frame in (first, second, second, third):
+        writer.write(frame=frame)
+    writer.close()
+
+    gif = Image.open(io.BytesIO(file.getvalue()))
+    extents, durations = [], []
+    for index, decoded in enumerate(ImageSequence.Iterator(gif)):
+        extents.append(gif.dispose_extent)
+        durations.append(decoded.info["duration"])
+        assert decoded.convert("RGB").tobytes() == (first, second, third)[index].tobytes()
+    assert extents == [(0, 0, 60, 40), (10, 5, 20, 15), (12, 7, 55, 38)]
+    assert durations == [100, 200, 100]
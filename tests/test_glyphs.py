@@ -0,0 +1,44 @@
+"""Tests for reading and tracing the outlines of glyphs"""
+
+import io
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw, ImageFont
+from chessplot.glyphs import _load_outlines, _TracedFont
+from chessplot.pdf import _PdfWriter
+
+
+@pytest.mark.parametrize("character", ["♔", "♞", "K", "e", "4"])
+def test_font_without_truetype_outlines_is_traced(data_path, character):
+    """The rectangles traced from a glyph of a CFF font cover exactly the pixels of the rasterised glyph."""
+
+    outlines = _load_outlines(path=data_path("pieces_cff.otf"))
+    assert isinstance(outlines, _TracedFont)
+    font = ImageFont.truetype(font=data_path("pieces_cff.otf"), size=outlines.units_per_em)
+    left, top, right, bottom = font.getbbox(text=character, anchor="ls")
+    image = Image.new(mode="L", size=(right - left, bottom - top))
+    ImageDraw.Draw(im=image).text(xy=(-left, -top), text=character, font=font, fill=255, anchor="ls")
+    expected = np.asarray(image) >= 128
+
+    traced = np.zeros(shape=expected.shape, dtype=bool)
+    commands = outlines.outline(glyph_id=outlines.glyph_id(character=character))
+    for index in range(0, len(commands), 5):  # each rectangle is a move, three lines and a close
+        (_, x0, y0), (_, x1, y1) = commands[index], commands[index + 2]
+        traced[-y0 - top:-y1 - top, x0 - left:x1 - left] = True
+    assert traced.any()
+    assert np.array_equal(traced, expected), character
+
+
+def test_pdf_shows_glyphs_of_font_without_truetype_outlines(data_path):
+    """Text and pieces in a CFF font are embedded in a .pdf as Type 3 fonts, in the same way as a TrueType font."""
+
+    font = ImageFont.truetype(font=data_path("pieces_cff.otf"), size=40)
+    file = io.BytesIO()
+    writer = _PdfWriter(file=file, resolution=72)
+    canvas = writer.canvas(size=(200, 100))
+    canvas.draw_text(text="Ke4", font=font, xy=(10, 10))
+    canvas.draw_piece(text="♔", font=font, xy=(150, 50), stroke_width=3)
+    writer.add_page(canvas=canvas)
+    writer.close()
+    document = file.getvalue()
+    assert document.count(b"/Subtype /Type3") == 2
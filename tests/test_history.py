@@ -0,0 +1,31 @@
+"""Tests for storing and seeking the board history of a game"""
+
+import pytest
+from chessplot import ChessPlot
+from chessplot.history import _History
+
+
+def _full_replay(path: str) -> list:
+    boards = []
+    for plot in ChessPlot.from_database(pgn=path):
+        boards.extend(plot._replay)  # every board snapshot as the interpreter makes it, one game after another
+    return boards
+
+
+@pytest.mark.parametrize("checkpoint_interval", [1, 5, 16, 1000])
+@pytest.mark.parametrize("file_name", ["fischer_spassky.pgn", "special_moves.pgn"])
+def test_boards_match_full_replay(data_path, file_name, checkpoint_interval):
+    """Any board rebuilt from a checkpoint and its deltas is the same as the board made by replaying the game."""
+
+    boards = _full_replay(path=data_path(file_name))
+    history = _History(checkpoint_interval=checkpoint_interval)
+    for ply_string, board in boards:
+        history.append(ply_string=ply_string, board=board)
+
+    assert len(history) == len(boards)
+    for ply in reversed(range(len(boards))):  # seek backwards so no board is rebuilt from the one before it
+        assert (history.ply_string_at(ply=ply), history.board_at(ply=ply)) == boards[ply]
+    assert list(history.iter_boards()) == boards
+    assert list(history.iter_boards(start=7, end=30)) == boards[7:30]
+    with pytest.raises(IndexError):
+        history.board_at(ply=len(boards))
@@ -0,0 +1,87 @@
+"""Tests for replaying games with the array and bitboard engines"""
+
+import pickle
+import pytest
+from chessplot import ChessPlot
+from chessplot.interpreter import InterpreterError
+from chessplot.parser import _Metadata
+from chessplot.piece import _Piece
+from chessplot.ply import _Ply
+from chessplot.position import _Position
+
+
+def _replay(plot: ChessPlot) -> list:
+    plot._replay_to(ply=10 ** 6)
+    return list(plot._history.iter_boards())
+
+
+def _square(name: str) -> int:
+    position = _Position.from_name(name=name)
+    return position.row * 8 + position.col
+
+
+@pytest.mark.parametrize(
+    "file_name", ["fischer_spassky.pgn", "annotated.pgn", "special_moves.pgn", "disambiguation.pgn"]
+)
+def test_engines_replay_identical_boards(data_path, file_name):
+    """Both engines give the same ply strings and boards for every game."""
+
+    array_games = [_replay(plot=plot) for plot in ChessPlot.from_database(pgn=data_path(file_name), engine="array")]
+    bitboard_games = [
+        _replay(plot=plot) for plot in ChessPlot.from_database(pgn=data_path(file_name), engine="bitboard")
+    ]
+    assert array_games == bitboard_games
+
+
+@pytest.mark.parametrize("engine", ["array", "bitboard"])
+def test_disambiguation_by_square_rank_and_file(data_path, engine):
+    """Moves are resolved using the square, rank or file of the piece when several pieces could make them."""
+
+    boards = _replay(plot=ChessPlot(pgn=data_path("disambiguation.pgn"), engine=engine))
+    assert [ply_string for ply_string, _ in boards[1::2]] == ["1. Qh4e1", "2. Q1e2", "3. Qhe1"]
+    final_board = boards[-1][1]
+    assert [square for square, code in enumerate(final_board) if code == ord("Q")] == sorted(
+        _square(name=name) for name in ("e1", "e2", "e4")
+    )
+
+
+def test_bitboard_ignores_pinned_pieces(data_path):
+    """A move needs no disambiguation from a piece which is pinned to its king."""
+
+    boards = _replay(plot=ChessPlot(pgn=data_path("pinned.pgn"), engine="bitboard"))
+    ply_string, board = boards[7]
+    assert ply_string == "4. Ne2"
+    assert board[_square(name="e2")] == ord("N")
+    assert board[_square(name="c3")] == ord("N")
+
+
+@pytest.mark.parametrize("engine", ["array", "bitboard"])
+@pytest.mark.parametrize("pgn_text", ["1. e4 e5 2. Ke3 *", "1. Nd2 *"], ids=["unreachable", "own_piece"])
+def test_illegal_move_raises(engine, pgn_text):
+    """A move which no piece can make raises an InterpreterError."""
+
+    plot = ChessPlot.from_text(pgn_text=pgn_text, engine=engine)
+    with pytest.raises(InterpreterError):
+        _replay(plot=plot)
+
+
+def test_positions_are_interned():
+    """Each square has a single shared position, and every square off the board shares a sentinel."""
+
+    assert _Position(row=3, col=4) is _Position(row=3, col=4)
+    assert _Position.from_name(name="e4") is _Position(row=3, col=3)
+    assert _Position(row=8, col=0) is _Position(row=-1, col=9)
+    assert not _Position(row=8, col=0).is_legal
+    assert pickle.loads(pickle.dumps(_Position(row=2, col=5))) is _Position(row=2, col=5)
+    assert len({_Position(row=square // 8, col=square % 8) for square in range(64)}) == 64
+
+
+@pytest.mark.parametrize(
+    "value",
+    [_Position(row=0, col=0), _Piece(name="N", row=0, col=1), _Ply(ply_string="Nf3"), _Metadata()],
+    ids=["position", "piece", "ply", "metadata"]
+)
+def test_value_classes_use_slots(value):
+    """The classes created for every square, piece and ply have no instance dictionary."""
+
+    assert not hasattr(value, "__dict__")
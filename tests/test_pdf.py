@@ -0,0 +1,81 @@
+"""Tests for drawing the frames of a plot as a vector .pdf"""
+
+import re
+import zlib
+from collections import Counter
+from chessplot import ChessPlot
+from chessplot.piece import _Piece, _EMPTY_SQUARE
+
+
+def _read_objects(document: bytes) -> dict:
+    """Read the dictionary and inflated stream of every object, finding each through the cross-reference table."""
+
+    xref = int(document[document.rindex(b"startxref") + len(b"startxref"):].split()[0])
+    lines = document[xref:].split(b"\n")
+    assert lines[0] == b"xref"
+    objects = {}
+    for number in range(1, int(lines[1].split()[1])):
+        offset = int(lines[2 + number].split()[0])
+        header = f"{number} 0 obj\n".encode("ascii")
+        assert document[offset:offset + len(header)] == header
+        dictionary, rest = document[offset + len(header):].split(b"\n", 1)
+        stream = None
+        if rest.startswith(b"stream\n"):
+            length = int(re.search(rb"/Length (\d+)", dictionary).group(1))
+            stream = zlib.decompress(rest[len(b"stream\n"):len(b"stream\n") + length])
+        objects[number] = (dictionary.decode("latin-1"), stream)
+    return objects
+
+
+def _reference(dictionary: str, key: str) -> int:
+    return int(re.search(rf"/{key} (\d+) 0 R", dictionary).group(1))
+
+
+def _shown_text(objects: dict, page: str, content: bytes) -> list:
+    """Decode the text shown by each text operator of a page, through the ToUnicode map of its font."""
+
+    fonts = dict(re.findall(r"/(F\d+) (\d+) 0 R", page))
+    texts = []
+    for font_name, codes in re.findall(r"/(F\d+) [\d.]+ Tf\n<([0-9a-f]*)> Tj", content.decode("latin-1")):
+        unicode_map = objects[_reference(dictionary=objects[int(fonts[font_name])][0], key="ToUnicode")][1]
+        characters = {
+            int(code, 16): chr(int(character, 16))
+            for code, character in re.findall(rb"<([0-9a-f]{2})> <([0-9a-f]{4,})>", unicode_map)
+        }
+        texts.append("".join(characters[int(codes[i:i + 2], 16)] for i in range(0, len(codes), 2)))
+    return texts
+
+
+def test_pdf_pages_show_each_board(fonts, data_path):
+    """Each page of a .pdf draws the shared board and header, the move text and exactly the pieces of its board."""
+
+    plot = ChessPlot(pgn=data_path("fischer_spassky.pgn"))
+    settings = {"plot_size": 400, "end_frame": 8}
+    objects = _read_objects(document=plot.to_pdf_bytes(**settings))
+    boards = list(plot._history.iter_boards(end=9))
+
+    catalog = objects[1][0]
+    page_tree = objects[_reference(dictionary=catalog, key="Pages")][0]
+    page_numbers = [int(number) for number in re.findall(r"(\d+) 0 R", page_tree)]
+    assert f"/Count {len(boards)}" in page_tree and len(page_numbers) == len(boards)
+
+    piece_names = {_Piece.get_unicode(name=name): name for name in "KQRBNPkqrbnp"}
+    forms = set()
+    for page_number, (ply_string, board) in zip(page_numbers, boards):
+        page = objects[page_number][0]
+        content = objects[_reference(dictionary=page, key="Contents")][1]
+        forms.update(re.findall(r"/(X\d+) Do", content.decode("latin-1")))
+        texts = _shown_text(objects=objects, page=page, content=content)
+        pieces = Counter(piece_names[text] for text in texts if text in piece_names)
+        assert pieces == Counter(chr(code) for code in board if code != _EMPTY_SQUARE), ply_string
+        assert [text for text in texts if text not in piece_names] == ([ply_string] if ply_string else [])
+
+    assert len(forms) == 1  # every page draws the same background form
+    form_number = int(re.search(rf"/{forms.pop()} (\d+) 0 R", objects[page_numbers[0]][0]).group(1))
+    form, form_content = objects[form_number]
+    header = _shown_text(objects=objects, page=form, content=form_content)
+    assert header == [
+        "Fischer, Robert J. - Spassky, Boris V.",
+        "Belgrade, Serbia JUG, Wednesday 04 November 1992",
+        "1/2-1/2",
+    ] + list("87654321abcdefgh")
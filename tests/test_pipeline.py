@@ -0,0 +1,49 @@
+"""Tests for overlapping the drawing and encoding of frames"""
+
+import threading
+import pytest
+from chessplot.pipeline import _run_pipeline
+
+
+def _numbers(count: int, drawn: list, fail_at: int = None):
+    for number in range(count):
+        if number == fail_at:
+            raise RuntimeError("drawing failed")
+        drawn.append(number)
+        yield number
+
+
+def test_frames_are_encoded_in_order():
+    """Every frame reaches the encoder in the order it was drawn, and the timings count them."""
+
+    drawn, encoded = [], []
+    timings = _run_pipeline(frames=_numbers(count=50, drawn=drawn), encode=encoded.extend, max_queued=2)
+    assert encoded == drawn == list(range(50))
+    assert timings.frames == 50
+    assert timings.total >= timings.encode >= 0
+
+
+def test_drawing_error_is_raised_in_encoder():
+    """An exception raised while drawing is raised again from the encoder, after the frames drawn before it."""
+
+    encoded = []
+    with pytest.raises(RuntimeError, match="drawing failed"):
+        _run_pipeline(frames=_numbers(count=50, drawn=[], fail_at=10), encode=encoded.extend, max_queued=2)
+    assert encoded == list(range(10))
+
+
+def test_encoder_error_stops_drawing():
+    """Drawing stops soon after the encoder raises an exception, and the background thread is finished."""
+
+    drawn = []
+    threads = threading.active_count()
+
+    def encode(frames):
+        for number in frames:
+            if number == 5:
+                raise ValueError("encoding failed")
+
+    with pytest.raises(ValueError, match="encoding failed"):
+        _run_pipeline(frames=_numbers(count=1000, drawn=drawn), encode=encode, max_queued=2)
+    assert len(drawn) <= 5 + 2 + 2  # the frames encoded, queued and being drawn
+    assert threading.active_count() == threads
@@ -0,0 +1,114 @@
+"""Tests for drawing the frames of a plot"""
+
+import io
+import itertools
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+from chessplot import ChessPlot
+from chessplot.piece import _Piece
+from chessplot.renderer import _draw_piece_sprites, _scale_font, _PIECE_NAMES
+
+
+_SETTINGS = [
+    {"plot_size": 400},
+    {"plot_size": 600, "flip_perspective": True, "theme": "green"},
+    {"plot_size": 500, "display_header": False},
+    {"plot_size": 400, "display_notation": False},
+]
+_SETTINGS_IDS = ["default", "flipped", "no_header", "no_notation"]
+_GAMES = [
+    ("fischer_spassky.pgn", 0),
+    ("annotated.pgn", 0),
+    ("annotated.pgn", 3),
+    ("special_moves.pgn", 0),
+    ("special_moves.pgn", 1),
+    ("special_moves.pgn", 2),
+]
+_GAME_IDS = ["fischer_spassky", "annotated", "english_castling", "castling", "en_passant", "promotion"]
+
+
+def _game(path: str, game_number: int) -> ChessPlot:
+    return next(itertools.islice(ChessPlot.from_database(pgn=path), game_number, None))
+
+
+def _frames(plot: ChessPlot, settings: dict) -> tuple:
+    plot._update_plot_settings(**settings)
+    start_frame, end_frame = plot._replay_frame_window()
+    return plot._create_renderer(), list(plot._history.iter_boards(start=start_frame, end=end_frame + 1))
+
+
+@pytest.mark.parametrize("game", _GAMES, ids=_GAME_IDS)
+@pytest.mark.parametrize("settings", _SETTINGS, ids=_SETTINGS_IDS)
+def test_incremental_frames_match_full_frames(fonts, data_path, settings, game):
+    """Redrawing only the squares which changed gives the same pixels as drawing each frame in full."""
+
+    file_name, game_number = game
+    renderer, boards = _frames(plot=_game(path=data_path(file_name), game_number=game_number), settings=settings)
+    incremental_frames = renderer.draw_range(boards=boards)
+    assert len(incremental_frames) == len(boards)
+    for (ply_string, board), incremental_frame in zip(boards, incremental_frames):
+        full_frame = renderer.draw(board=board, ply_string=ply_string)
+        assert incremental_frame.tobytes() == full_frame.tobytes(), ply_string
+
+
+@pytest.mark.parametrize("game", _GAMES, ids=_GAME_IDS)
+@pytest.mark.parametrize("settings", _SETTINGS, ids=_SETTINGS_IDS)
+def test_array_frames_match_image_frames(fonts, data_path, settings, game):
+    """Compositing frames into an array gives the same pixels as drawing them as images."""
+
+    file_name, game_number = game
+    plot = _game(path=data_path(file_name), game_number=game_number)
+    renderer, boards = _frames(plot=plot, settings=settings)
+    frames = plot.to_array(**settings)
+    assert frames.shape[0] == len(boards)
+    for (ply_string, board), frame in zip(boards, frames):
+        assert np.array_equal(frame, np.asarray(renderer.draw(board=board, ply_string=ply_string))), ply_string
+
+
+def test_png_frames_match_incremental_frames(fonts, data_path):
+    """A single frame saved as a .png is the same as the frame reached by drawing the game incrementally."""
+
+    plot = ChessPlot(pgn=data_path("fischer_spassky.pgn"), frame_cache_bytes=0)
+    renderer, boards = _frames(plot=plot, settings={"plot_size": 400})
+    frames = renderer.draw_range(boards=boards)
+    for frame in (0, 1, 40, len(boards) - 1):
+        png = Image.open(io.BytesIO(plot.to_png_bytes(frame=frame, plot_size=400)))
+        assert png.convert("RGB").tobytes() == frames[frame].tobytes()
+
+
+@pytest.mark.parametrize("square_width", [40, 60, 100])
+def test_sprites_match_text_drawing(fonts, square_width):
+    """Pasting a piece sprite gives the same pixels as drawing the piece as text with a white outline."""
+
+    font = _scale_font(text="♔", font_name="seguisym.ttf", max_width=square_width, max_height=square_width)
+    sprites = _draw_piece_sprites(square_width=square_width, font_name="seguisym.ttf")
+    centre = (square_width * 1.5, square_width * 1.5)
+    for name in _PIECE_NAMES:
+        expected = Image.new(mode="RGB", size=(square_width * 3, square_width * 3), color="#276996")
+        draw = ImageDraw.Draw(im=expected)
+        text = _Piece.get_unicode(name=name)
+        draw.text(xy=centre, text=text, anchor="mm", font=font, fill="white", stroke_width=3)
+        draw.text(xy=centre, text=text, anchor="mm", font=font, fill="black")
+
+        actual = Image.new(mode="RGB", size=expected.size, color="#276996")
+        sprite = sprites[ord(name)]
+        box = (
+            square_width + sprite.offset[0],
+            square_width + sprite.offset[1],
+            square_width + sprite.offset[0] + sprite.outline.size[0],
+            square_width + sprite.offset[1] + sprite.outline.size[1]
+        )
+        actual.paste(im=(255, 255, 255), box=box, mask=sprite.outline)
+        actual.paste(im=(255, 255, 255), box=box, mask=sprite.glyph)
+        actual.paste(im=(0, 0, 0), box=box, mask=sprite.glyph)
+        assert actual.tobytes() == expected.tobytes(), name
+
+
+def test_parallel_gif_matches_serial_gif(fonts, data_path):
+    """Drawing the frames of a .gif in several processes gives the same file as drawing them in one."""
+
+    settings = {"plot_size": 400, "end_frame": 30}
+    serial = ChessPlot(pgn=data_path("fischer_spassky.pgn")).to_gif_bytes(workers=1, **settings)
+    parallel = ChessPlot(pgn=data_path("fischer_spassky.pgn")).to_gif_bytes(workers=2, **settings)
+    assert parallel == serial
@@ -0,0 +1,40 @@
+"""Tests for drawing the frames of a plot as .svg documents"""
+
+import pytest
+from xml.etree import ElementTree
+from chessplot import ChessPlot
+from chessplot.piece import _EMPTY_SQUARE
+
+
+_SVG = "{http://www.w3.org/2000/svg}"
+_HREF = "{http://www.w3.org/1999/xlink}href"
+
+
+@pytest.mark.parametrize("flip_perspective", [False, True], ids=["white", "black"])
+def test_svg_documents_show_each_board(fonts, data_path, flip_perspective):
+    """Each .svg document parses, and places the move text and exactly the pieces of its board on their squares."""
+
+    plot = ChessPlot(pgn=data_path("special_moves.pgn"))
+    plot._update_plot_settings(plot_size=400, flip_perspective=flip_perspective)
+    documents = list(plot._iter_svg_frames())
+    boards = list(plot._history.iter_boards())
+    assert len(documents) == len(boards)
+
+    square_width = plot._settings.square_width
+    header_height = int(plot._settings.plot_size * 0.15)
+    for document, (ply_string, board) in zip(documents, boards):
+        root = ElementTree.fromstring(document)
+        defined = {path.get("id") for path in root.iter(f"{_SVG}path")}
+        placed = set()
+        for use in root.iter(f"{_SVG}use"):
+            assert use.get(_HREF)[1:] in defined
+            col = (float(use.get("x")) - square_width * 1.5) / square_width
+            row = (float(use.get("y")) - square_width * 1.5 - header_height) / square_width
+            placed.add((use.get(_HREF)[len("#piece-"):], row, col))
+
+        squares = board if flip_perspective else board[::-1]  # squares from the top left of the board
+        assert placed == {
+            (chr(code), square // 8, square % 8) for square, code in enumerate(squares) if code != _EMPTY_SQUARE
+        }, ply_string
+        move_texts = [text.text for text in root.iter(f"{_SVG}text") if text.get("clip-path") == "url(#move-text)"]
+        assert move_texts == [ply_string or None]  # an empty element before the first move
@@ -0,0 +1,126 @@
+"""Tests for tokenizing and parsing PGN text"""
+
+import re
+import pytest
+from chessplot.parser import _Parser
+from chessplot.ply import UnrecognisedPlyError
+from chessplot.tokenizer import _Tokenizer
+
+
+_END_STATES = ["1-0", "0-1", "1/2-1/2", "*"]
+_LINES = [
+    '[White "A"]\n',
+    "1. e4 {best} e5 $1 (1... c5 2.Nf3) 2.Nf3 ; rest\n",
+    "2...Nc6 {multi\n",
+    "line} 1/2-1/2\n"
+]
+
+
+def test_tokens_are_typed():
+    """Every tag, move number, SAN, annotation and result is emitted with its type."""
+
+    tokens = list(_Tokenizer(end_states=_END_STATES).tokenize(lines=_LINES))
+    assert tokens == [
+        (_Tokenizer.TAG, 'White "A"'),
+        (_Tokenizer.MOVE_NUMBER, "1."),
+        (_Tokenizer.SAN, "e4"),
+        (_Tokenizer.COMMENT, "{best}"),
+        (_Tokenizer.SAN, "e5"),
+        (_Tokenizer.NAG, "$1"),
+        (_Tokenizer.VARIATION_START, "("),
+        (_Tokenizer.MOVE_NUMBER, "1..."),
+        (_Tokenizer.SAN, "c5"),
+        (_Tokenizer.MOVE_NUMBER, "2."),
+        (_Tokenizer.SAN, "Nf3"),
+        (_Tokenizer.VARIATION_END, ")"),
+        (_Tokenizer.MOVE_NUMBER, "2."),
+        (_Tokenizer.SAN, "Nf3"),
+        (_Tokenizer.COMMENT, "; rest"),
+        (_Tokenizer.MOVE_NUMBER, "2..."),
+        (_Tokenizer.SAN, "Nc6"),
+        (_Tokenizer.COMMENT, "{multi\nline}"),
+        (_Tokenizer.RESULT, "1/2-1/2"),
+    ]
+
+
+def test_annotations_are_skipped():
+    """Comments, NAGs and variations are consumed without being emitted when skipping annotations."""
+
+    tokens = list(_Tokenizer(end_states=_END_STATES, skip_annotations=True).tokenize(lines=_LINES))
+    assert [text for _, text in tokens] == ['White "A"', "1.", "e4", "e5", "2.", "Nf3", "2...", "Nc6", "1/2-1/2"]
+
+
+def test_nested_variations_are_skipped():
+    """Variations within variations, and brackets within comments, don't end the variation being skipped."""
+
+    lines = ["1. e4 (1. d4 (1. c4 {)} c5) d5\n", "(1... Nf6)) e5 *\n"]
+    tokens = list(_Tokenizer(end_states=_END_STATES, skip_annotations=True).tokenize(lines=lines))
+    assert [text for _, text in tokens] == ["1.", "e4", "e5", "*"]
+
+
+@pytest.mark.parametrize(
+    "word, tokens",
+    [
+        ("e4", [(_Tokenizer.SAN, "e4")]),
+        ("12.", [(_Tokenizer.MOVE_NUMBER, "12.")]),
+        ("12...", [(_Tokenizer.MOVE_NUMBER, "12...")]),
+        ("4.Ba4", [(_Tokenizer.MOVE_NUMBER, "4."), (_Tokenizer.SAN, "Ba4")]),
+        ("4...Nf6", [(_Tokenizer.MOVE_NUMBER, "4..."), (_Tokenizer.SAN, "Nf6")]),
+        ("1-0", [(_Tokenizer.RESULT, "1-0")]),
+        ("1/2-1/2", [(_Tokenizer.RESULT, "1/2-1/2")]),
+        ("*", [(_Tokenizer.RESULT, "*")]),
+    ]
+)
+def test_words_are_split(word, tokens):
+    """Move numbers joined to a SAN are split from it, and results are told apart from move numbers."""
+
+    assert list(_Tokenizer(end_states=_END_STATES).tokenize(lines=[word])) == tokens
+
+
+def test_annotated_game_parses_as_plain_game(data_path):
+    """A game parses to the same moves with and without its annotations."""
+
+    with open(data_path("annotated.pgn"), encoding="utf-8") as file:
+        annotated_text = file.read().split("\n\n[Event", 1)[0]
+    movetext = annotated_text.split("\n\n", 1)[1]
+    plain_text = re.sub(r"\{[^}]*}|;[^\n]*|\$\d+", " ", movetext)
+    while "(" in plain_text:
+        plain_text = re.sub(r"\([^()]*\)", " ", plain_text)
+
+    _, annotated_moves = _Parser.parse_text(pgn_text=annotated_text, end_states=_END_STATES)
+    _, plain_moves = _Parser.parse_text(pgn_text=plain_text, end_states=_END_STATES)
+    assert annotated_moves == plain_moves
+    assert len(annotated_moves) == 20
+
+
+
+@pytest.mark.parametrize(
+    "ply_string, fields",
+    [
+        ("e4", {"piece_rank": "P", "new_position": "e4", "is_capture": False}),
+        ("Nbd7", {"piece_rank": "N", "piece_col": "b", "new_position": "d7"}),
+        ("R1xa3+", {"piece_rank": "R", "piece_row": "1", "new_position": "a3", "is_capture": True}),
+        ("Qh4xe1", {"piece_rank": "Q", "piece_col": "h", "piece_row": "4", "new_position": "e1", "is_capture": True}),
+        ("exd8=N#", {"piece_rank": "P", "piece_col": "e", "promoted_piece_rank": "N", "is_capture": True}),
+        ("O-O", {"castle_king_side": True, "castle_queen_side": False}),
+        ("O-O-O", {"castle_king_side": False, "castle_queen_side": True}),
+    ]
+)
+def test_ply_strings_are_parsed(ply_string, fields):
+    """Each part of a ply string is parsed into the fields of its ply."""
+
+    ply = _Parser.parse_ply_string(ply_string=ply_string)
+    for name, value in fields.items():
+        parsed = getattr(ply, name)
+        assert (parsed.name if name == "new_position" else parsed) == value, name
+
+
+def test_parsed_ply_are_shared():
+    """A repeated ply string gives the same ply object, and an unrecognised one raises an UnrecognisedPlyError."""
+
+    _Parser.clear_ply_cache()
+    ply = _Parser.parse_ply_string(ply_string="Nf3")
+    assert _Parser.parse_ply_string(ply_string="Nf3") is ply
+    assert _Parser.ply_cache_info().hits == 1
+    with pytest.raises(UnrecognisedPlyError):
+        _Parser.parse_ply_string(ply_string="Nz9")